@@ -5,6 +5,8 @@ from pathlib import Path
 
 import ssl
 
+from corsheaders.defaults import default_headers
+
 ROOT_DIR = environ.Path(__file__) - 3
 APPS_DIR = ROOT_DIR.path("dpms")
 env = environ.Env()
@@ -71,6 +73,17 @@ DATABASES = {
 DATABASES["default"]["ATOMIC_REQUESTS"] = True  # NOQA
 DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)  # NOQA
 
+# Cache
+# DJANGO_CACHE_URL selects the backend, which must be shared by every worker
+# for the throttles and cached state to be consistent:
+#   locmemcache://                  per process (development)
+#   filecache:///tmp/dpms-cache     every worker of a host
+#   rediscache://redis:6379/1       every host (needs the redis package)
+# filecache uses dpms' FileBasedCache, whose add() and incr() are atomic
+# across processes.
+environ.Env.CACHE_SCHEMES["filecache"] = "dpms.utils.cache.FileBasedCache"
+CACHES = {"default": env.cache_url("DJANGO_CACHE_URL", default="locmemcache://")}
+
 
 # URLs
 ROOT_URLCONF = "config.urls"
@@ -170,6 +183,9 @@ CORS_ALLOWED_ORIGINS = [
     "https://dpms.capacitorparty.com",
     "https://dpms.freemem.space",
 ]
+# The StageRunner watch endpoint is long-polled with If-None-Match; chunks of
+# resumable uploads carry their offset and checksum
+CORS_ALLOW_HEADERS = (*default_headers, "if-none-match", "upload-offset", "upload-checksum")
 # Static files
 # STATIC_ROOT = str(ROOT_DIR("staticfiles"))
 STATIC_ROOT = BASE_DIR / "../staticfiles/static"
@@ -187,11 +203,24 @@ STATICFILES_FINDERS = [
 MEDIA_ROOT = BASE_DIR / "../staticfiles/media"
 
 MEDIA_URL = "/media/"
+# Internal nginx location aliasing MEDIA_ROOT (e.g. "/protected-media/"):
+# permission-checked downloads are handed to nginx with X-Accel-Redirect.
+# Empty: Django streams them itself.
+MEDIA_ACCEL_REDIRECT = env("MEDIA_ACCEL_REDIRECT", default="")
 
 # File uploads - allow large video files (up to 500MB)
 DATA_UPLOAD_MAX_MEMORY_SIZE = 104857600  # 100MB (matches file upload limit)
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760   # 10MB (files larger than this use temp disk)
 
+# Resumable uploads (/api/uploads/) are assembled here, on the media volume
+# so finishing one is a rename, but outside MEDIA_ROOT so nginx never serves
+# partial files
+UPLOAD_SESSIONS_ROOT = BASE_DIR / "../staticfiles/uploads"
+# Largest chunk accepted (below nginx's client_max_body_size)
+UPLOAD_CHUNK_MAX_SIZE = env.int("UPLOAD_CHUNK_MAX_SIZE", default=16 * 1024 * 1024)
+# Hours an upload may go without a chunk before purge_upload_sessions deletes it
+UPLOAD_SESSION_EXPIRY_HOURS = env.int("UPLOAD_SESSION_EXPIRY_HOURS", default=24)
+
 # Templates
 TEMPLATES = [
     {
@@ -244,18 +273,37 @@ MANAGERS = ADMINS
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'dpms.users.authentication.JWTAuthentication',
+        'dpms.users.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
+    'DEFAULT_PAGINATION_CLASS': 'dpms.utils.pagination.CreatedCursorPagination',
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'dpms.utils.throttling.AnonRateThrottle',
+        'dpms.utils.throttling.UserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '30/minute',
         'user': '120/minute',
     },
 }
+
+# StageRunner
+# Concurrent ffmpeg conversions of each run_transcode_worker
+TRANSCODE_PROCESSES = env.int("TRANSCODE_PROCESSES", default=1)
+# Long-polls of /api/stage-control/watch/ each gunicorn worker holds at once;
+# every one takes a thread, so keep it well below the worker's threads
+STAGE_CONTROL_MAX_WATCHERS = env.int("STAGE_CONTROL_MAX_WATCHERS", default=4)
+
+# Voting
+# Seconds a voter's eligibility context is cached (0 disables the cache)
+VOTER_CONTEXT_CACHE_TIMEOUT = env.int("VOTER_CONTEXT_CACHE_TIMEOUT", default=30)
+
+# Users
+# Seconds a user's group names are cached (0 disables the cache)
+USER_GROUPS_CACHE_TIMEOUT = env.int("USER_GROUPS_CACHE_TIMEOUT", default=300)
+# Seconds a resolved API token (user, profile and groups) is cached (0 disables the cache)
+AUTH_TOKEN_CACHE_TIMEOUT = env.int("AUTH_TOKEN_CACHE_TIMEOUT", default=60)
@@ -23,14 +23,6 @@ CORS_ALLOWED_ORIGINS += [
     "http://192.168.1.74:3000",
 ]
 
-# Cache
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "",
-    }
-}
-
 # Templates
 TEMPLATES[0]["OPTIONS"]["debug"] = DEBUG  # NOQA
 
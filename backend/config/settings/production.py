@@ -38,6 +38,17 @@ ALLOWED_HOSTS = env.list(
 # DATABASES["default"]["ATOMIC_REQUESTS"] = True  # NOQA
 # DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)  # NOQA
 
+# Cache
+# Shared by the gunicorn workers of the container (see DJANGO_CACHE_URL in base).
+# Room for the tokens, group names and throttle counters of every attendee:
+# past max_entries (Django's default is 300) writes cull the cache, checked
+# on a sample of writes only (see dpms.utils.cache.FileBasedCache).
+CACHES = {
+    "default": env.cache_url(
+        "DJANGO_CACHE_URL", default="filecache:///tmp/dpms-cache?max_entries=50000"
+    )
+}
+
 # Security
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 SECURE_SSL_REDIRECT = env.bool("DJANGO_SECURE_SSL_REDIRECT", default=True)
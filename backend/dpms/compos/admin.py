@@ -5,12 +5,14 @@ from django.utils.html import format_html
 from django.urls import reverse
 from django.db.models import Count
 from modeltranslation.admin import TranslationAdmin
+from .blobs import recount as recount_blobs
 from .models import (
     Attendance,
     Edition,
     Compo,
     HasCompo,
     Production,
+    Blob,
     File,
     GalleryImage,
     Sponsor,
@@ -26,6 +28,8 @@ from .models import (
     StageControl,
     StagePresentation,
     PresentationSlide,
+    TranscodeJob,
+    UploadSession,
 )
 
 
@@ -757,6 +761,7 @@ class FileAdmin(admin.ModelAdmin):
 
     readonly_fields = (
         "original_filename",
+        "blob",
         "created",
         "modified",
         "file_size",
@@ -769,7 +774,7 @@ class FileAdmin(admin.ModelAdmin):
             "fields": ("title", "description", "uploaded_by")
         }),
         ("File Information", {
-            "fields": ("file", "original_filename", "file_size", "file_path")
+            "fields": ("file", "original_filename", "blob", "file_size", "file_path")
         }),
         ("Status", {
             "fields": ("public", "is_active", "is_deleted")
@@ -909,16 +914,49 @@ class FileAdmin(admin.ModelAdmin):
 
     def mark_deleted(self, request, queryset):
         """Mark selected files as deleted"""
+        blob_ids = list(queryset.exclude(blob=None).values_list("blob", flat=True))
         updated = queryset.update(is_deleted=True)
+        recount_blobs(blob_ids)
         self.message_user(request, f"{updated} files are marked as deleted.")
     mark_deleted.short_description = "Mark as deleted"
 
     def unmark_deleted(self, request, queryset):
         """Unmark selected files as deleted"""
+        blob_ids = list(queryset.exclude(blob=None).values_list("blob", flat=True))
         updated = queryset.update(is_deleted=False)
+        recount_blobs(blob_ids)
         self.message_user(request, f"{updated} files are unmarked as deleted.")
     unmark_deleted.short_description = "Unmark as deleted"
 
+    def save_model(self, request, obj, form, change):
+        """Keep the reference count of the content when is_deleted changes"""
+        super().save_model(request, obj, form, change)
+        if obj.blob_id:
+            recount_blobs([obj.blob_id])
+
+    def delete_queryset(self, request, queryset):
+        """Bulk delete: the contents stay until collect_file_blobs"""
+        blob_ids = list(queryset.exclude(blob=None).values_list("blob", flat=True))
+        legacy = [f for f in queryset.filter(blob=None) if f.file]
+        super().delete_queryset(request, queryset)
+        for f in legacy:
+            f.file.storage.delete(f.file.name)
+        recount_blobs(blob_ids)
+
+
+@admin.register(Blob)
+class BlobAdmin(admin.ModelAdmin):
+    """Blob model admin (contents shared by files)"""
+
+    list_display = ("id", "sha256", "name", "size", "ref_count", "created")
+
+    search_fields = ("sha256", "name")
+
+    readonly_fields = ("sha256", "name", "size", "ref_count", "created", "modified")
+
+    def has_add_permission(self, request):
+        return False
+
 
 # ============================================================================
 # VOTING SYSTEM ADMIN
@@ -1717,10 +1755,11 @@ class GalleryImageAdmin(admin.ModelAdmin):
 
     def thumbnail_preview(self, obj):
         """Display thumbnail"""
-        if obj.image:
+        preview = obj.thumbnail or obj.image
+        if preview:
             return format_html(
                 '<img src="{}" style="max-height: 50px; max-width: 80px; object-fit: cover; border-radius: 4px;"/>',
-                obj.image.url
+                preview.url
             )
         return "-"
     thumbnail_preview.short_description = "Preview"
@@ -2126,12 +2165,12 @@ class SlideElementAdmin(admin.ModelAdmin):
 
     list_filter = ("element_type", "is_visible", "enter_transition", "slide__config__edition")
 
-    readonly_fields = ("created", "modified", "image_preview")
+    readonly_fields = ("created", "modified", "image_preview", "transcode_job")
 
     fieldsets = (
         ("Basic", {"fields": ("slide", "element_type", "name")}),
         ("Position & Size", {"fields": ("x", "y", "width", "height", "rotation", "z_index")}),
-        ("Content", {"fields": ("content", "image", "image_preview", "video")}),
+        ("Content", {"fields": ("content", "image", "image_preview", "video", "transcode_job")}),
         ("Styles", {"fields": ("styles",)}),
         ("Transitions", {"fields": ("enter_transition", "exit_transition", "enter_duration", "exit_duration", "enter_delay")}),
         ("Visibility", {"fields": ("is_visible",)}),
@@ -2428,6 +2467,113 @@ class PresentationSlideAdmin(admin.ModelAdmin):
     created_display.admin_order_field = "created"
 
 
+@admin.register(TranscodeJob)
+class TranscodeJobAdmin(admin.ModelAdmin):
+    """TranscodeJob model admin"""
+
+    list_display = (
+        "id",
+        "source",
+        "status_badge",
+        "progress_display",
+        "attempts",
+        "worker",
+        "modified",
+    )
+
+    list_display_links = ("id", "source")
+
+    search_fields = ("source", "output", "content_hash")
+
+    list_filter = ("status",)
+
+    readonly_fields = (
+        "content_hash", "source", "output", "progress", "attempts",
+        "worker", "heartbeat", "error", "created", "modified",
+    )
+
+    fieldsets = (
+        ("Video", {"fields": ("content_hash", "source", "output")}),
+        ("Queue", {"fields": ("status", "progress", "attempts", "run_after", "worker", "heartbeat", "error")}),
+        ("Timestamps", {"fields": ("created", "modified"), "classes": ("collapse",)}),
+    )
+
+    actions = ["retry_now"]
+
+    def status_badge(self, obj):
+        """Display job status"""
+        colors = {
+            TranscodeJob.STATUS_QUEUED: "#6c757d",
+            TranscodeJob.STATUS_RUNNING: "#007bff",
+            TranscodeJob.STATUS_DONE: "#28a745",
+            TranscodeJob.STATUS_FAILED: "#dc3545",
+        }
+        return format_html(
+            '<span style="background-color: {}; color: white; padding: 3px 10px; border-radius: 3px;">{}</span>',
+            colors.get(obj.status, "#6c757d"), obj.get_status_display()
+        )
+    status_badge.short_description = "Status"
+    status_badge.admin_order_field = "status"
+
+    def progress_display(self, obj):
+        """Display progress"""
+        return f"{obj.progress}%"
+    progress_display.short_description = "Progress"
+    progress_display.admin_order_field = "progress"
+
+    def retry_now(self, request, queryset):
+        """Queue failed or waiting jobs to run immediately"""
+        from django.utils import timezone
+
+        updated = queryset.exclude(status=TranscodeJob.STATUS_RUNNING).update(
+            status=TranscodeJob.STATUS_QUEUED,
+            attempts=0,
+            error="",
+            run_after=timezone.now(),
+        )
+        self.message_user(request, f"{updated} jobs queued.")
+    retry_now.short_description = "Retry now"
+
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    """UploadSession model admin"""
+
+    list_display = (
+        "id",
+        "filename",
+        "target",
+        "uploaded_by",
+        "progress_display",
+        "status",
+        "modified",
+    )
+
+    list_display_links = ("id", "filename")
+
+    search_fields = ("filename", "uploaded_by__email")
+
+    list_filter = ("target", "status")
+
+    readonly_fields = (
+        "uploaded_by", "target", "filename", "size", "offset", "checksum",
+        "status", "slide_element", "file", "created", "modified",
+    )
+
+    fieldsets = (
+        ("Upload", {"fields": ("uploaded_by", "target", "filename", "size", "offset", "checksum", "status")}),
+        ("Target", {"fields": ("title", "description", "public", "slide_element", "file")}),
+        ("Timestamps", {"fields": ("created", "modified"), "classes": ("collapse",)}),
+    )
+
+    def progress_display(self, obj):
+        """Display bytes received"""
+        if not obj.size:
+            return "100%"
+        return f"{obj.offset * 100 // obj.size}%"
+    progress_display.short_description = "Progress"
+
+
 @admin.register(Attendance)
 class AttendanceAdmin(admin.ModelAdmin):
     """RSVP confirmations — who's coming to which edition."""
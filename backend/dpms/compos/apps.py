@@ -7,3 +7,6 @@ class ComposAppConfig(AppConfig):
 
     name = "dpms.compos"
     verbose_name = "Compos"
+
+    def ready(self):
+        import dpms.compos.signals
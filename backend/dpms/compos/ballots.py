@@ -0,0 +1,108 @@
+"""
+Batch vote submission.
+
+Voters usually rate a whole compo at once. Instead of validating and saving
+every vote on its own (each one re-reading the voting period, jury
+membership and attendee verification), a ballot resolves the voter's
+eligibility once per edition (see dpms.compos.voter_context), validates
+every item in memory and upserts all valid votes with a single bulk_create
+in one transaction.
+"""
+
+# Django
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+# Application models
+from dpms.compos.models import Production, ProductionTally, Vote
+from dpms.compos.voter_context import get_voter_context
+
+User = get_user_model()
+
+# Maximum number of votes accepted in a single ballot
+MAX_BALLOT_SIZE = 200
+
+
+def submit_ballot(user, items, request=None):
+    """
+    Validate and upsert many votes of a user.
+
+    Args:
+        user: Voting user
+        items: List of dicts with validated ``production`` (id), ``score``
+            and ``comment``
+        request: Current request, to memoize the voter contexts on it
+
+    Returns:
+        list: One result dict per item, in order, with ``status`` set to
+        ``created``, ``updated`` or ``error``
+    """
+    results = [{"production": item["production"]} for item in items]
+
+    production_ids = {item["production"] for item in items}
+    productions = Production.objects.filter(id__in=production_ids).select_related(
+        "compo"
+    ).in_bulk()
+
+    with transaction.atomic():
+        # Serialize concurrent ballots of the same user so tallies stay exact
+        list(User.objects.select_for_update().filter(pk=user.pk).values_list("pk"))
+
+        existing = {
+            vote.production_id: vote
+            for vote in Vote.objects.filter(
+                user=user, production_id__in=production_ids
+            ).only("id", "production_id", "score", "is_jury_vote")
+        }
+
+        votes = []
+        tally_changes = []
+        seen = set()
+
+        for item, result in zip(items, results):
+            production = productions.get(item["production"])
+            if production is None:
+                result.update(status="error", error="La producción no existe")
+                continue
+            if production.id in seen:
+                result.update(status="error", error="Producción repetida en la votación")
+                continue
+            seen.add(production.id)
+
+            voter = get_voter_context(user, production.edition_id, request)
+
+            previous = existing.get(production.id)
+            is_jury_vote = previous.is_jury_vote if previous else voter.is_jury
+
+            error = voter.check_vote(production, is_jury_vote)
+            if error:
+                result.update(status="error", error=error)
+                continue
+
+            votes.append(Vote(
+                user=user,
+                production=production,
+                score=item["score"],
+                comment=item.get("comment", ""),
+                is_jury_vote=is_jury_vote,
+            ))
+            if previous:
+                tally_changes.append(
+                    (production.id, previous.is_jury_vote, previous.score, -1)
+                )
+            tally_changes.append((production.id, is_jury_vote, item["score"], 1))
+            result.update(
+                status="updated" if previous else "created", score=item["score"]
+            )
+
+        if votes:
+            # Bypasses Vote.save, so the tallies are updated explicitly
+            Vote.objects.bulk_create(
+                votes,
+                update_conflicts=True,
+                unique_fields=["user", "production"],
+                update_fields=["score", "comment", "modified"],
+            )
+            ProductionTally.apply_many(tally_changes)
+
+    return results
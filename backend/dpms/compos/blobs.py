@@ -0,0 +1,223 @@
+"""
+Content-addressed storage of uploaded files.
+
+The content of every File is stored once, as a Blob named after its
+SHA-256:
+
+    blobs/<first 2 hex digits>/<sha256>.<extension of the first upload>
+
+The hash is computed while the upload is copied into a temporary file of
+the storage (or, for uploads already on disk, while reading it), and the
+file is then moved into place unless a blob with the same content exists,
+in which case it is dropped. File rows point at their blob and each blob
+counts the File rows not deleted that use it: deleting a File, soft or
+not, only drops its reference.
+
+Unreferenced blobs are deleted by ``manage.py collect_file_blobs``, which
+also repairs the counters and can move files uploaded before blobs
+existed into them.
+
+Blob rows are locked (select_for_update) while a reference is added and
+while the collector deletes them, so an upload never reuses a blob whose
+file is being deleted.
+"""
+
+# Utilities
+import hashlib
+import os
+import tempfile
+import time
+from datetime import timedelta
+
+# Django
+from django.core.files.move import file_move_safe
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# Application models
+from dpms.compos.models import Blob, File
+
+BLOBS_DIR = "blobs"
+TMP_DIR = f"{BLOBS_DIR}/tmp"
+# Files under BLOBS_DIR without a Blob row (interrupted uploads) are
+# deleted once this old
+ORPHAN_AGE = timedelta(days=1)
+
+
+def storage():
+    """Storage of File contents."""
+    return File._meta.get_field("file").storage
+
+
+def blob_name(sha256, filename):
+    """Storage name of the blob of some content."""
+    ext = os.path.splitext(filename)[1].lower()[:16]
+    return f"{BLOBS_DIR}/{sha256[:2]}/{sha256}{ext}"
+
+
+def hash_into_temp(content):
+    """
+    Copy an upload into a temporary file of the storage, hashing it.
+
+    Returns:
+        tuple: (temporary file path, SHA-256 hex digest, size)
+    """
+    tmp_dir = storage().path(TMP_DIR)
+    os.makedirs(tmp_dir, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(dir=tmp_dir, suffix=".upload")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for chunk in content.chunks():
+                digest.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path, digest.hexdigest(), size
+
+
+def hash_file(path):
+    """SHA-256 hex digest and size of a file, read in chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def store_blob(filename, content=None, path=None):
+    """
+    Store uploaded content as a blob and add a reference to it.
+
+    Args:
+        filename: Name of the upload (its extension names new blobs)
+        content: Django File to copy, if not on disk
+        path: File on disk, moved into the blob when the content is new
+            (the caller still owns it otherwise)
+
+    Returns:
+        Blob
+    """
+    if path:
+        sha256, size = hash_file(path)
+        temporary = False
+    else:
+        path, sha256, size = hash_into_temp(content)
+        temporary = True
+
+    try:
+        with transaction.atomic():
+            blob, _ = Blob.objects.select_for_update().get_or_create(
+                sha256=sha256,
+                defaults={"name": blob_name(sha256, filename), "size": size},
+            )
+            target = storage().path(blob.name)
+            if not os.path.exists(target):
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                file_move_safe(path, target)
+                # A moved file keeps its age: make it new, so the
+                # collector does not take it for an old orphan before
+                # this transaction commits
+                os.utime(target)
+                if storage().file_permissions_mode is not None:
+                    os.chmod(target, storage().file_permissions_mode)
+            Blob.objects.filter(pk=blob.pk).update(ref_count=F("ref_count") + 1)
+    finally:
+        if temporary and os.path.exists(path):
+            os.remove(path)
+    blob.ref_count += 1
+    return blob
+
+
+def release_blob(blob_id):
+    """Drop a reference to a blob (its File was deleted)."""
+    Blob.objects.filter(pk=blob_id, ref_count__gt=0).update(ref_count=F("ref_count") - 1)
+
+
+def recount(blob_ids=None):
+    """
+    Recompute reference counters from the File rows.
+
+    Args:
+        blob_ids: Blobs to recount (default: all)
+
+    Returns:
+        int: Blobs recounted
+    """
+    live = (
+        File.objects.filter(blob=OuterRef("pk"), is_deleted=False)
+        .values("blob")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    blobs = Blob.objects.all()
+    if blob_ids is not None:
+        blobs = blobs.filter(pk__in=blob_ids)
+    return blobs.update(ref_count=Coalesce(Subquery(live), 0))
+
+
+def adopt_file(file_obj):
+    """
+    Move the content of a File uploaded before blobs into a blob.
+
+    Other files with the same storage name are moved along with it.
+
+    Returns:
+        bool: Whether its content was already stored as a blob
+    """
+    old_name = file_obj.file.name
+    path = storage().path(old_name)
+    blob = store_blob(os.path.basename(old_name), path=path)
+    duplicate = os.path.exists(path)
+    File.objects.filter(file=old_name, blob__isnull=True).update(blob=blob, file=blob.name)
+    recount([blob.pk])
+    if duplicate:
+        # The content was stored before: this copy is not needed
+        transaction.on_commit(lambda: storage().delete(old_name))
+    return duplicate
+
+
+def collect_garbage():
+    """
+    Delete unreferenced blobs and files left in the blob directory.
+
+    A blob is only deleted if no File row (not deleted) uses it, whatever
+    its counter says; counters found wrong are repaired.
+
+    Returns:
+        tuple: (blobs deleted, bytes freed, orphan files deleted)
+    """
+    deleted = freed = 0
+    for pk in Blob.objects.filter(ref_count=0).values_list("pk", flat=True):
+        with transaction.atomic():
+            blob = Blob.objects.select_for_update().filter(pk=pk, ref_count=0).first()
+            if blob is None:
+                continue
+            if File.objects.filter(blob=blob, is_deleted=False).exists():
+                recount([pk])
+                continue
+            storage().delete(blob.name)
+            blob.delete()
+        deleted += 1
+        freed += blob.size
+
+    # Files without a row: uploads interrupted before their transaction
+    # committed, and temporary copies
+    known = set(Blob.objects.values_list("name", flat=True))
+    cutoff = time.time() - ORPHAN_AGE.total_seconds()
+    orphans = 0
+    root = storage().path(BLOBS_DIR)
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, storage().location).replace(os.sep, "/")
+            if name not in known and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                orphans += 1
+    return deleted, freed, orphans
@@ -0,0 +1,170 @@
+"""
+Physical check-in with signed QR passes.
+
+In the ``checkin`` access mode attendees are verified at the door. Each
+attendee shows a QR pass whose payload names the edition and the user and
+carries an HMAC of both, keyed with SECRET_KEY:
+
+    DPMS1:<edition id>:<user id>:<base32 signature>
+
+Scanners post the payloads they read, one at a time or in batches uploaded
+after working offline. Signatures are checked in memory, so a forged or
+mistyped pass costs no query; a batch of valid scans costs one query to
+read the users and one upsert of their AttendeeVerification rows.
+"""
+
+# Utilities
+import base64
+
+# Django
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+# Application models
+from dpms.compos.models import AttendeeVerification
+from dpms.compos.voter_context import invalidate_voter_context
+
+User = get_user_model()
+
+PAYLOAD_PREFIX = "DPMS1"
+SIGNATURE_SALT = "dpms.compos.checkin"
+
+# Maximum number of scans accepted in a single upload
+MAX_CHECKIN_BATCH = 500
+
+
+def uses_checkin(edition):
+    """Whether the edition verifies its attendees with check-in passes."""
+    config = getattr(edition, "voting_config", None)
+    return config is not None and config.access_mode == "checkin"
+
+
+def sign_checkin(edition_id, user_id):
+    """Signature of the pass of a user in an edition."""
+    digest = salted_hmac(
+        SIGNATURE_SALT, f"{edition_id}:{user_id}", algorithm="sha256"
+    ).digest()
+    # 120 bits, upper-case base32: fits the QR alphanumeric mode, no padding
+    return base64.b32encode(digest[:15]).decode()
+
+
+def make_checkin_payload(edition_id, user_id):
+    """QR payload of the pass of a user in an edition."""
+    return f"{PAYLOAD_PREFIX}:{edition_id}:{user_id}:{sign_checkin(edition_id, user_id)}"
+
+
+def read_checkin_payload(payload, edition_id):
+    """
+    Verify a scanned payload.
+
+    Args:
+        payload: Scanned text
+        edition_id: Edition the scanner is checking in
+
+    Returns:
+        int: Id of the user
+
+    Raises:
+        ValueError: If the payload is malformed, forged or for another edition
+    """
+    parts = payload.strip().split(":")
+    if len(parts) != 4 or parts[0] != PAYLOAD_PREFIX:
+        raise ValueError("Código QR no válido")
+    _, edition, user, signature = parts
+    if not (edition.isdigit() and user.isdigit()):
+        raise ValueError("Código QR no válido")
+    if not constant_time_compare(signature, sign_checkin(edition, user)):
+        raise ValueError("Firma del código QR no válida")
+    if int(edition) != int(edition_id):
+        raise ValueError("El pase es de otra edición")
+    return int(user)
+
+
+def check_in(edition_id, scans, scanned_by):
+    """
+    Verify the attendees of a batch of scans.
+
+    Args:
+        edition_id: Edition the scanner is checking in
+        scans: List of dicts with ``payload`` and an optional ``scanned_at``
+            (when the scanner read it, for offline uploads)
+        scanned_by: User operating the scanner
+
+    Returns:
+        list: One result dict per scan, in order, with ``status`` set to
+        ``checked_in``, ``already_checked_in`` or ``error``
+    """
+    now = timezone.now()
+    results = [{"payload": scan["payload"]} for scan in scans]
+
+    # First scan of each user, in memory
+    scanned = {}
+    for scan, result in zip(scans, results):
+        try:
+            user_id = read_checkin_payload(scan["payload"], edition_id)
+        except ValueError as e:
+            result.update(status="error", error=str(e))
+            continue
+        result["user"] = user_id
+        if user_id in scanned:
+            result["status"] = "already_checked_in"
+            continue
+        scanned[user_id] = (result, min(scan.get("scanned_at") or now, now))
+
+    if not scanned:
+        return results
+
+    users = User.objects.filter(pk__in=scanned).annotate(
+        checked_in=Exists(
+            AttendeeVerification.objects.filter(
+                user=OuterRef("pk"), edition_id=edition_id, is_verified=True
+            )
+        )
+    ).values_list("pk", "is_active", "profile__nickname", "checked_in")
+    found = {pk: (is_active, nickname, checked_in) for pk, is_active, nickname, checked_in in users}
+
+    verifications = []
+    for user_id, (result, scanned_at) in scanned.items():
+        if user_id not in found:
+            result.update(status="error", error="El usuario no existe")
+            continue
+        is_active, nickname, checked_in = found[user_id]
+        result["nickname"] = nickname or ""
+        if not is_active:
+            result.update(status="error", error="El usuario está desactivado")
+            continue
+        if checked_in:
+            result["status"] = "already_checked_in"
+            continue
+        verifications.append(AttendeeVerification(
+            user_id=user_id,
+            edition_id=edition_id,
+            is_verified=True,
+            verified_by=scanned_by,
+            verified_at=scanned_at,
+            verification_method="checkin",
+        ))
+        result["status"] = "checked_in"
+
+    if verifications:
+        with transaction.atomic():
+            # Also verifies pending rows; bypasses the post_save signal
+            AttendeeVerification.objects.bulk_create(
+                verifications,
+                update_conflicts=True,
+                unique_fields=["user", "edition"],
+                update_fields=[
+                    "is_verified",
+                    "verified_by",
+                    "verified_at",
+                    "verification_method",
+                    "modified",
+                ],
+            )
+            for verification in verifications:
+                invalidate_voter_context(edition_id, verification.user_id)
+
+    return results
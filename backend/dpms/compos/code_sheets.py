@@ -0,0 +1,140 @@
+"""
+Printable sheets of attendance codes.
+
+Before a party the organizers print every unused attendance code of the
+edition with its QR code (see dpms.utils.qr_sheets) to hand them out at
+the door. Rendering thousands of QR codes takes seconds, so sheets are
+built once, offline, and kept in the default storage under a name derived
+from their content:
+
+    attendance-sheets/<edition id>/<sha256 of layout, title and codes>.pdf
+
+The same set of unused codes always maps to the same file, so requests
+are served straight from storage until codes are generated or used. A
+missing file is built in a background thread (one build per file at a
+time) or ahead of time with ``manage.py render_code_sheets``. A build
+records the process running it, so one lost with its process (a worker
+restart or a deploy) is started again by the next request instead of
+being reported as in progress until its mark expires.
+"""
+
+# Utilities
+import hashlib
+import logging
+import os
+import socket
+import threading
+
+# Django
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+# Application
+from dpms.compos.models import AttendanceCode
+from dpms.utils.cache import CacheNamespace
+from dpms.utils.qr_sheets import render_sheets
+
+logger = logging.getLogger("dpms")
+
+# Bump when the sheet layout changes so existing files are rebuilt
+LAYOUT_VERSION = 1
+
+# Builds in progress, so concurrent requests do not render the same file.
+# Keyed by sheet path, with the "<host>:<pid>" of the process building it.
+builds = CacheNamespace("code-sheets", versioned=False)
+BUILD_TIMEOUT = 600
+
+
+def build_owner():
+    """Mark of builds started by this process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def owner_alive(owner):
+    """Whether the process that marked a build is still running."""
+    host, _, pid = str(owner).rpartition(":")
+    if host != socket.gethostname():
+        # The cache is per host: another host name is a replaced container
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except (ProcessLookupError, ValueError):
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def claim_build(path):
+    """Mark a build as started by this process, unless a live one runs it."""
+    owner = build_owner()
+    if builds.add(path, owner, BUILD_TIMEOUT):
+        return True
+    current = builds.get(path)
+    if current is not None and owner_alive(current):
+        return False
+    # Lost with its process: take it over
+    builds.delete(path)
+    return builds.add(path, owner, BUILD_TIMEOUT)
+
+
+def get_sheet_codes(edition):
+    """Unused codes of the edition, in print order."""
+    return list(
+        AttendanceCode.objects.filter(edition=edition, is_used=False)
+        .order_by("code")
+        .values_list("code", flat=True)
+    )
+
+
+def sheet_path(edition, codes):
+    """Storage path of the sheets of the given codes."""
+    digest = hashlib.sha256(
+        f"{LAYOUT_VERSION}\n{edition.title}\n".encode() + "\n".join(codes).encode()
+    ).hexdigest()
+    return f"attendance-sheets/{edition.pk}/{digest}.pdf"
+
+
+def build_sheets(edition, codes, path, processes=None):
+    """Render the codes to path and remove older sheets of the edition."""
+    pdf = render_sheets(codes, title=edition.title, processes=processes)
+    if not default_storage.exists(path):
+        default_storage.save(path, ContentFile(pdf))
+
+    directory = f"attendance-sheets/{edition.pk}"
+    _, files = default_storage.listdir(directory)
+    for name in files:
+        if f"{directory}/{name}" != path:
+            default_storage.delete(f"{directory}/{name}")
+    return path
+
+
+def get_or_build_sheets(edition):
+    """
+    Current sheets of the edition, starting a build if they are missing.
+
+    Returns:
+        tuple: (path, ready). path is None when the edition has no unused
+        codes; ready is False while the file is being built.
+    """
+    codes = get_sheet_codes(edition)
+    if not codes:
+        return None, False
+
+    path = sheet_path(edition, codes)
+    if default_storage.exists(path):
+        return path, True
+
+    if claim_build(path):
+
+        def build():
+            try:
+                build_sheets(edition, codes, path)
+            except Exception:
+                logger.exception(f"Edition {edition.pk}: building code sheets failed")
+            finally:
+                builds.delete(path)
+
+        threading.Thread(target=build, daemon=True).start()
+
+    return path, False
@@ -0,0 +1,220 @@
+"""
+Push channel for StageControl state.
+
+Visualizers and the live control panel long-poll
+``/api/stage-control/watch/`` instead of polling ``by-config`` every few
+seconds. Every gunicorn worker keeps one ControlChannel: waiting requests
+block on a condition variable and are woken when the control of their
+config changes. The serialized state is loaded once per change and shared
+by every waiter of the process.
+
+StageControl.save notifies through PostgreSQL ``NOTIFY`` (delivered on
+commit), which a single listener thread per process turns into a local
+wake-up, so a command sent through one worker reaches the screens served
+by the others. Without PostgreSQL, or while the listener is down, waiters
+re-check the database every few seconds instead.
+
+Each waiting request holds a gunicorn thread, so a process only lets
+STAGE_CONTROL_MAX_WATCHERS of them wait at once; beyond that, requests
+whose state did not change are turned away (ChannelBusy) to retry later.
+"""
+
+# Python
+import logging
+import select
+import threading
+import time
+
+# Django
+from django.conf import settings
+from django.db import connection, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = 'dpms_stage_control'
+
+# Seconds between database re-checks when no listener is running
+FALLBACK_INTERVAL = 2
+
+# Seconds between keep-alive queries of the listener connection
+LISTENER_HEARTBEAT = 60
+
+# Seconds to wait before reconnecting a failed listener
+LISTENER_RETRY = 5
+
+
+class ChannelBusy(Exception):
+    """Too many requests are already waiting in this process."""
+
+
+class ControlChannel:
+    """Process-local fan-out of StageControl changes, keyed by config id."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._generations = {}
+        self._snapshots = {}
+        self._load_locks = {}
+        self._waiting = 0
+        self._listener = None
+        self._listening = False
+
+    def notify(self, config_id):
+        """
+        Announce a change of the control of ``config_id``.
+
+        Called from StageControl's post_save handler, inside the writing
+        transaction: waiters are only woken once it commits.
+        """
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT pg_notify(%s, %s)', [NOTIFY_CHANNEL, str(config_id)]
+                )
+        if not self._listening:
+            transaction.on_commit(lambda: self.publish(config_id))
+
+    def publish(self, config_id):
+        """Drop the cached state of a config and wake up its waiters."""
+        with self._condition:
+            self._generations[config_id] = self._generations.get(config_id, 0) + 1
+            self._snapshots.pop(config_id, None)
+            self._condition.notify_all()
+
+    def snapshot(self, config_id, loader):
+        """
+        Return the current ``(etag, payload)`` of a config.
+
+        ``loader`` reads it from the database; concurrent callers share a
+        single call per change. Callers check that the config exists: every
+        config id asked for keeps a lock.
+        """
+        with self._condition:
+            cached = self._cached(config_id)
+            if cached:
+                return cached
+            load_lock = self._load_locks.setdefault(config_id, threading.Lock())
+
+        with load_lock:
+            with self._condition:
+                cached = self._cached(config_id)
+                if cached:
+                    return cached
+                generation = self._generations.get(config_id, 0)
+
+            etag, payload = loader()
+
+            with self._condition:
+                if self._listening and self._generations.get(config_id, 0) == generation:
+                    self._snapshots[config_id] = (generation, etag, payload)
+            return etag, payload
+
+    def wait(self, config_id, etag, loader, timeout):
+        """
+        Block until the state of a config no longer matches ``etag``.
+
+        Returns:
+            tuple: (etag, payload), payload being None if ``timeout``
+            seconds went by without changes
+
+        Raises:
+            ChannelBusy: If the state did not change and the process
+                already has STAGE_CONTROL_MAX_WATCHERS waiting requests
+        """
+        self.start_listener()
+        deadline = time.monotonic() + timeout
+        waiting = False
+
+        try:
+            while True:
+                with self._condition:
+                    generation = self._generations.get(config_id, 0)
+
+                current_etag, payload = self.snapshot(config_id, loader)
+                if current_etag != etag:
+                    return current_etag, payload
+
+                with self._condition:
+                    if not waiting and timeout > 0:
+                        if self._waiting >= settings.STAGE_CONTROL_MAX_WATCHERS:
+                            raise ChannelBusy()
+                        self._waiting += 1
+                        waiting = True
+                    while self._generations.get(config_id, 0) == generation:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return current_etag, None
+                        if not self._listening:
+                            # Nobody will wake us up: re-check the database
+                            self._condition.wait(min(remaining, FALLBACK_INTERVAL))
+                            break
+                        self._condition.wait(remaining)
+        finally:
+            if waiting:
+                with self._condition:
+                    self._waiting -= 1
+
+    def start_listener(self):
+        """Start the NOTIFY listener thread of this process if needed."""
+        if self._listener is not None and self._listener.is_alive():
+            return
+        if connection.vendor != 'postgresql':
+            return
+        with self._condition:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self._listener = threading.Thread(
+                target=self._listen, name='stage-control-listener', daemon=True
+            )
+            self._listener.start()
+
+    def _cached(self, config_id):
+        cached = self._snapshots.get(config_id)
+        if cached and cached[0] == self._generations.get(config_id, 0):
+            return cached[1], cached[2]
+        return None
+
+    def _set_listening(self, listening):
+        with self._condition:
+            self._listening = listening
+            # Anything may have changed while nobody was listening
+            for config_id in list(self._generations):
+                self._generations[config_id] += 1
+            self._snapshots.clear()
+            self._condition.notify_all()
+
+    def _listen(self):
+        wrapper = connections['default']
+        while True:
+            conn = None
+            try:
+                conn = wrapper.get_new_connection(wrapper.get_connection_params())
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN {NOTIFY_CHANNEL}')
+                self._set_listening(True)
+
+                while True:
+                    if select.select([conn], [], [], LISTENER_HEARTBEAT) == ([], [], []):
+                        with conn.cursor() as cursor:
+                            cursor.execute('SELECT 1')
+                    conn.poll()
+                    while conn.notifies:
+                        notification = conn.notifies.pop(0)
+                        try:
+                            self.publish(int(notification.payload))
+                        except ValueError:
+                            continue
+            except Exception:
+                logger.exception('Stage control listener failed, reconnecting')
+                self._set_listening(False)
+                time.sleep(LISTENER_RETRY)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+control_channel = ControlChannel()
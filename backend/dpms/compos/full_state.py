@@ -0,0 +1,78 @@
+"""
+Precomputed StageRunner full-state.
+
+The full-state of a config (slides with their elements, presentations and
+the control row) is rendered once into JSON bytes and kept in the Django
+cache together with the config revision it was built for. Every change
+that alters it bumps the revision (see dpms.compos.signals), so a cached
+blob is served only while its revision is still current, and rebuilt on
+the first request after a change.
+"""
+
+# Django
+from django.db.models import Prefetch
+
+# Django REST Framework
+from rest_framework.renderers import JSONRenderer
+
+# Application models
+from dpms.compos.models import StagePresentation, StageRunnerConfig, StageSlide
+from dpms.compos.serializers import StageRunnerFullStateSerializer
+
+# Utilities
+from dpms.utils.cache import CacheNamespace
+
+# Keyed by config id
+blobs = CacheNamespace('stagerunner-full-state')
+
+# Seconds a blob is kept without being requested
+CACHE_TIMEOUT = 60 * 60
+
+
+def full_state_queryset():
+    """
+    Configs with everything StageRunnerFullStateSerializer reads.
+
+    The control row must exist (it is selected, not prefetched).
+    """
+    return StageRunnerConfig.objects.select_related('edition', 'control').prefetch_related(
+        Prefetch(
+            'slides',
+            queryset=StageSlide.objects.select_related(
+                'production', 'has_compo__compo', 'has_compo__edition'
+            )
+        ),
+        'slides__elements',
+        Prefetch(
+            'presentations',
+            queryset=StagePresentation.objects.select_related('has_compo__compo')
+        ),
+        'presentations__presentation_slides__slide',
+    )
+
+
+def render_full_state(config_id):
+    """Serialize the full-state of a config into JSON bytes."""
+    config = full_state_queryset().get(pk=config_id)
+    return JSONRenderer().render(StageRunnerFullStateSerializer(config).data)
+
+
+def full_state_json(config_id, revision):
+    """
+    Return the full-state of a config as JSON bytes.
+
+    Args:
+        config_id: StageRunnerConfig id
+        revision: Current revision of the config
+
+    Returns:
+        bytes: The cached blob if it was built for ``revision``, otherwise
+        a freshly rendered one (which replaces it in the cache)
+    """
+    cached = blobs.get(config_id)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+
+    content = render_full_state(config_id)
+    blobs.set(config_id, (revision, content), CACHE_TIMEOUT)
+    return content
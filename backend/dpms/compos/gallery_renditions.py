@@ -0,0 +1,105 @@
+"""
+Renditions of gallery images.
+
+Party photos are uploaded straight from cameras and phones, up to 20 MB
+each. Every upload is rendered (see dpms.utils.renditions) in a few sizes,
+in WebP and JPEG, and stored next to the original:
+
+    gallery/<edition>/<name>_<uuid>.jpg            original upload
+    gallery/<edition>/<name>_<uuid>_thumb.webp     grid thumbnail
+    gallery/<edition>/<name>_<uuid>_lightbox.jpg   lightbox view
+    ...
+
+GalleryImage.renditions maps each size to its files and dimensions, and
+GalleryImage.thumbnail points to the JPEG grid thumbnail. Uploads are
+rendered once saved in the rendition thread pool of the process (shared
+with dpms.utils.image_fields, so concurrent uploads never decode more
+images at once than it has threads); ``manage.py
+generate_gallery_renditions`` renders the images that are missing them,
+in a process pool.
+"""
+
+# Utilities
+import logging
+import os
+
+# Django
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+
+# Application
+from dpms.compos.models import GalleryImage
+from dpms.utils.image_fields import executor
+from dpms.utils.renditions import EXTENSIONS, render_batch
+
+logger = logging.getLogger("dpms")
+
+# (name, longest edge): the full-size rendition is upright and without metadata
+GALLERY_SIZES = [
+    ("thumb", 480),
+    ("lightbox", 1920),
+    ("original", None),
+]
+GALLERY_FORMATS = ("webp", "jpeg")
+
+
+def rendition_name(image_name, size, fmt):
+    """Storage name of a rendition, next to the original."""
+    return f"{os.path.splitext(image_name)[0]}_{size}.{EXTENSIONS[fmt]}"
+
+
+def render_job(image):
+    """Arguments of render_image for a gallery image."""
+    return (default_storage.path(image.image.name), GALLERY_SIZES, GALLERY_FORMATS)
+
+
+def store_renditions(image, results):
+    """Save rendered files and record them on the image."""
+    renditions = {}
+    for size, fmt, width, height, data in results:
+        name = rendition_name(image.image.name, size, fmt)
+        if default_storage.exists(name):
+            default_storage.delete(name)
+        name = default_storage.save(name, ContentFile(data))
+        renditions.setdefault(size, {"width": width, "height": height})[fmt] = name
+
+    thumbnail = renditions.get("thumb", {}).get("jpeg", "")
+    GalleryImage.objects.filter(pk=image.pk).update(renditions=renditions, thumbnail=thumbnail)
+    image.renditions = renditions
+    image.thumbnail.name = thumbnail
+    return renditions
+
+
+def generate_renditions(images, processes=None):
+    """
+    Render and store the renditions of gallery images.
+
+    Returns:
+        tuple: (rendered, failed) image counts
+    """
+    images = list(images)
+    rendered = failed = 0
+    jobs = [render_job(image) for image in images]
+    for image, (results, error) in zip(images, render_batch(jobs, processes)):
+        if error:
+            logger.error(f"GalleryImage {image.pk}: rendering failed: {error}")
+            failed += 1
+            continue
+        store_renditions(image, results)
+        rendered += 1
+    return rendered, failed
+
+
+def schedule_renditions(image):
+    """Render an uploaded image in the rendition thread pool once it is saved."""
+
+    def render():
+        try:
+            generate_renditions([image], processes=1)
+        except Exception:
+            logger.exception(f"GalleryImage {image.pk}: rendering failed")
+        finally:
+            connection.close()
+
+    transaction.on_commit(lambda: executor.submit(render))
@@ -0,0 +1,150 @@
+"""
+Management command to benchmark QR check-in at the door.
+
+Usage:
+    python manage.py benchmark_checkin [--edition ID] [--attendees 300] [--batch 300]
+
+Builds N throwaway users with their QR passes and checks them in through
+/api/attendee-verification/checkin/ (full view: authentication, admin check,
+validation, upsert) twice:
+
+    live     one scan per request, as a connected scanner sends them
+    offline  every scan uploaded in batches of --batch, as an offline scanner
+
+and reports queries per request, median and 95th percentile latency per
+request and per scan. A few forged passes are mixed in to check they are
+rejected.
+
+Everything is created inside a transaction that is rolled back at the end.
+"""
+
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from dpms.compos.checkin import make_checkin_payload
+from dpms.compos.models import AttendeeVerification, Edition
+from dpms.compos.views import AttendeeVerificationViewSet
+from dpms.users.models import Profile
+from dpms.users.roles import ADMINS_GROUP
+
+User = get_user_model()
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark fixture."""
+
+
+class Command(BaseCommand):
+    help = "Benchmark QR check-in latency, live and in offline batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--edition",
+            type=int,
+            help="Edition to check in (default: the latest one)",
+        )
+        parser.add_argument(
+            "--attendees",
+            type=int,
+            default=300,
+            help="Number of attendees arriving",
+        )
+        parser.add_argument(
+            "--batch",
+            type=int,
+            default=300,
+            help="Scans per offline upload",
+        )
+
+    def handle(self, *args, **options):
+        editions = Edition.objects.order_by("-start_date", "-id")
+        if options["edition"]:
+            editions = editions.filter(pk=options["edition"])
+        edition = editions.first()
+        if edition is None:
+            raise CommandError("No edition to check in")
+
+        self.view = AttendeeVerificationViewSet.as_view(
+            {"post": "checkin"}, throttle_classes=[]
+        )
+        self.factory = APIRequestFactory()
+
+        self.stdout.write(
+            f"{'mode':>8} {'requests':>9} {'queries/req':>12} "
+            f"{'median ms':>10} {'p95 ms':>8} {'ms/scan':>8}"
+        )
+        for mode in ("live", "offline"):
+            try:
+                with transaction.atomic():
+                    scanner, payloads = self.build_fixture(edition, options["attendees"])
+                    size = 1 if mode == "live" else options["batch"]
+                    batches = [
+                        payloads[start:start + size]
+                        for start in range(0, len(payloads), size)
+                    ]
+                    self.measure(mode, edition, scanner, batches, len(payloads))
+                    raise Rollback
+            except Rollback:
+                pass
+
+    def measure(self, mode, edition, scanner, batches, scans):
+        timings = []
+        checked_in = rejected = 0
+        with CaptureQueriesContext(connection) as ctx:
+            for batch in batches:
+                request = self.factory.post(
+                    "/api/attendee-verification/checkin/",
+                    {"edition": edition.pk, "scans": [{"payload": p} for p in batch]},
+                    format="json",
+                )
+                force_authenticate(request, user=scanner)
+                start = time.perf_counter()
+                response = self.view(request)
+                timings.append(time.perf_counter() - start)
+                assert response.status_code == 200, response.data
+                for result in response.data["results"]:
+                    checked_in += result["status"] == "checked_in"
+                    rejected += result["status"] == "error"
+
+        timings.sort()
+        self.stdout.write(
+            f"{mode:>8} {len(batches):>9} {len(ctx.captured_queries) / len(batches):>12.2f} "
+            f"{statistics.median(timings) * 1000:>10.2f} "
+            f"{timings[int(len(timings) * 0.95)] * 1000:>8.2f} "
+            f"{sum(timings) * 1000 / scans:>8.2f}"
+        )
+        self.stdout.write(f"{'':>8} {checked_in} checked in, {rejected} forged passes rejected")
+
+    def build_fixture(self, edition, attendees):
+        suffix = timezone.now().strftime("%Y%m%d%H%M%S%f")
+        scanner = User.objects.create(
+            email=f"bench-scanner-{suffix}@example.com",
+            username=f"bench-scanner-{suffix}",
+        )
+        scanner.groups.add(Group.objects.get_or_create(name=ADMINS_GROUP)[0])
+
+        users = User.objects.bulk_create([
+            User(
+                email=f"bench-checkin-{suffix}-{i}@example.com",
+                username=f"bench-checkin-{suffix}-{i}",
+            )
+            for i in range(attendees)
+        ])
+        Profile.objects.bulk_create([
+            Profile(user=user, nickname=f"attendee {i}") for i, user in enumerate(users)
+        ])
+        AttendeeVerification.objects.filter(edition=edition, user__in=users).delete()
+
+        payloads = [make_checkin_payload(edition.pk, user.pk) for user in users]
+        # One forged pass every 50 attendees
+        for index in range(0, len(payloads), 50):
+            payloads[index] = payloads[index][:-4] + "AAAA"
+        return scanner, payloads
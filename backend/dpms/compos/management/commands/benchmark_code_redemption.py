@@ -0,0 +1,144 @@
+"""
+Management command to benchmark concurrent attendance code redemption.
+
+Usage:
+    python manage.py benchmark_code_redemption [--edition ID] [--codes 100] [--threads 8]
+
+Generates --codes throwaway codes and, for each one, --threads throwaway
+users who all try to redeem it at the same time from their own thread and
+database connection (like gunicorn's gthread workers). Each winner then
+enters its code again, which must succeed without changing anything.
+
+Reports throughput and latency, and checks that every code was redeemed by
+exactly one user and every winner, and nobody else, got verified.
+
+The fixture is committed (the threads need to see it) and deleted at the
+end.
+"""
+
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from dpms.compos.models import AttendanceCode, AttendeeVerification, Edition
+from dpms.compos.redemption import redeem_code
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Benchmark attendance code redemption under concurrent attempts on the same codes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--edition",
+            type=int,
+            help="Edition of the codes (default: the latest one)",
+        )
+        parser.add_argument(
+            "--codes",
+            type=int,
+            default=100,
+            help="Codes to redeem",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=8,
+            help="Users racing for each code",
+        )
+
+    def handle(self, *args, **options):
+        editions = Edition.objects.order_by("-start_date", "-id")
+        if options["edition"]:
+            editions = editions.filter(pk=options["edition"])
+        edition = editions.first()
+        if edition is None:
+            raise CommandError("No edition for the codes")
+
+        suffix = timezone.now().strftime("%Y%m%d%H%M%S%f")
+        codes = [
+            code.code
+            for code in AttendanceCode.generate_codes(edition, options["codes"], f"BENCH{suffix[-6:]}")
+        ]
+        users = User.objects.bulk_create([
+            User(
+                email=f"bench-redeem-{suffix}-{i}@example.com",
+                username=f"bench-redeem-{suffix}-{i}",
+            )
+            for i in range(options["codes"] * options["threads"])
+        ])
+        try:
+            self.run(edition, codes, users, options["threads"])
+        finally:
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+            AttendanceCode.objects.filter(code__in=codes).delete()
+
+    def run(self, edition, codes, users, threads):
+        barrier = threading.Barrier(threads)
+
+        def worker(index):
+            timings, outcomes = [], Counter()
+            barrier.wait()
+            for position, code in enumerate(codes):
+                user = users[position * threads + index]
+                start = time.perf_counter()
+                try:
+                    redeem_code(code, user)
+                    outcomes["redeemed"] += 1
+                    # The winner enters its code again
+                    _, redeemed = redeem_code(code, user)
+                    outcomes["re-entered" if not redeemed else "re-entry redeemed again"] += 1
+                except ValidationError:
+                    outcomes["already used"] += 1
+                except Exception as e:
+                    outcomes[f"error: {type(e).__name__}"] += 1
+                timings.append(time.perf_counter() - start)
+            connection.close()
+            return timings, outcomes
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            results = list(pool.map(worker, range(threads)))
+        elapsed = time.perf_counter() - start
+
+        timings = sorted(timing for result in results for timing in result[0])
+        outcomes = sum((result[1] for result in results), Counter())
+        self.stdout.write(
+            f"{len(timings)} attempts on {len(codes)} codes from {threads} threads: "
+            f"{len(timings) / elapsed:.0f} attempts/s, "
+            f"median {statistics.median(timings) * 1000:.2f} ms, "
+            f"p95 {timings[int(len(timings) * 0.95)] * 1000:.2f} ms"
+        )
+        for outcome, count in sorted(outcomes.items()):
+            self.stdout.write(f"  {outcome}: {count}")
+
+        used = AttendanceCode.objects.filter(code__in=codes, is_used=True)
+        winners = set(used.values_list("used_by_id", flat=True))
+        verified = set(
+            AttendeeVerification.objects.filter(
+                edition=edition, user__in=users, is_verified=True
+            ).values_list("user_id", flat=True)
+        )
+        consistent = (
+            used.count() == len(codes)
+            and outcomes["redeemed"] == len(codes)
+            and outcomes["re-entered"] == len(codes)
+            and len(winners) == len(codes)
+            and verified == winners
+        )
+        if consistent:
+            self.stdout.write(self.style.SUCCESS("every code redeemed exactly once"))
+        else:
+            raise CommandError(
+                f"inconsistent: {used.count()} codes used by {len(winners)} users, "
+                f"{len(verified)} verified"
+            )
@@ -0,0 +1,155 @@
+"""
+Management command to benchmark the StageRunner full-state endpoint.
+
+Usage:
+    python manage.py benchmark_full_state [--slides 200] [--elements 10] [--runs 5]
+
+Builds a throwaway config with N slides and M elements per slide (plus a
+presentation covering them all), then measures query count and latency of:
+
+    legacy  serializing on every request, as full-state used to do
+    cold    rendering the cached blob after a change (cache miss)
+    warm    serving the cached blob (cache hit)
+
+Everything is created inside a transaction that is rolled back at the end.
+"""
+
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from dpms.compos.full_state import blobs, full_state_json
+from dpms.compos.models import (
+    Edition,
+    PresentationSlide,
+    SlideElement,
+    StageControl,
+    StagePresentation,
+    StageRunnerConfig,
+    StageSlide,
+)
+from dpms.compos.serializers import StageRunnerFullStateSerializer
+
+User = get_user_model()
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark fixture."""
+
+
+def legacy_full_state(config_id):
+    """Per-request serialization, as full-state used to do it."""
+    config = StageRunnerConfig.objects.prefetch_related(
+        'slides__elements',
+        'presentations__presentation_slides__slide',
+        'control'
+    ).select_related('edition').get(pk=config_id)
+    return JSONRenderer().render(StageRunnerFullStateSerializer(config).data)
+
+
+class Command(BaseCommand):
+    help = "Benchmark cold and warm latency of the StageRunner full-state"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--slides",
+            type=int,
+            default=200,
+            help="Number of slides in the fixture",
+        )
+        parser.add_argument(
+            "--elements",
+            type=int,
+            default=10,
+            help="Elements per slide",
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=5,
+            help="Measured runs per implementation (median is reported)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                config = self.build_fixture(options["slides"], options["elements"])
+                self.run(config, options["runs"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, config, runs):
+        def revision():
+            return StageRunnerConfig.objects.values_list("revision", flat=True).get(pk=config.pk)
+
+        def cold():
+            blobs.delete(config.pk)
+            return full_state_json(config.pk, revision())
+
+        def warm():
+            return full_state_json(config.pk, revision())
+
+        size = len(legacy_full_state(config.pk))
+        self.stdout.write(f"payload: {size / 1024:.1f} KiB")
+        self.stdout.write(f"{'impl':>8} {'queries':>8} {'median ms':>10}")
+
+        self.measure("legacy", lambda: legacy_full_state(config.pk), runs)
+        self.measure("cold", cold, runs)
+        warm()
+        self.measure("warm", warm, runs)
+        blobs.delete(config.pk)
+
+    def measure(self, label, func, runs):
+        timings = []
+        for _ in range(runs):
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                func()
+                timings.append((time.perf_counter() - start) * 1000)
+        self.stdout.write(
+            f"{label:>8} {len(ctx.captured_queries):>8} {statistics.median(timings):>10.1f}"
+        )
+
+    def build_fixture(self, slides_count, elements_per_slide):
+        suffix = timezone.now().strftime("%Y%m%d%H%M%S%f")
+        owner = User.objects.create_user(
+            email=f"bench-owner-{suffix}@example.com",
+            username=f"bench-owner-{suffix}",
+            password=None,
+        )
+        edition = Edition.objects.create(
+            title=f"Benchmark {suffix}", description="", uploaded_by=owner
+        )
+        config = StageRunnerConfig.objects.create(edition=edition)
+        StageControl.objects.create(config=config)
+
+        slides = StageSlide.objects.bulk_create([
+            StageSlide(config=config, name=f"Slide {i}", display_order=i)
+            for i in range(slides_count)
+        ])
+        SlideElement.objects.bulk_create([
+            SlideElement(
+                slide=slide,
+                element_type="text",
+                name=f"Text {i}",
+                content=f"Benchmark text {i}",
+                z_index=i,
+            )
+            for slide in slides
+            for i in range(elements_per_slide)
+        ], batch_size=5000)
+
+        presentation = StagePresentation.objects.create(config=config, name="Benchmark")
+        PresentationSlide.objects.bulk_create([
+            PresentationSlide(presentation=presentation, slide=slide, display_order=i)
+            for i, slide in enumerate(slides)
+        ])
+
+        return config
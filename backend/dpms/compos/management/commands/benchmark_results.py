@@ -0,0 +1,182 @@
+"""
+Management command to benchmark the voting results engine.
+
+Usage:
+    python manage.py benchmark_results [--sizes 50 500 5000] [--votes 5]
+
+Builds a throwaway edition with N productions and some votes per production,
+then measures query count and latency of the per-production loop that
+`edition_results` used to run versus the single-query results engine.
+Everything is created inside a transaction that is rolled back at the end.
+"""
+
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Avg
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from dpms.compos.models import (
+    Compo,
+    Edition,
+    HasCompo,
+    Production,
+    ProductionTally,
+    Vote,
+    VotingConfiguration,
+)
+from dpms.compos.results import edition_results, rank_by_compo
+
+User = get_user_model()
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark fixture."""
+
+
+def legacy_results(edition, config):
+    """Per-production aggregation, as edition_results used to do it."""
+    productions = Production.objects.filter(edition=edition).prefetch_related(
+        "votes"
+    )
+
+    results = []
+    for production in productions:
+        public_votes = production.votes.filter(is_jury_vote=False)
+        jury_votes = production.votes.filter(is_jury_vote=True)
+
+        public_avg = public_votes.aggregate(Avg("score"))["score__avg"] or 0
+        jury_avg = jury_votes.aggregate(Avg("score"))["score__avg"] or 0
+        final_score = config.calculate_final_score(production)
+
+        results.append({
+            "production_id": production.id,
+            "production_title": production.title,
+            "production_authors": production.authors,
+            "compo_name": production.compo.name,
+            "total_votes": production.votes.count(),
+            "public_votes": public_votes.count(),
+            "jury_votes": jury_votes.count(),
+            "public_avg_score": round(public_avg, 2),
+            "jury_avg_score": round(jury_avg, 2),
+            "final_score": round(final_score, 2),
+        })
+
+    return rank_by_compo(results), results
+
+
+class Command(BaseCommand):
+    help = "Benchmark query count and latency of the voting results engine"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[50, 500, 5000],
+            help="Number of productions per run",
+        )
+        parser.add_argument(
+            "--votes",
+            type=int,
+            default=5,
+            help="Votes per production (one jury vote included)",
+        )
+        parser.add_argument(
+            "--skip-legacy",
+            action="store_true",
+            help="Do not run the per-production implementation",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'productions':>12} {'impl':>8} {'queries':>8} {'ms':>10}"
+        )
+        for size in options["sizes"]:
+            try:
+                with transaction.atomic():
+                    edition, config = self.build_fixture(size, options["votes"])
+                    if not options["skip_legacy"]:
+                        self.measure(size, "legacy", legacy_results, edition, config)
+                    self.measure(size, "engine", edition_results, edition, config)
+                    raise Rollback
+            except Rollback:
+                pass
+
+    def measure(self, size, label, func, edition, config):
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            func(edition, config)
+            elapsed = (time.perf_counter() - start) * 1000
+        self.stdout.write(
+            f"{size:>12} {label:>8} {len(ctx.captured_queries):>8} {elapsed:>10.1f}"
+        )
+
+    def build_fixture(self, size, votes_per_production):
+        suffix = timezone.now().strftime("%Y%m%d%H%M%S%f")
+        owner = User.objects.create_user(
+            email=f"bench-owner-{suffix}@example.com",
+            username=f"bench-owner-{suffix}",
+            password=None,
+        )
+        edition = Edition.objects.create(
+            title=f"Benchmark {suffix}", description="", uploaded_by=owner
+        )
+        config = VotingConfiguration.objects.create(
+            edition=edition, voting_mode="mixed", public_weight=70, jury_weight=30
+        )
+
+        compos = [
+            Compo.objects.create(name=f"Bench compo {i}", description="", created_by=owner)
+            for i in range(max(1, size // 50))
+        ]
+        for compo in compos:
+            HasCompo.objects.create(
+                edition=edition, compo=compo, start=timezone.now(), created_by=owner
+            )
+
+        productions = Production.objects.bulk_create([
+            Production(
+                title=f"Production {i}",
+                authors="Bench",
+                uploaded_by=owner,
+                edition=edition,
+                compo=compos[i % len(compos)],
+                status="approved",
+            )
+            for i in range(size)
+        ])
+
+        voters = User.objects.bulk_create([
+            User(
+                email=f"bench-voter-{suffix}-{i}@example.com",
+                username=f"bench-voter-{suffix}-{i}",
+            )
+            for i in range(votes_per_production)
+        ])
+
+        Vote.objects.bulk_create([
+            Vote(
+                user=voter,
+                production=production,
+                score=random.randint(1, 10),
+                is_jury_vote=(i == 0),
+            )
+            for production in productions
+            for i, voter in enumerate(voters)
+        ], batch_size=5000)
+
+        # bulk_create bypasses Vote.save, so build the tallies explicitly
+        tallies = ProductionTally.compute(
+            Vote.objects.filter(production__edition=edition)
+        )
+        ProductionTally.objects.bulk_create([
+            ProductionTally(production_id=production_id, **values)
+            for production_id, values in tallies.items()
+        ], batch_size=5000)
+
+        return edition, config
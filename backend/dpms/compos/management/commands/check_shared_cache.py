@@ -0,0 +1,131 @@
+"""
+Management command to check that the cache is consistent across processes.
+
+Usage:
+    python manage.py check_shared_cache [--processes 4] [--hits 50] [--limit 100]
+
+Forks N worker processes, as gunicorn does, and checks against the
+configured cache (DJANGO_CACHE_URL) that:
+
+    counter     concurrent CacheNamespace.incr() calls add up exactly
+    throttle    a SharedRateThrottle admits exactly --limit requests in total
+    visibility  a value set by one process is read by the others, and is
+                gone for all of them once its namespace is invalidated
+
+Exits with an error if any check fails, which is expected with a
+per-process backend such as locmemcache://.
+"""
+
+import multiprocessing
+import uuid
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from dpms.utils.cache import CacheNamespace
+from dpms.utils.throttling import SharedRateThrottle
+
+
+class CheckThrottle(SharedRateThrottle):
+    """Throttle on a single throwaway client."""
+
+    def __init__(self, token, rate):
+        self.token = token
+        self.rate = rate
+        super().__init__()
+
+    def get_cache_key(self, request, view):
+        return f"cache-check-{self.token}"
+
+
+def hit_counter(name, hits):
+    namespace = CacheNamespace(name)
+    # Only missing if the cache is not shared with the parent
+    namespace.add("hits", 0, 300)
+    for _ in range(hits):
+        namespace.incr("hits")
+
+
+def hit_throttle(token, rate, hits):
+    allowed = 0
+    for _ in range(hits):
+        allowed += CheckThrottle(token, rate).allow_request(None, None)
+    return allowed
+
+
+def read_value(name):
+    return CacheNamespace(name).get("value")
+
+
+class Command(BaseCommand):
+    help = "Check that counters, throttles and invalidation agree across processes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=4,
+            help="Number of worker processes",
+        )
+        parser.add_argument(
+            "--hits",
+            type=int,
+            default=50,
+            help="Requests made by each process",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=100,
+            help="Requests per hour admitted by the throttle",
+        )
+
+    def handle(self, *args, **options):
+        processes = options["processes"]
+        hits = options["hits"]
+        limit = options["limit"]
+        token = uuid.uuid4().hex
+        name = f"cache-check-{token}"
+        namespace = CacheNamespace(name)
+
+        self.stdout.write(f"cache backend: {settings.CACHES['default']['BACKEND']}")
+
+        # Children must not share the parent's database connections
+        connections.close_all()
+        failures = []
+
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            namespace.add("hits", 0, 300)
+            pool.starmap(hit_counter, [(name, hits)] * processes)
+            counted = namespace.get("hits")
+            failures += self.report("counter", counted, processes * hits)
+
+            allowed = sum(pool.starmap(
+                hit_throttle, [(token, f"{limit}/hour", hits)] * processes
+            ))
+            failures += self.report("throttle", allowed, min(limit, processes * hits))
+
+            namespace.set("value", token, 300)
+            seen = pool.map(read_value, [name] * processes)
+            failures += self.report("visibility", seen.count(token), processes)
+
+            namespace.bump()
+            seen = pool.map(read_value, [name] * processes)
+            failures += self.report("invalidation", seen.count(None), processes)
+
+        namespace.delete("hits")
+        namespace.delete("value")
+
+        if failures:
+            raise CommandError(
+                f"Cache is not consistent across processes: {', '.join(failures)}"
+            )
+        self.stdout.write(self.style.SUCCESS("Cache is consistent across processes"))
+
+    def report(self, check, got, expected):
+        if got == expected:
+            self.stdout.write(f"{check:>12}: {got} (ok)")
+            return []
+        self.stdout.write(self.style.WARNING(f"{check:>12}: {got}, expected {expected}"))
+        return [check]
@@ -0,0 +1,71 @@
+"""
+Management command to delete the contents no file uses any more.
+
+Usage:
+    python manage.py collect_file_blobs
+    python manage.py collect_file_blobs --recount
+    python manage.py collect_file_blobs --adopt
+
+Deletes the blobs (see dpms.compos.blobs) with no File row that is not
+deleted, and files of the blob directory left without a blob by
+interrupted uploads. Run it periodically, e.g. daily from cron.
+
+--recount recomputes every reference counter from the File rows first
+(after deleting files outside the API or the admin, e.g. in a shell).
+--adopt moves the files (not deleted) uploaded before blobs existed into
+blobs, deleting the copies of contents stored more than once.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from dpms.compos.blobs import adopt_file, collect_garbage, recount
+from dpms.compos.models import File
+
+
+class Command(BaseCommand):
+    help = "Delete unreferenced file blobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--recount",
+            action="store_true",
+            help="Recompute reference counters before collecting",
+        )
+        parser.add_argument(
+            "--adopt",
+            action="store_true",
+            help="Move files uploaded before blobs into blobs",
+        )
+
+    def handle(self, *args, **options):
+        if options["adopt"]:
+            self.adopt()
+
+        if options["recount"]:
+            count = recount()
+            self.stdout.write(f"{count} blob counters recomputed")
+
+        deleted, freed, orphans = collect_garbage()
+        self.stdout.write(self.style.SUCCESS(
+            f"{deleted} blobs deleted ({freed / (1024 * 1024):.1f} MB freed), "
+            f"{orphans} orphan files deleted"
+        ))
+
+    def adopt(self):
+        adopted = duplicates = missing = 0
+        for file_obj in File.objects.filter(blob__isnull=True, is_deleted=False).exclude(file="").iterator():
+            # An earlier file with the same name may have taken it along
+            file_obj.refresh_from_db(fields=["blob", "file"])
+            if file_obj.blob_id:
+                continue
+            if not file_obj.file.storage.exists(file_obj.file.name):
+                missing += 1
+                continue
+            with transaction.atomic():
+                duplicates += adopt_file(file_obj)
+            adopted += 1
+        self.stdout.write(
+            f"{adopted} files moved into blobs ({duplicates} duplicates removed), "
+            f"{missing} files missing"
+        )
@@ -0,0 +1,69 @@
+"""
+Management command to render the resized copies of gallery images.
+
+Usage:
+    python manage.py generate_gallery_renditions [--edition ID] [--all] [--processes N]
+
+Renders the grid thumbnail, lightbox and full-size renditions, in WebP and
+JPEG (see dpms.compos.gallery_renditions), of the gallery images that do
+not have them yet, in a process pool. Uploads are rendered as they arrive;
+run it for images uploaded before renditions existed, or with --all after
+changing the sizes.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from dpms.compos.gallery_renditions import generate_renditions
+from dpms.compos.models import GalleryImage
+
+# Images handed to the pool at a time
+BATCH_SIZE = 200
+
+
+class Command(BaseCommand):
+    help = "Render the thumbnail and resized copies of gallery images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--edition",
+            type=int,
+            help="Only images of this edition",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Render again images that already have renditions",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            help="Rendering processes (default: CPU count)",
+        )
+
+    def handle(self, *args, **options):
+        images = GalleryImage.objects.filter(is_deleted=False).exclude(image="").order_by("id")
+        if options["edition"]:
+            images = images.filter(edition_id=options["edition"])
+        if not options["all"]:
+            images = images.filter(renditions={})
+
+        pks = list(images.values_list("pk", flat=True))
+        self.stdout.write(f"{len(pks)} images to render")
+
+        start = time.perf_counter()
+        rendered = failed = 0
+        for offset in range(0, len(pks), BATCH_SIZE):
+            batch = GalleryImage.objects.filter(pk__in=pks[offset:offset + BATCH_SIZE]).order_by("id")
+            done, errors = generate_renditions(batch, options["processes"])
+            rendered += done
+            failed += errors
+            self.stdout.write(f"  {rendered + failed}/{len(pks)}")
+        elapsed = time.perf_counter() - start
+
+        message = f"{rendered} images rendered in {elapsed:.1f}s"
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{message}, {failed} failed (see the log)"))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
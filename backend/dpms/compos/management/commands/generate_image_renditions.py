@@ -0,0 +1,109 @@
+"""
+Management command to render the resized copies of images.
+
+Usage:
+    python manage.py generate_image_renditions [--processes N] [--prune]
+
+Renders every missing rendition of the images of every ImageRenditionField
+(production screenshots, edition logos and posters, sponsor logos and
+StageRunner images, see dpms.utils.image_fields), in a process pool.
+Renditions are otherwise rendered when images are saved or first shown;
+run it after a deploy that adds or changes rendition sizes, or after
+importing productions, so no page waits for them.
+
+With --prune, rendition files that no current image uses (replaced or
+deleted images, old sizes) are deleted.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from dpms.utils.image_fields import RENDITIONS_DIR, rendition_fields, store_results
+from dpms.utils.renditions import render_batch
+
+# Images handed to the pool at a time
+BATCH_SIZE = 200
+
+
+class Command(BaseCommand):
+    help = "Render the missing resized copies of images and optionally delete unused ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            help="Rendering processes (default: CPU count)",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete rendition files no image uses",
+        )
+
+    def handle(self, *args, **options):
+        started = timezone.now()
+        start = time.perf_counter()
+        used = set()
+        pending = []
+        for model, field in rendition_fields():
+            names = (
+                model._default_manager.exclude(**{field.name: ""})
+                .exclude(**{f"{field.name}__isnull": True})
+                .values_list(field.name, flat=True)
+                .distinct()
+            )
+            missing = 0
+            for name in names:
+                image = field.attr_class(None, field, name)
+                used.update(
+                    rendition for renditions in image.rendition_names().values()
+                    for rendition in renditions.values()
+                )
+                if image.missing_renditions():
+                    pending.append((field, name))
+                    missing += 1
+            self.stdout.write(f"{model._meta.label}.{field.name}: {missing} images to render")
+
+        rendered = failed = 0
+        for offset in range(0, len(pending), BATCH_SIZE):
+            batch = pending[offset:offset + BATCH_SIZE]
+            jobs = [
+                (field.storage.path(name), list(field.renditions.items()), field.rendition_formats)
+                for field, name in batch
+            ]
+            for (field, name), (results, error) in zip(batch, render_batch(jobs, options["processes"])):
+                if error:
+                    self.stderr.write(f"  {name}: {error}")
+                    failed += 1
+                    continue
+                store_results(field.storage, name, field, results)
+                rendered += 1
+            self.stdout.write(f"  {rendered + failed}/{len(pending)}")
+
+        message = f"{rendered} images rendered in {time.perf_counter() - start:.1f}s"
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{message}, {failed} failed"))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
+
+        if options["prune"]:
+            self.stdout.write(f"{self.prune(used, started)} unused renditions deleted")
+
+    def prune(self, used, started):
+        """Delete the rendition files not in used, except those of images saved since started."""
+        storages = {field.storage for _, field in rendition_fields()}
+        deleted = 0
+        for storage in storages:
+            if not storage.exists(RENDITIONS_DIR):
+                continue
+            directories, _ = storage.listdir(RENDITIONS_DIR)
+            for directory in directories:
+                _, files = storage.listdir(f"{RENDITIONS_DIR}/{directory}")
+                for filename in files:
+                    name = f"{RENDITIONS_DIR}/{directory}/{filename}"
+                    if name not in used and storage.get_modified_time(name) < started:
+                        storage.delete(name)
+                        deleted += 1
+        return deleted
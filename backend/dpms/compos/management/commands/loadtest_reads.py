@@ -0,0 +1,142 @@
+"""
+Management command to load test the public read endpoints.
+
+Usage:
+    python manage.py loadtest_reads [--edition ID] [--requests 200] [--threads 8]
+
+Sends anonymous GET requests through the full Django stack from several
+threads (like gunicorn's gthread workers, one database connection each) to
+the endpoints hammered during a party:
+
+    /                                            landing page
+    /api/editions/<id>/
+    /api/voting-results/edition_results/?edition=<id>
+    /api/stagerunner-data/edition/<id>/
+    /api/stagerunner-data/compo/<has_compo_id>/
+    /api/stagerunner-data/results/<has_compo_id>/
+
+and compares two modes:
+
+    atomic      every request wrapped in a transaction, as ATOMIC_REQUESTS did
+    autocommit  reads run outside a transaction (AtomicWritesMixin)
+
+For each mode it reports throughput, median latency and how long each
+request kept its connection inside a transaction: the whole request when
+atomic, only the statements themselves in autocommit.
+
+It only reads, against the existing data of the edition (default: the
+latest one). Every request comes from a different client address so the
+anonymous throttle does not kick in.
+"""
+
+import itertools
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from dpms.compos.models import Edition, HasCompo
+
+
+class Command(BaseCommand):
+    help = "Load test the public read endpoints with and without a transaction per request"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--edition",
+            type=int,
+            help="Edition to read (default: the latest one)",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requests per thread and mode",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=8,
+            help="Concurrent client threads",
+        )
+
+    def handle(self, *args, **options):
+        editions = Edition.objects.order_by("-start_date", "-id")
+        if options["edition"]:
+            editions = editions.filter(pk=options["edition"])
+        edition = editions.first()
+        if edition is None:
+            raise CommandError("No edition to load test")
+
+        urls = self.get_urls(edition)
+        self.addresses = (f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in itertools.count(1))
+        self.lock = threading.Lock()
+        host = next(
+            (h.lstrip(".") for h in settings.ALLOWED_HOSTS if h not in ("*", "")), "localhost"
+        )
+
+        self.stdout.write(f"edition {edition.pk}: {len(urls)} endpoints")
+        self.stdout.write(
+            f"{'mode':>10} {'req/s':>8} {'median ms':>10} {'in tx ms/req':>13} {'errors':>7}"
+        )
+        for mode in ("atomic", "autocommit"):
+            self.run(mode, urls, host, options["requests"], options["threads"])
+
+    def get_urls(self, edition):
+        urls = [
+            "/",
+            f"/api/editions/{edition.pk}/",
+            f"/api/voting-results/edition_results/?edition={edition.pk}",
+            f"/api/stagerunner-data/edition/{edition.pk}/",
+        ]
+        has_compo = HasCompo.objects.filter(edition=edition).order_by("start", "id").first()
+        if has_compo:
+            urls += [
+                f"/api/stagerunner-data/compo/{has_compo.pk}/",
+                f"/api/stagerunner-data/results/{has_compo.pk}/",
+            ]
+        return urls
+
+    def run(self, mode, urls, host, count, threads):
+        def worker(_):
+            client = Client(SERVER_NAME=host)
+            timings, in_transaction, errors = [], 0.0, 0
+            with CaptureQueriesContext(connection) as queries:
+                for url in itertools.islice(itertools.cycle(urls), count):
+                    with self.lock:
+                        address = next(self.addresses)
+                    start = time.perf_counter()
+                    if mode == "atomic":
+                        with transaction.atomic():
+                            response = client.get(url, REMOTE_ADDR=address, secure=True)
+                    else:
+                        response = client.get(url, REMOTE_ADDR=address, secure=True)
+                    elapsed = time.perf_counter() - start
+                    timings.append(elapsed)
+                    if mode == "atomic":
+                        in_transaction += elapsed
+                    errors += response.status_code >= 400
+            if mode != "atomic":
+                in_transaction = sum(float(query["time"]) for query in queries)
+            connection.close()
+            return timings, in_transaction, errors
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            results = list(pool.map(worker, range(threads)))
+        elapsed = time.perf_counter() - start
+
+        timings = [timing for result in results for timing in result[0]]
+        in_transaction = sum(result[1] for result in results)
+        errors = sum(result[2] for result in results)
+        self.stdout.write(
+            f"{mode:>10} {len(timings) / elapsed:>8.0f} "
+            f"{statistics.median(timings) * 1000:>10.1f} "
+            f"{in_transaction * 1000 / len(timings):>13.2f} {errors:>7}"
+        )
@@ -0,0 +1,25 @@
+"""
+Management command to delete abandoned resumable uploads.
+
+Usage:
+    python manage.py purge_upload_sessions
+
+Deletes the upload sessions that got no chunk for
+UPLOAD_SESSION_EXPIRY_HOURS, finished or not, and the partial files of the
+assembly area left without a session (see dpms.compos.uploads). Run it
+periodically, e.g. hourly from cron.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dpms.compos.uploads import purge_expired
+
+
+class Command(BaseCommand):
+    help = "Delete expired resumable upload sessions and their partial files"
+
+    def handle(self, *args, **options):
+        sessions, files = purge_expired()
+        self.stdout.write(self.style.SUCCESS(
+            f"{sessions} expired upload sessions and {files} partial files deleted"
+        ))
@@ -0,0 +1,95 @@
+"""
+Management command to rebuild the per-production vote tallies.
+
+Usage:
+    python manage.py rebuild_tallies [--edition ID] [--check]
+
+Recomputes every ProductionTally from the raw votes and reports any drift
+between the stored tallies and the recomputed values. With --check nothing
+is written and the command exits with an error if drift is found.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from dpms.compos.models import Production, ProductionTally, Vote
+
+
+class Command(BaseCommand):
+    help = "Recompute ProductionTally rows from the raw votes and report drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--edition",
+            type=int,
+            help="Only rebuild tallies for this edition ID",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift, do not write anything",
+        )
+
+    def handle(self, *args, **options):
+        productions = Production.objects.all()
+        votes = Vote.objects.all()
+        if options["edition"]:
+            productions = productions.filter(edition_id=options["edition"])
+            votes = votes.filter(production__edition_id=options["edition"])
+
+        fields = ProductionTally.TOTAL_FIELDS + ProductionTally.HISTOGRAM_FIELDS
+        empty = {field: 0 for field in fields}
+
+        with transaction.atomic():
+            expected = ProductionTally.compute(votes)
+            stored = {
+                tally.production_id: tally
+                for tally in ProductionTally.objects.select_for_update().filter(
+                    production__in=productions
+                )
+            }
+
+            drifted = []
+            missing = []
+            for production_id in productions.values_list("id", flat=True):
+                values = expected.get(production_id, empty)
+                tally = stored.get(production_id)
+                if tally is None:
+                    if values != empty:
+                        missing.append(ProductionTally(production_id=production_id, **values))
+                    continue
+
+                diff = {
+                    field: (getattr(tally, field), values[field])
+                    for field in fields
+                    if getattr(tally, field) != values[field]
+                }
+                if diff:
+                    self.stdout.write(
+                        self.style.WARNING(f"Production {production_id}: {diff}")
+                    )
+                    for field, (_, value) in diff.items():
+                        setattr(tally, field, value)
+                    drifted.append(tally)
+
+            for tally in missing:
+                self.stdout.write(
+                    self.style.WARNING(f"Production {tally.production_id}: missing tally")
+                )
+
+            if options["check"]:
+                if drifted or missing:
+                    raise CommandError(
+                        f"{len(drifted)} tallies drifted, {len(missing)} missing"
+                    )
+                self.stdout.write(self.style.SUCCESS("All tallies are consistent"))
+                return
+
+            ProductionTally.objects.bulk_update(drifted, fields, batch_size=1000)
+            ProductionTally.objects.bulk_create(missing, batch_size=1000)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt tallies: {len(drifted)} fixed, {len(missing)} created"
+            )
+        )
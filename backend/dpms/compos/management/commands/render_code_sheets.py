@@ -0,0 +1,55 @@
+"""
+Management command to pre-render printable attendance code sheets.
+
+Usage:
+    python manage.py render_code_sheets [--edition ID] [--processes N]
+
+Renders the unused attendance codes of an edition (default: the latest one)
+as PDF sheets with QR codes, in a process pool, and stores them where the
+/api/attendance-codes/sheets/ endpoint serves them from, so the download is
+instant even for tens of thousands of codes. Run it after generating codes.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dpms.compos.code_sheets import build_sheets, get_sheet_codes, sheet_path
+from dpms.compos.models import Edition
+from dpms.utils.qr_sheets import PER_PAGE
+
+
+class Command(BaseCommand):
+    help = "Pre-render the printable QR sheets of the unused attendance codes of an edition"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--edition",
+            type=int,
+            help="Edition to render (default: the latest one)",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            help="Rendering processes (default: CPU count)",
+        )
+
+    def handle(self, *args, **options):
+        editions = Edition.objects.order_by("-start_date", "-id")
+        if options["edition"]:
+            editions = editions.filter(pk=options["edition"])
+        edition = editions.first()
+        if edition is None:
+            raise CommandError("No edition to render")
+
+        codes = get_sheet_codes(edition)
+        if not codes:
+            raise CommandError(f"Edition {edition.pk} has no unused codes")
+
+        start = time.perf_counter()
+        path = build_sheets(edition, codes, sheet_path(edition, codes), options["processes"])
+        elapsed = time.perf_counter() - start
+        pages = -(-len(codes) // PER_PAGE)
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(codes)} codes on {pages} pages in {elapsed:.1f}s: {path}"
+        ))
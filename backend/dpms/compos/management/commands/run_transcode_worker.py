@@ -0,0 +1,140 @@
+"""
+Management command to run the video transcoding worker.
+
+Usage:
+    python manage.py run_transcode_worker [--processes 1] [--poll 2] [--once]
+
+Claims queued TranscodeJobs (see dpms.compos.transcoding) and runs at most
+--processes ffmpeg conversions at a time, each supervised by its own thread
+and database connection. Several workers, on one or more hosts sharing the
+media storage, can run side by side: a job is claimed with a conditional
+UPDATE, so only one of them gets it.
+
+Jobs of a worker that stopped reporting are requeued after a while. On
+SIGTERM or SIGINT the worker kills its ffmpeg processes and puts their jobs
+back in the queue without counting the attempt.
+
+With --once it processes the jobs that are due and exits. Errors of a job
+or of the database are logged and the worker keeps going: the job is
+retried like a failed conversion, and the queue is checked again on the
+next poll.
+"""
+
+import logging
+import os
+import signal
+import socket
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection
+from django.db.models import F
+from django.utils import timezone
+
+from dpms.compos.models import TranscodeJob
+from dpms.compos.transcoding import run_job
+
+logger = logging.getLogger("dpms")
+
+
+class Command(BaseCommand):
+    help = "Run queued video conversions with a bounded number of ffmpeg processes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=settings.TRANSCODE_PROCESSES,
+            help="Concurrent ffmpeg processes",
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=2.0,
+            help="Seconds between checks for new jobs",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the jobs that are due and exit",
+        )
+
+    def handle(self, *args, **options):
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self.stop = threading.Event()
+        self.processes = {}
+        self.interrupted = set()
+        signal.signal(signal.SIGTERM, self.shutdown)
+        signal.signal(signal.SIGINT, self.shutdown)
+
+        slots = max(1, options["processes"])
+        self.stdout.write(f"transcode worker {self.name}: {slots} processes")
+
+        running = set()
+        with ThreadPoolExecutor(slots) as pool:
+            while not self.stop.is_set():
+                try:
+                    TranscodeJob.requeue_stale()
+                    for pk in TranscodeJob.next_due(limit=slots - len(running)):
+                        if TranscodeJob.claim(pk, self.name):
+                            self.stdout.write(f"job {pk}: started")
+                            running.add(pool.submit(self.run, pk))
+                except DatabaseError:
+                    # Database unavailable: try again on the next poll
+                    logger.exception("Transcode worker: checking the queue failed")
+                    connection.close()
+                    if options["once"] and not running:
+                        break
+
+                if options["once"] and not running:
+                    break
+                if running:
+                    done, running = wait(running, timeout=options["poll"], return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                else:
+                    self.stop.wait(options["poll"])
+
+        connection.close()
+
+    def run(self, pk):
+        try:
+            self.run_job(pk)
+        except TranscodeJob.DoesNotExist:
+            self.stdout.write(f"job {pk}: deleted")
+        except Exception as e:
+            # Anything run_job does not handle (e.g. a database error)
+            logger.exception(f"TranscodeJob {pk}: worker error")
+            self.stdout.write(f"job {pk}: error {e}")
+            try:
+                TranscodeJob.objects.get(pk=pk).fail(f"Worker error: {e}")
+            except Exception:
+                # Left running: requeued once its heartbeat is stale
+                logger.exception(f"TranscodeJob {pk}: recording the error failed")
+        finally:
+            connection.close()
+
+    def run_job(self, pk):
+        job = TranscodeJob.objects.get(pk=pk)
+        run_job(job, self.processes)
+        if pk in self.interrupted:
+            # Recorded as a failed attempt: give it back
+            TranscodeJob.objects.filter(pk=pk).exclude(status=TranscodeJob.STATUS_DONE).update(
+                status=TranscodeJob.STATUS_QUEUED,
+                attempts=F("attempts") - 1,
+                run_after=timezone.now(),
+                error="",
+            )
+            self.stdout.write(f"job {pk}: interrupted, requeued")
+            return
+        job.refresh_from_db(fields=["status", "progress", "error"])
+        self.stdout.write(f"job {pk}: {job.status} {job.error[:200]}".rstrip())
+
+    def shutdown(self, signum, frame):
+        self.stdout.write("stopping: interrupting running conversions")
+        self.stop.set()
+        for pk, process in list(self.processes.items()):
+            self.interrupted.add(pk)
+            process.kill()
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def populate_tallies(apps, schema_editor):
+    """Build the initial tallies from the existing votes."""
+    Vote = apps.get_model('compos', 'Vote')
+    ProductionTally = apps.get_model('compos', 'ProductionTally')
+
+    public = Q(is_jury_vote=False)
+    jury = Q(is_jury_vote=True)
+    aggregates = {
+        'public_count': Count('id', filter=public),
+        'public_sum': Sum('score', filter=public, default=0),
+        'jury_count': Count('id', filter=jury),
+        'jury_sum': Sum('score', filter=jury, default=0),
+    }
+    for score in range(1, 11):
+        aggregates[f'score_{score}'] = Count('id', filter=Q(score=score))
+
+    rows = Vote.objects.order_by().values('production_id').annotate(**aggregates)
+    ProductionTally.objects.bulk_create(
+        [ProductionTally(**row) for row in rows], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compos', '0034_add_attendance_and_edition_counter_toggle'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductionTally',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Date time on which the object was created', verbose_name='created at')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='Date time on which the object was modified', verbose_name='modified at')),
+                ('public_count', models.PositiveIntegerField(default=0)),
+                ('public_sum', models.PositiveIntegerField(default=0)),
+                ('jury_count', models.PositiveIntegerField(default=0)),
+                ('jury_sum', models.PositiveIntegerField(default=0)),
+                ('score_1', models.PositiveIntegerField(default=0)),
+                ('score_2', models.PositiveIntegerField(default=0)),
+                ('score_3', models.PositiveIntegerField(default=0)),
+                ('score_4', models.PositiveIntegerField(default=0)),
+                ('score_5', models.PositiveIntegerField(default=0)),
+                ('score_6', models.PositiveIntegerField(default=0)),
+                ('score_7', models.PositiveIntegerField(default=0)),
+                ('score_8', models.PositiveIntegerField(default=0)),
+                ('score_9', models.PositiveIntegerField(default=0)),
+                ('score_10', models.PositiveIntegerField(default=0)),
+                ('production', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='tally', to='compos.production', verbose_name='Producción')),
+            ],
+            options={
+                'verbose_name': 'Recuento de Votos',
+                'verbose_name_plural': 'Recuentos de Votos',
+            },
+        ),
+        migrations.RunPython(populate_tallies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compos', '0035_productiontally'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stagerunnerconfig',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Bumped on every change of the config or its content (used as ETag)'),
+        ),
+    ]
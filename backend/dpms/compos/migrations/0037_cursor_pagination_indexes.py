@@ -0,0 +1,59 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compos', '0036_stagerunnerconfig_revision'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['-created', 'id'], name='attendance_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['edition', '-created', 'id'], name='attendance_edition_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendeeverification',
+            index=models.Index(fields=['-created', 'id'], name='verification_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendeeverification',
+            index=models.Index(fields=['edition', '-created', 'id'], name='verification_edition_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(fields=['-created', 'id'], name='file_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(fields=['uploaded_by', '-created', 'id'], name='file_uploader_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['-created', 'id'], name='gallery_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['edition', '-created', 'id'], name='gallery_edition_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='production',
+            index=models.Index(fields=['-created', 'id'], name='production_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='production',
+            index=models.Index(fields=['edition', '-created', 'id'], name='production_edition_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['-created', 'id'], name='vote_created_idx'),
+        ),
+    ]
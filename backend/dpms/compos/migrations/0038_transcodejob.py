@@ -0,0 +1,44 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:28
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compos', '0037_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscodeJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Date time on which the object was created', verbose_name='created at')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='Date time on which the object was modified', verbose_name='modified at')),
+                ('content_hash', models.CharField(help_text='SHA-256 of the uploaded video', max_length=64, unique=True)),
+                ('source', models.CharField(help_text='Storage name of the uploaded video', max_length=255)),
+                ('output', models.CharField(blank=True, help_text='Storage name of the playable video once done', max_length=255)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('progress', models.PositiveSmallIntegerField(default=0, help_text='Percentage converted')),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, help_text='Not claimed before this time (retry backoff)')),
+                ('worker', models.CharField(blank=True, max_length=100)),
+                ('heartbeat', models.DateTimeField(blank=True, help_text='Last time the worker reported progress', null=True)),
+                ('error', models.TextField(blank=True)),
+            ],
+            options={
+                'ordering': ('-created', '-modified'),
+                'get_latest_by': 'created',
+                'abstract': False,
+                'indexes': [models.Index(fields=['status', 'run_after'], name='transcode_queue_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='slideelement',
+            name='transcode_job',
+            field=models.ForeignKey(blank=True, help_text='Conversion of the uploaded video to a playable format', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='elements', to='compos.transcodejob'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compos', '0038_transcodejob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryimage',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized copies by size: width, height and file per format'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:40
+
+import dpms.compos.models.edition
+import dpms.compos.models.productions
+import dpms.compos.models.sponsors
+import dpms.compos.models.stagerunner
+import dpms.utils.image_fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compos', '0039_galleryimage_renditions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='edition',
+            name='logo',
+            field=dpms.utils.image_fields.ImageRenditionField(blank=True, max_length=255, null=True, upload_to=dpms.compos.models.edition.edition_logo_upload_to, verbose_name='Logo'),
+        ),
+        migrations.AlterField(
+            model_name='edition',
+            name='poster',
+            field=dpms.utils.image_fields.ImageRenditionField(blank=True, max_length=255, null=True, upload_to=dpms.compos.models.edition.edition_poster_upload_to, verbose_name='Poster'),
+        ),
+        migrations.AlterField(
+            model_name='production',
+            name='screenshot',
+            field=dpms.utils.image_fields.ImageRenditionField(blank=True, null=True, upload_to=dpms.compos.models.productions.production_screenshot_path),
+        ),
+        migrations.AlterField(
+            model_name='slideelement',
+            name='image',
+            field=dpms.utils.image_fields.ImageRenditionField(blank=True, null=True, upload_to=dpms.compos.models.stagerunner.stagerunner_element_image_upload_to),
+        ),
+        migrations.AlterField(
+            model_name='sponsor',
+            name='logo',
+            field=dpms.utils.image_fields.ImageRenditionField(blank=True, max_length=255, null=True, upload_to=dpms.compos.models.sponsors.sponsor_logo_upload_to, verbose_name='Logo'),
+        ),
+        migrations.AlterField(
+            model_name='stageslide',
+            name='background_image',
+            field=dpms.utils.image_fields.ImageRenditionField(blank=True, help_text='Optional background image (overlays the effect)', null=True, upload_to=dpms.compos.models.stagerunner.stagerunner_background_upload_to),
+        ),
+    ]
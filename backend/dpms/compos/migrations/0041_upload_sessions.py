@@ -0,0 +1,42 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compos', '0040_image_rendition_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Date time on which the object was created', verbose_name='created at')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='Date time on which the object was modified', verbose_name='modified at')),
+                ('target', models.CharField(choices=[('file', 'File'), ('video', 'StageRunner video')], max_length=10)),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField(help_text='Total size in bytes')),
+                ('offset', models.PositiveBigIntegerField(default=0, help_text='Bytes received and verified')),
+                ('checksum', models.CharField(blank=True, help_text="Optional checksum of the whole file, 'algorithm base64-digest'", max_length=200)),
+                ('status', models.CharField(choices=[('uploading', 'Uploading'), ('complete', 'Complete')], default='uploading', max_length=10)),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('description', models.TextField(blank=True, default='')),
+                ('public', models.BooleanField(default=False)),
+                ('file', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='compos.file')),
+                ('slide_element', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to='compos.slideelement')),
+                ('uploaded_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('-created', '-modified'),
+                'get_latest_by': 'created',
+                'abstract': False,
+                'indexes': [models.Index(fields=['modified'], name='upload_session_modified_idx')],
+            },
+        ),
+    ]
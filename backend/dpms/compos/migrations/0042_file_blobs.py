@@ -0,0 +1,37 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compos', '0041_upload_sessions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Blob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Date time on which the object was created', verbose_name='created at')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='Date time on which the object was modified', verbose_name='modified at')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('name', models.CharField(help_text='Storage name', max_length=255)),
+                ('size', models.PositiveBigIntegerField()),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ('-created', '-modified'),
+                'get_latest_by': 'created',
+                'abstract': False,
+                'indexes': [models.Index(fields=['ref_count'], name='blob_ref_count_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='files', to='compos.blob'),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from .attendance import Attendance
 from .compos import Compo, HasCompo
 from .edition import Edition
-from .files import File
+from .files import Blob, File
 from .gallery import GalleryImage
 from .productions import Production
 from .sponsors import Sponsor
@@ -13,6 +13,8 @@ from .stagerunner import (
     PresentationSlide,
     StageControl,
 )
+from .transcoding import TranscodeJob
+from .uploads import UploadSession
 from .voting import (
     VotingConfiguration,
     AttendanceCode,
@@ -20,4 +22,5 @@ from .voting import (
     JuryMember,
     Vote,
     VotingPeriod,
+    ProductionTally,
 )
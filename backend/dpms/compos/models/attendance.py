@@ -68,6 +68,11 @@ class Attendance(BaseModel):
             ),
         ]
         ordering = ("-created",)
+        indexes = [
+            # Cursor pagination order, overall and per edition
+            models.Index(fields=["-created", "id"], name="attendance_created_idx"),
+            models.Index(fields=["edition", "-created", "id"], name="attendance_edition_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} → {self.edition}"
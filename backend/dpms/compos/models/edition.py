@@ -8,6 +8,7 @@ from django.contrib.auth import get_user_model
 from django.utils.text import slugify
 
 # Application models
+from dpms.utils.image_fields import ImageRenditionField
 from dpms.utils.models import BaseModel
 
 User = get_user_model()
@@ -41,19 +42,22 @@ class Edition(BaseModel):
     uploaded_by = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="editions"
     )
-    logo = models.ImageField(
+    logo = ImageRenditionField(
         "Logo",
         upload_to=edition_logo_upload_to,
         max_length=255,
         blank=True,
-        null=True
+        null=True,
+        renditions={"navbar": 400, "large": 1024},
+        rendition_formats=("webp", "png")
     )
-    poster = models.ImageField(
+    poster = ImageRenditionField(
         "Poster",
         upload_to=edition_poster_upload_to,
         max_length=255,
         blank=True,
-        null=True
+        null=True,
+        renditions={"thumb": 240, "hero": 1000}
     )
     logo_border_color = models.CharField(
         "Logo Border Color",
@@ -156,10 +160,12 @@ class Edition(BaseModel):
         # Close voting periods when productions are published
         if productions_public_changed:
             from dpms.compos.models.voting import VotingPeriod
+            from dpms.compos.period_index import invalidate_period_index
 
             VotingPeriod.objects.filter(
                 edition=self, is_active=True
             ).update(is_active=False)
+            invalidate_period_index()
 
     def __str__(self):
         return self.title
@@ -17,6 +17,9 @@ def production_file_upload_to(instance, filename):
     """
     Constructs the upload path for the file, based on the edition title and the compo name.
     Stores the original filename in the instance.
+
+    Uploads are now stored as blobs (see File.save); files uploaded before
+    keep the names built here.
     """
     # Store the original filename in the instance
     instance.original_filename = filename
@@ -43,6 +46,30 @@ def production_file_upload_to(instance, filename):
     return path
 
 
+class Blob(BaseModel):
+    """
+    Content of uploaded files, stored once.
+
+    Named after the SHA-256 of the content (see dpms.compos.blobs), so
+    re-uploading the same zip for every production update, or for several
+    entries, stores it once. File rows share blobs; ref_count is the
+    number of File rows not deleted that use each one, and blobs that
+    reach zero are deleted by ``manage.py collect_file_blobs``.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    name = models.CharField(max_length=255, help_text="Storage name")
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            models.Index(fields=['ref_count'], name='blob_ref_count_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.ref_count} refs)"
+
+
 class File(BaseModel):
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True, default='')
@@ -54,12 +81,51 @@ class File(BaseModel):
     file = models.FileField(
         "Files", upload_to=production_file_upload_to, max_length=255
     )
+    # Shared content of the file; files uploaded before blobs have none
+    blob = models.ForeignKey(
+        Blob, on_delete=models.SET_NULL, blank=True, null=True, related_name="files"
+    )
     public = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     is_deleted = models.BooleanField(default=False)
 
+    class Meta(BaseModel.Meta):
+        indexes = [
+            # Cursor pagination order, overall and per uploader
+            models.Index(fields=['-created', 'id'], name='file_created_idx'),
+            models.Index(fields=['uploaded_by', '-created', 'id'], name='file_uploader_created_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # New content is stored as a blob, or shares an identical one
+        replaced_blob_id = None
+        if self.file and not self.file._committed:
+            from dpms.compos.blobs import store_blob
+
+            replaced_blob_id = self.blob_id
+            content = self.file.file
+            self.original_filename = self.original_filename or os.path.basename(self.file.name)
+            self.blob = store_blob(
+                self.file.name,
+                content=content,
+                path=getattr(content, "temporary_file_path", lambda: None)(),
+            )
+            self.file.name = self.blob.name
+            self.file._committed = True
+        super().save(*args, **kwargs)
+        if replaced_blob_id and replaced_blob_id != self.blob_id and not self.is_deleted:
+            # The previous content lost this file's reference
+            from dpms.compos.blobs import release_blob
+            release_blob(replaced_blob_id)
+
     def delete(self, using=None, keep_parents=False):
-        self.file.storage.delete(self.file.name)
+        if self.blob_id:
+            # Other files may share the content: drop the reference only
+            if not self.is_deleted:
+                from dpms.compos.blobs import release_blob
+                release_blob(self.blob_id)
+        else:
+            self.file.storage.delete(self.file.name)
         super().delete()
 
     def get_download_filename(self):
@@ -63,6 +63,12 @@ class GalleryImage(BaseModel):
         blank=True,
         null=True
     )
+    renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Resized copies by size: width, height and file per format"
+    )
     public = models.BooleanField(default=True)
     is_active = models.BooleanField(default=True)
     is_deleted = models.BooleanField(default=False)
@@ -71,6 +77,11 @@ class GalleryImage(BaseModel):
         verbose_name = "Gallery Image"
         verbose_name_plural = "Gallery Images"
         ordering = ["-created"]
+        indexes = [
+            # Cursor pagination order, overall and per edition
+            models.Index(fields=["-created", "id"], name="gallery_created_idx"),
+            models.Index(fields=["edition", "-created", "id"], name="gallery_edition_created_idx"),
+        ]
 
     def __str__(self):
         return self.title or self.original_filename or f"Image {self.id}"
@@ -80,6 +91,10 @@ class GalleryImage(BaseModel):
             self.image.storage.delete(self.image.name)
         if self.thumbnail:
             self.thumbnail.storage.delete(self.thumbnail.name)
+        for rendition in self.renditions.values():
+            for name in rendition.values():
+                if isinstance(name, str):
+                    self.image.storage.delete(name)
         super().delete()
 
     def get_uploader_display_name(self):
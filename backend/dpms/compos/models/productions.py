@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 
+from dpms.utils.image_fields import ImageRenditionField
 from dpms.utils.models import BaseModel
 from dpms.compos.models import Compo, Edition
 
@@ -62,8 +63,9 @@ class Production(BaseModel):
         max_length=20, choices=PLATFORM_CHOICES, blank=True, default=''
     )
     release_date = models.DateField(null=True, blank=True)
-    screenshot = models.ImageField(
-        upload_to=production_screenshot_path, blank=True, null=True
+    screenshot = ImageRenditionField(
+        upload_to=production_screenshot_path, blank=True, null=True,
+        renditions={'thumb': 320, 'card': 800}
     )
     youtube_url = models.URLField(blank=True, default='')
     demozoo_url = models.URLField(blank=True, default='')
@@ -90,3 +92,10 @@ class Production(BaseModel):
         max_length=50, blank=True, default='',
         help_text="Score in competition results (from historical data)",
     )
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            # Cursor pagination order, overall and per edition
+            models.Index(fields=['-created', 'id'], name='production_created_idx'),
+            models.Index(fields=['edition', '-created', 'id'], name='production_edition_created_idx'),
+        ]
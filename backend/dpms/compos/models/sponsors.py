@@ -5,6 +5,7 @@ import uuid
 from django.db import models
 from django.utils.text import slugify
 
+from dpms.utils.image_fields import ImageRenditionField
 from dpms.utils.models import BaseModel
 
 
@@ -25,12 +26,14 @@ class Sponsor(BaseModel):
     Can be associated with multiple editions.
     """
     name = models.CharField(max_length=255)
-    logo = models.ImageField(
+    logo = ImageRenditionField(
         "Logo",
         upload_to=sponsor_logo_upload_to,
         max_length=255,
         blank=True,
-        null=True
+        null=True,
+        renditions={"small": 360, "large": 960},
+        rendition_formats=("webp", "png")
     )
     url = models.URLField(
         "Website URL",
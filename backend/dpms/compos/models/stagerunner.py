@@ -3,8 +3,10 @@
 import os
 import uuid
 from django.db import models
+from django.db.models import F
 from django.utils.text import slugify
 
+from dpms.utils.image_fields import ImageRenditionField
 from dpms.utils.models import BaseModel
 
 
@@ -81,6 +83,11 @@ class StageRunnerConfig(BaseModel):
         default=5000,
         help_text="Interval in ms for auto-advancing slides"
     )
+    revision = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Bumped on every change of the config or its content (used as ETag)"
+    )
 
     class Meta:
         verbose_name = "StageRunner Config"
@@ -89,6 +96,32 @@ class StageRunnerConfig(BaseModel):
     def __str__(self):
         return f"StageRunner Config for {self.edition.title}"
 
+    def save(self, *args, **kwargs):
+        # The revision is only changed by bump_revision: an instance loaded
+        # before a bump would write the old value back and reissue it
+        if not self._state.adding:
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                update_fields = [
+                    field.attname for field in self._meta.concrete_fields
+                    if not field.primary_key
+                ]
+            kwargs['update_fields'] = [
+                name for name in update_fields if name != 'revision'
+            ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def bump_revision(cls, *args, **lookup):
+        """
+        Increment the revision of the configs matching the given filters.
+
+        Done with a single UPDATE so concurrent changes never reuse a
+        revision. The signal handlers in dpms.compos.signals call it for
+        every model whose data ends up in the StageRunner responses.
+        """
+        return cls.objects.filter(*args, **lookup).update(revision=F('revision') + 1)
+
 
 class StageSlide(BaseModel):
     """
@@ -151,10 +184,12 @@ class StageSlide(BaseModel):
         choices=BACKGROUND_EFFECT_CHOICES,
         default='inherit'
     )
-    background_image = models.ImageField(
+    background_image = ImageRenditionField(
         upload_to=stagerunner_background_upload_to,
         blank=True,
         null=True,
+        renditions={'stage': 1920},
+        rendition_sync=True,
         help_text="Optional background image (overlays the effect)"
     )
     background_color = models.CharField(
@@ -318,16 +353,27 @@ class SlideElement(BaseModel):
         blank=True,
         help_text="Text content or URL"
     )
-    image = models.ImageField(
+    image = ImageRenditionField(
         upload_to=stagerunner_element_image_upload_to,
         blank=True,
-        null=True
+        null=True,
+        renditions={'stage': 1920},
+        rendition_formats=('webp', 'png'),
+        rendition_sync=True
     )
     video = models.FileField(
         upload_to=stagerunner_video_upload_to,
         blank=True,
         null=True
     )
+    transcode_job = models.ForeignKey(
+        'TranscodeJob',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='elements',
+        help_text="Conversion of the uploaded video to a playable format"
+    )
 
     # Styles (JSON: fontSize, fontFamily, color, textAlign, etc.)
     styles = models.JSONField(
@@ -398,12 +444,17 @@ class SlideElement(BaseModel):
         return f"{display_name} @ ({self.x:.0f}%, {self.y:.0f}%)"
 
     def delete(self, *args, **kwargs):
-        if self.video and self.video.storage.exists(self.video.name):
-            self.video.delete(save=False)
+        if self.video and not self._video_shared():
+            if self.video.storage.exists(self.video.name):
+                self.video.delete(save=False)
         if self.image and self.image.storage.exists(self.image.name):
             self.image.delete(save=False)
         super().delete(*args, **kwargs)
 
+    def _video_shared(self):
+        """Whether other elements play the same (deduplicated) video file."""
+        return SlideElement.objects.filter(video=self.video.name).exclude(pk=self.pk).exists()
+
     def save(self, *args, **kwargs):
         is_new_video = False
         if self.pk:
@@ -412,8 +463,9 @@ class SlideElement(BaseModel):
                 if self.video and str(self.video) != str(old.video):
                     is_new_video = True
                     # Delete old video file
-                    if old.video and old.video.storage.exists(old.video.name):
-                        old.video.delete(save=False)
+                    if old.video and not old._video_shared():
+                        if old.video.storage.exists(old.video.name):
+                            old.video.delete(save=False)
                 # Delete old image file when replaced
                 if self.image and old.image and str(self.image) != str(old.image):
                     if old.image.storage.exists(old.image.name):
@@ -426,76 +478,9 @@ class SlideElement(BaseModel):
         super().save(*args, **kwargs)
 
         if is_new_video and self.video:
-            import threading
-            logger = __import__('logging').getLogger('dpms')
-            logger.info(f"SlideElement {self.pk}: starting video conversion check")
-            thread = threading.Thread(
-                target=self._convert_video_if_needed,
-                daemon=True,
-            )
-            thread.start()
-
-    @staticmethod
-    def _do_convert(pk, video_field):
-        """Convert uploaded video to MP4 H.264 if not browser-compatible."""
-        import subprocess
-        import shutil
-        from django.conf import settings
-        logger = __import__('logging').getLogger('dpms')
-
-        video_path = os.path.join(str(settings.MEDIA_ROOT), str(video_field))
-        if not os.path.isfile(video_path):
-            logger.warning(f"SlideElement {pk}: video file not found: {video_path}")
-            return
-
-        # Check if already a browser-compatible format
-        try:
-            result = subprocess.run(
-                ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
-                 '-show_entries', 'format=format_name:stream=codec_name',
-                 '-of', 'csv=p=0', video_path],
-                capture_output=True, text=True, timeout=30,
-            )
-            output = result.stdout.strip()
-            logger.info(f"SlideElement {pk}: ffprobe output: {output}")
-            if any(codec in output for codec in ['h264', 'vp8', 'vp9', 'av1']):
-                logger.info(f"SlideElement {pk}: video already compatible")
-                return
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            logger.error(f"SlideElement {pk}: ffprobe failed: {e}")
-            return
-
-        # Convert to MP4 H.264
-        logger.info(f"SlideElement {pk}: converting to H.264...")
-        converted_path = video_path + '.converting.mp4'
-        try:
-            subprocess.run(
-                ['ffmpeg', '-y', '-i', video_path,
-                 '-c:v', 'libx264', '-preset', 'fast', '-crf', '23',
-                 '-c:a', 'aac', '-b:a', '128k',
-                 '-movflags', '+faststart',
-                 converted_path],
-                capture_output=True, timeout=3600,
-                check=True,
-            )
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-            logger.error(f"SlideElement {pk}: ffmpeg conversion failed: {e}")
-            if os.path.exists(converted_path):
-                os.remove(converted_path)
-            return
-
-        # Replace the original file
-        os.remove(video_path)
-        new_path = os.path.splitext(video_path)[0] + '.mp4'
-        shutil.move(converted_path, new_path)
-
-        # Update the model field without triggering save() again
-        new_relative = os.path.relpath(new_path, str(settings.MEDIA_ROOT))
-        SlideElement.objects.filter(pk=pk).update(video=new_relative)
-        logger.info(f"SlideElement {pk}: conversion complete -> {new_relative}")
-
-    def _convert_video_if_needed(self):
-        SlideElement._do_convert(self.pk, self.video)
+            # Converted by the run_transcode_worker command
+            from dpms.compos.transcoding import enqueue_transcode
+            enqueue_transcode(self)
 
 
 class StagePresentation(BaseModel):
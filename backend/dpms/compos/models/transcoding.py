@@ -0,0 +1,138 @@
+""" Video transcoding jobs """
+
+from datetime import timedelta
+
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+from dpms.utils.models import BaseModel
+
+
+class TranscodeJob(BaseModel):
+    """
+    Conversion of an uploaded video to a browser-compatible MP4.
+
+    Jobs are keyed by the SHA-256 of the uploaded file, so the same video
+    uploaded to several slide elements is converted once. They are run by
+    the ``run_transcode_worker`` management command, which claims queued
+    jobs, reports progress and retries failures with exponential backoff.
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    # Retries of a failing job, waiting RETRY_BACKOFF * 2^n between them
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF = timedelta(seconds=30)
+    # A running job whose worker has not reported for this long is requeued
+    STALE_AFTER = timedelta(minutes=5)
+
+    content_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="SHA-256 of the uploaded video"
+    )
+    source = models.CharField(
+        max_length=255,
+        help_text="Storage name of the uploaded video"
+    )
+    output = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Storage name of the playable video once done"
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_QUEUED
+    )
+    progress = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Percentage converted"
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_after = models.DateTimeField(
+        default=timezone.now,
+        help_text="Not claimed before this time (retry backoff)"
+    )
+    worker = models.CharField(max_length=100, blank=True)
+    heartbeat = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Last time the worker reported progress"
+    )
+    error = models.TextField(blank=True)
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='transcode_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.source} ({self.status}, {self.progress}%)"
+
+    @classmethod
+    def claim(cls, pk, worker):
+        """
+        Take a queued job for a worker.
+
+        A conditional UPDATE, so only one of several competing workers gets
+        it. Returns whether this worker did.
+        """
+        now = timezone.now()
+        return bool(cls.objects.filter(pk=pk, status=cls.STATUS_QUEUED).update(
+            status=cls.STATUS_RUNNING,
+            worker=worker,
+            heartbeat=now,
+            progress=0,
+            attempts=F('attempts') + 1,
+            modified=now,
+        ))
+
+    @classmethod
+    def next_due(cls, limit=10):
+        """Ids of the queued jobs whose backoff has expired, oldest first."""
+        return list(
+            cls.objects.filter(status=cls.STATUS_QUEUED, run_after__lte=timezone.now())
+            .order_by('run_after', 'id')
+            .values_list('pk', flat=True)[:limit]
+        )
+
+    @classmethod
+    def requeue_stale(cls):
+        """Give the jobs of workers that stopped reporting to another worker."""
+        now = timezone.now()
+        stale = cls.objects.filter(
+            status=cls.STATUS_RUNNING, heartbeat__lt=now - cls.STALE_AFTER
+        )
+        stale.filter(attempts__gte=cls.MAX_ATTEMPTS).update(
+            status=cls.STATUS_FAILED, error='Worker lost', modified=now
+        )
+        return stale.update(status=cls.STATUS_QUEUED, run_after=now, modified=now)
+
+    def report(self, progress):
+        """Save progress and prove the worker is alive."""
+        now = timezone.now()
+        TranscodeJob.objects.filter(pk=self.pk, status=self.STATUS_RUNNING).update(
+            progress=progress, heartbeat=now, modified=now
+        )
+
+    def fail(self, error, retry=True):
+        """Schedule a retry with backoff, or give up after MAX_ATTEMPTS."""
+        self.refresh_from_db(fields=['attempts'])
+        now = timezone.now()
+        if not retry or self.attempts >= self.MAX_ATTEMPTS:
+            self.status = self.STATUS_FAILED
+        else:
+            self.status = self.STATUS_QUEUED
+            self.run_after = now + self.RETRY_BACKOFF * 2 ** (self.attempts - 1)
+        self.error = error[-2000:]
+        self.save(update_fields=['status', 'run_after', 'error', 'modified'])
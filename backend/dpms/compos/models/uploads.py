@@ -0,0 +1,96 @@
+""" Resumable upload sessions """
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import models
+
+from dpms.utils.models import BaseModel
+
+User = get_user_model()
+
+
+class UploadSession(BaseModel):
+    """
+    File being uploaded in chunks.
+
+    Chunks are appended to a file of the upload assembly area (see
+    dpms.compos.uploads) at the session's offset, the only byte count the
+    server trusts: a lost connection costs at most one chunk and the
+    client resumes from the offset. Once complete, the session is
+    finalized into its target, a File or the video of a SlideElement.
+    """
+    TARGET_FILE = 'file'
+    TARGET_VIDEO = 'video'
+    TARGET_CHOICES = [
+        (TARGET_FILE, 'File'),
+        (TARGET_VIDEO, 'StageRunner video'),
+    ]
+
+    STATUS_UPLOADING = 'uploading'
+    STATUS_COMPLETE = 'complete'
+    STATUS_CHOICES = [
+        (STATUS_UPLOADING, 'Uploading'),
+        (STATUS_COMPLETE, 'Complete'),
+    ]
+
+    # Uploads a user may have in progress at once
+    MAX_ACTIVE = 10
+
+    uploaded_by = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='upload_sessions'
+    )
+    target = models.CharField(max_length=10, choices=TARGET_CHOICES)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField(help_text="Total size in bytes")
+    offset = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Bytes received and verified"
+    )
+    checksum = models.CharField(
+        max_length=200,
+        blank=True,
+        help_text="Optional checksum of the whole file, 'algorithm base64-digest'"
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_UPLOADING
+    )
+
+    # File target: metadata of the File to create
+    title = models.CharField(max_length=255, blank=True)
+    description = models.TextField(blank=True, default='')
+    public = models.BooleanField(default=False)
+
+    # Video target: element whose video is replaced
+    slide_element = models.ForeignKey(
+        'SlideElement',
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name='upload_sessions'
+    )
+
+    # Result, so a retried finalize gets the same answer
+    file = models.ForeignKey(
+        'File',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='+'
+    )
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            models.Index(fields=['modified'], name='upload_session_modified_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
+
+    @property
+    def expires(self):
+        """When the session is purged if no chunk arrives."""
+        return self.modified + timedelta(hours=settings.UPLOAD_SESSION_EXPIRY_HOURS)
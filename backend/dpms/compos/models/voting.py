@@ -8,23 +8,29 @@ This module contains all models related to the voting system including:
 - JuryMember: Manage jury members and their compo assignments
 - Vote: Store votes from users and jury members
 - VotingPeriod: Define when voting is open
+- ProductionTally: Running vote totals per production
 """
 
 # Django and Python libraries
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from django.db.models import Avg
+from django.db.models import Avg, Count, F, Q, Sum
 import random
 import string
+from collections import defaultdict
 
 # Application models
 from dpms.utils.models import BaseModel
 
 User = get_user_model()
 
+# Attendance codes: cryptographic RNG, so codes cannot be predicted
+CODE_ALPHABET = string.ascii_uppercase + string.digits
+code_rng = random.SystemRandom()
+
 
 class VotingConfiguration(BaseModel):
     """
@@ -125,6 +131,19 @@ class VotingConfiguration(BaseModel):
         public_avg = public_votes.aggregate(Avg("score"))["score__avg"] or 0
         jury_avg = jury_votes.aggregate(Avg("score"))["score__avg"] or 0
 
+        return self.weighted_score(public_avg, jury_avg)
+
+    def weighted_score(self, public_avg, jury_avg):
+        """
+        Combine public and jury averages according to the voting mode.
+
+        Args:
+            public_avg: Average public score (0 if no votes)
+            jury_avg: Average jury score (0 if no votes)
+
+        Returns:
+            float: Final calculated score
+        """
         if self.voting_mode == "public":
             return public_avg
         elif self.voting_mode == "jury":
@@ -162,6 +181,10 @@ class AttendanceCode(BaseModel):
     )
     notes = models.TextField(blank=True, verbose_name="Notas")
 
+    # Largest batch accepted by the generate endpoint
+    MAX_GENERATE = 50000
+    GENERATE_BATCH_SIZE = 5000
+
     class Meta:
         verbose_name = "Código de Asistencia"
         verbose_name_plural = "Códigos de Asistencia"
@@ -173,36 +196,30 @@ class AttendanceCode(BaseModel):
 
     def use_code(self, user):
         """
-        Mark code as used by a user.
+        Mark code as used by a user and verify their attendance.
 
         Args:
             user: User instance
 
         Raises:
-            ValidationError: If code is already used
+            ValidationError: If the code was used by somebody else or the
+                user is already verified for the edition
         """
-        if self.is_used:
-            raise ValidationError("Este código ya ha sido utilizado")
-
-        self.is_used = True
-        self.used_by = user
-        self.used_at = timezone.now()
-        self.save()
-
-        # Create attendee verification
-        AttendeeVerification.objects.create(
-            user=user,
-            edition=self.edition,
-            is_verified=True,
-            verification_method="code",
-            notes=f"Código: {self.code}",
-        )
+        from dpms.compos.redemption import redeem_code
+
+        redeem_code(self.code, user)
+        self.refresh_from_db(fields=["is_used", "used_by", "used_at", "modified"])
 
     @classmethod
     def generate_codes(cls, edition, quantity, prefix=None):
         """
         Generate a batch of attendance codes.
 
+        Codes are drawn in batches from the system's cryptographic RNG. Each
+        batch costs one query to discard codes that already exist and one
+        bulk insert; a batch that collides with a concurrent generator is
+        rolled back and drawn again.
+
         Args:
             edition: Edition instance
             quantity: Number of codes to generate
@@ -211,36 +228,30 @@ class AttendanceCode(BaseModel):
         Returns:
             list: List of created AttendanceCode instances
         """
-        if prefix is None:
+        if not prefix:
             # Use first 4 chars of edition title in uppercase
             prefix = edition.title[:4].upper().replace(" ", "")
 
-        codes = []
-        for _ in range(quantity):
-            # Generate unique code
-            while True:
-                random_part1 = "".join(
-                    random.choices(string.ascii_uppercase + string.digits, k=4)
-                )
-                random_part2 = "".join(
-                    random.choices(string.ascii_uppercase + string.digits, k=4)
-                )
-                code_string = f"{prefix}-{random_part1}-{random_part2}"
-
-                # Check if code already exists
-                if not cls.objects.filter(code=code_string).exists():
-                    break
+        created_codes = []
+        while len(created_codes) < quantity:
+            batch_size = min(quantity - len(created_codes), cls.GENERATE_BATCH_SIZE)
+            candidates = set()
+            while len(candidates) < batch_size:
+                part = "".join(code_rng.choices(CODE_ALPHABET, k=8))
+                candidates.add(f"{prefix}-{part[:4]}-{part[4:]}")
 
-            codes.append(
-                cls(
-                    code=code_string,
-                    edition=edition,
-                    is_used=False,
-                )
+            candidates -= set(
+                cls.objects.filter(code__in=candidates).values_list("code", flat=True)
             )
+            try:
+                with transaction.atomic():
+                    created_codes += cls.objects.bulk_create(
+                        [cls(code=code, edition=edition) for code in candidates]
+                    )
+            except IntegrityError:
+                # Another generator inserted one of them meanwhile
+                continue
 
-        # Bulk create for performance
-        created_codes = cls.objects.bulk_create(codes)
         return created_codes
 
 
@@ -292,19 +303,31 @@ class AttendeeVerification(BaseModel):
         verbose_name = "Verificación de Asistente"
         verbose_name_plural = "Verificaciones de Asistentes"
         unique_together = ["user", "edition"]
+        indexes = [
+            # Cursor pagination order, overall and per edition
+            models.Index(fields=["-created", "id"], name="verification_created_idx"),
+            models.Index(fields=["edition", "-created", "id"], name="verification_edition_idx"),
+        ]
 
     def __str__(self):
         status = "Verificado" if self.is_verified else "Pendiente"
         return f"{self.user.email} - {self.edition.title} ({status})"
 
-    def can_vote(self):
+    def can_vote(self, voter_context=None):
         """
         Check if attendee can vote.
 
+        Args:
+            voter_context: VoterContext of the attendee, to skip loading
+                the voting configuration
+
         Returns:
             bool: True if attendee can vote
         """
-        config = self.edition.voting_config
+        if voter_context is not None:
+            config = voter_context.config
+        else:
+            config = self.edition.voting_config
 
         if config.access_mode == "open":
             # In open mode, all verified attendees can vote during voting period
@@ -353,16 +376,21 @@ class JuryMember(BaseModel):
     def __str__(self):
         return f"{self.user.email} - Jurado {self.edition.title}"
 
-    def can_vote_in_compo(self, compo):
+    def can_vote_in_compo(self, compo, voter_context=None):
         """
         Check if jury member can vote in a specific compo.
 
         Args:
             compo: Compo instance
+            voter_context: VoterContext of the jury member, to answer from
+                its compo ids instead of querying
 
         Returns:
             bool: True if can vote in this compo
         """
+        if voter_context is not None:
+            return voter_context.can_vote_in_compo(compo.id)
+
         # If no compos assigned, can vote in all
         if not self.compos.exists():
             return True
@@ -379,10 +407,9 @@ class JuryMember(BaseModel):
         """
         from .productions import Production
 
-        # Get compos this jury member can vote in
-        if self.compos.exists():
-            compos = self.compos.all()
-        else:
+        # Get compos this jury member can vote in (uses prefetched compos)
+        compos = list(self.compos.all())
+        if not compos:
             # Can vote in all compos of the edition
             from .compos import Compo
 
@@ -445,6 +472,8 @@ class Vote(BaseModel):
         ordering = ["-created"]
         indexes = [
             models.Index(fields=["production", "is_jury_vote"]),
+            # Cursor pagination order
+            models.Index(fields=["-created", "id"], name="vote_created_idx"),
         ]
 
     def __str__(self):
@@ -453,64 +482,65 @@ class Vote(BaseModel):
             f"{self.user.email} → {self.production.title}: {self.score}/10 ({vote_type})"
         )
 
-    def clean(self):
-        """Business validations"""
-        edition = self.production.edition
-
-        # Check voting configuration exists
-        if not hasattr(edition, "voting_config"):
-            raise ValidationError("La edición no tiene configuración de votación")
-
-        config = edition.voting_config
-
-        # Check voting period
-        voting_period = VotingPeriod.objects.filter(
-            edition=edition, is_active=True
-        ).first()
+    def clean(self, voter_context=None):
+        """
+        Business validations.
 
-        if not voting_period or not voting_period.is_open():
-            raise ValidationError("El período de votación no está abierto")
+        Args:
+            voter_context: VoterContext of the user in the production's
+                edition (built if not given)
+        """
+        if voter_context is None:
+            from dpms.compos.voter_context import get_voter_context
 
-        # Check voting mode
-        if config.voting_mode == "jury" and not self.is_jury_vote:
-            raise ValidationError("Esta edición solo acepta votos del jurado")
+            voter_context = get_voter_context(self.user, self.production.edition_id)
 
-        # If jury vote, verify user is jury member
-        if self.is_jury_vote:
-            jury_member = JuryMember.objects.filter(
-                user=self.user, edition=edition
-            ).first()
+        # Same auto-detection as save(), so jury votes are validated as such
+        if not self.pk and voter_context.is_jury:
+            self.is_jury_vote = True
 
-            if not jury_member:
-                raise ValidationError(
-                    "El usuario no es miembro del jurado de esta edición"
-                )
+        error = voter_context.check_vote(self.production, self.is_jury_vote)
+        if error:
+            raise ValidationError(error)
 
-            if not jury_member.can_vote_in_compo(self.production.compo):
-                raise ValidationError(
-                    f"El jurado no está asignado a la compo {self.production.compo.name}"
-                )
-
-        # If public vote, verify access based on mode
-        if not self.is_jury_vote and config.access_mode != "open":
-            verification = AttendeeVerification.objects.filter(
-                user=self.user, edition=edition, is_verified=True
-            ).first()
-
-            if not verification:
-                raise ValidationError("El usuario no está verificado como asistente")
+    def save(self, *args, voter_context=None, **kwargs):
+        """
+        Auto-detect if jury vote and keep the production tally in sync.
 
-    def save(self, *args, **kwargs):
-        """Auto-detect if jury vote"""
+        Args:
+            voter_context: VoterContext of the user, to skip the jury lookup
+        """
         if not self.pk:  # Only on creation
-            is_jury = JuryMember.objects.filter(
-                user=self.user, edition=self.production.edition
-            ).exists()
+            if voter_context is not None:
+                is_jury = voter_context.is_jury
+            else:
+                is_jury = JuryMember.objects.filter(
+                    user_id=self.user_id, edition_id=self.production.edition_id
+                ).exists()
 
             if is_jury:
                 self.is_jury_vote = True
 
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            # Same lock as submit_ballot: concurrent saves of the user's votes
+            # wait here, so each one reads the score the previous one wrote
+            list(User.objects.select_for_update().filter(pk=self.user_id).values_list("pk"))
+
+            previous = None
+            if self.pk:
+                previous = (
+                    Vote.objects.filter(pk=self.pk)
+                    .values_list("production_id", "is_jury_vote", "score")
+                    .first()
+                )
+
+            super().save(*args, **kwargs)
+
+            if previous:
+                ProductionTally.apply(*previous, sign=-1)
+            ProductionTally.apply(
+                self.production_id, self.is_jury_vote, self.score, sign=1
+            )
 
 
 class VotingPeriod(BaseModel):
@@ -562,3 +592,168 @@ class VotingPeriod(BaseModel):
             raise ValidationError(
                 "La fecha de fin debe ser posterior a la fecha de inicio"
             )
+
+
+class ProductionTally(BaseModel):
+    """
+    Running vote totals for a production.
+
+    Maintained incrementally by Vote.save and the Vote post_delete signal so
+    results can be read without aggregating the raw votes. Use the
+    `rebuild_tallies` management command to recompute it from scratch.
+    """
+
+    production = models.OneToOneField(
+        "Production",
+        on_delete=models.CASCADE,
+        related_name="tally",
+        verbose_name="Producción",
+    )
+    public_count = models.PositiveIntegerField(default=0)
+    public_sum = models.PositiveIntegerField(default=0)
+    jury_count = models.PositiveIntegerField(default=0)
+    jury_sum = models.PositiveIntegerField(default=0)
+
+    # Score histogram (public + jury)
+    score_1 = models.PositiveIntegerField(default=0)
+    score_2 = models.PositiveIntegerField(default=0)
+    score_3 = models.PositiveIntegerField(default=0)
+    score_4 = models.PositiveIntegerField(default=0)
+    score_5 = models.PositiveIntegerField(default=0)
+    score_6 = models.PositiveIntegerField(default=0)
+    score_7 = models.PositiveIntegerField(default=0)
+    score_8 = models.PositiveIntegerField(default=0)
+    score_9 = models.PositiveIntegerField(default=0)
+    score_10 = models.PositiveIntegerField(default=0)
+
+    TOTAL_FIELDS = ["public_count", "public_sum", "jury_count", "jury_sum"]
+    HISTOGRAM_FIELDS = [f"score_{score}" for score in range(1, 11)]
+
+    class Meta:
+        verbose_name = "Recuento de Votos"
+        verbose_name_plural = "Recuentos de Votos"
+
+    def __str__(self):
+        return f"{self.production_id}: {self.total_count} votos"
+
+    @property
+    def total_count(self):
+        return self.public_count + self.jury_count
+
+    @property
+    def total_sum(self):
+        return self.public_sum + self.jury_sum
+
+    @property
+    def public_avg(self):
+        return self.public_sum / self.public_count if self.public_count else 0
+
+    @property
+    def jury_avg(self):
+        return self.jury_sum / self.jury_count if self.jury_count else 0
+
+    @property
+    def average(self):
+        return self.total_sum / self.total_count if self.total_count else 0
+
+    @property
+    def histogram(self):
+        """Votes per score, as {score: count}."""
+        return {
+            score: getattr(self, f"score_{score}") for score in range(1, 11)
+        }
+
+    @classmethod
+    def apply(cls, production_id, is_jury_vote, score, sign=1):
+        """
+        Add (sign=1) or remove (sign=-1) a vote from a production tally.
+
+        The update is a single UPDATE with F-expressions, so concurrent votes
+        on the same production never lose increments.
+        """
+        prefix = "jury" if is_jury_vote else "public"
+        changes = {
+            f"{prefix}_count": F(f"{prefix}_count") + sign,
+            f"{prefix}_sum": F(f"{prefix}_sum") + sign * score,
+        }
+        if 1 <= score <= 10:
+            changes[f"score_{score}"] = F(f"score_{score}") + sign
+
+        with transaction.atomic():
+            if cls.objects.filter(production_id=production_id).update(**changes):
+                return
+            if sign < 0:
+                # Nothing to remove from; rebuild_tallies will fix any drift
+                return
+            try:
+                with transaction.atomic():
+                    cls.objects.create(production_id=production_id)
+            except IntegrityError:
+                # Created concurrently by another vote
+                pass
+            cls.objects.filter(production_id=production_id).update(**changes)
+
+    @classmethod
+    def apply_many(cls, changes):
+        """
+        Apply many vote changes at once (for bulk writes that bypass Vote.save).
+
+        The affected tallies are created if missing, locked in production
+        order and written back with a single bulk_update.
+
+        Args:
+            changes: Iterable of (production_id, is_jury_vote, score, sign)
+        """
+        deltas = {}
+        for production_id, is_jury_vote, score, sign in changes:
+            delta = deltas.setdefault(production_id, defaultdict(int))
+            prefix = "jury" if is_jury_vote else "public"
+            delta[f"{prefix}_count"] += sign
+            delta[f"{prefix}_sum"] += sign * score
+            if 1 <= score <= 10:
+                delta[f"score_{score}"] += sign
+
+        if not deltas:
+            return
+
+        with transaction.atomic():
+            cls.objects.bulk_create(
+                [cls(production_id=production_id) for production_id in deltas],
+                ignore_conflicts=True,
+            )
+            tallies = list(
+                cls.objects.select_for_update()
+                .filter(production_id__in=deltas)
+                .order_by("production_id")
+            )
+            fields = set()
+            for tally in tallies:
+                for field, value in deltas[tally.production_id].items():
+                    setattr(tally, field, max(0, getattr(tally, field) + value))
+                    fields.add(field)
+            cls.objects.bulk_update(tallies, fields)
+
+    @classmethod
+    def compute(cls, votes):
+        """
+        Aggregate raw votes into tally values per production.
+
+        Args:
+            votes: Vote queryset
+
+        Returns:
+            dict: {production_id: {field: value}}
+        """
+        public = Q(is_jury_vote=False)
+        jury = Q(is_jury_vote=True)
+        aggregates = {
+            "public_count": Count("id", filter=public),
+            "public_sum": Sum("score", filter=public, default=0),
+            "jury_count": Count("id", filter=jury),
+            "jury_sum": Sum("score", filter=jury, default=0),
+        }
+        for score in range(1, 11):
+            aggregates[f"score_{score}"] = Count("id", filter=Q(score=score))
+
+        rows = votes.order_by().values("production_id").annotate(**aggregates)
+        return {row.pop("production_id"): row for row in rows}
@@ -0,0 +1,171 @@
+"""
+In-memory index of the active voting periods.
+
+Every active VotingPeriod is loaded once into a PeriodIndex per edition,
+which maps each compo with its own periods (and ``None`` for the
+edition-wide ones) to a sorted list of merged intervals. Whether voting is
+open for a production is then a binary search, without touching the
+database.
+
+A compo with periods of its own follows them; every other compo follows
+the edition-wide periods. The indexes of all editions are kept together in
+the Django cache and rebuilt after any period changes (see
+dpms.compos.signals and Edition.save).
+"""
+
+# Utilities
+from bisect import bisect_right
+
+# Django
+from django.utils import timezone
+
+# Application models
+from dpms.compos.models import VotingPeriod
+
+# Utilities
+from dpms.utils.cache import CacheNamespace
+
+indexes_cache = CacheNamespace("voting-period-index")
+
+# Seconds the indexes are kept; periods open and close by themselves, so
+# this only bounds how long an unnoticed change could go unseen
+CACHE_TIMEOUT = 60 * 60
+
+
+class IntervalSet:
+    """Sorted, non-overlapping [start, end] intervals."""
+
+    def __init__(self, intervals):
+        starts, ends = [], []
+        for start, end in sorted(intervals):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self.starts = starts
+        self.ends = ends
+
+    def status(self, now):
+        """
+        Locate ``now`` among the intervals.
+
+        Returns:
+            tuple: (is_open, closes_at, opens_at); closes_at is the end of
+            the open interval, opens_at the start of the next one
+        """
+        i = bisect_right(self.starts, now) - 1
+        is_open = i >= 0 and now <= self.ends[i]
+        closes_at = self.ends[i] if is_open else None
+        opens_at = self.starts[i + 1] if i + 1 < len(self.starts) else None
+        return is_open, closes_at, opens_at
+
+
+EMPTY = IntervalSet([])
+
+
+class PeriodIndex:
+    """
+    Active voting periods of an edition.
+
+    Attributes:
+        edition_id: Edition id
+        intervals: Dict of compo id (None = edition-wide) to IntervalSet
+        periods: Periods as (compo_id, start, end, data), where data is
+            the serialized period used for listings
+    """
+
+    def __init__(self, edition_id, periods=()):
+        by_compo = {}
+        for compo_id, start, end, data in periods:
+            by_compo.setdefault(compo_id, []).append((start, end))
+        self.edition_id = edition_id
+        self.intervals = {
+            compo_id: IntervalSet(intervals) for compo_id, intervals in by_compo.items()
+        }
+        self.periods = list(periods)
+
+    def intervals_for(self, compo_id=None):
+        """Intervals that apply to a compo (or to the whole edition)."""
+        if compo_id in self.intervals:
+            return self.intervals[compo_id]
+        return self.intervals.get(None, EMPTY)
+
+    def is_open(self, compo_id=None, now=None):
+        """Whether voting is open for a compo (or edition-wide) at ``now``."""
+        return self.intervals_for(compo_id).status(now or timezone.now())[0]
+
+    def status(self, compo_id=None, now=None):
+        """Open state of a compo as a dict (see IntervalSet.status)."""
+        is_open, closes_at, opens_at = self.intervals_for(compo_id).status(
+            now or timezone.now()
+        )
+        return {"is_open": is_open, "closes_at": closes_at, "opens_at": opens_at}
+
+    def open_periods(self, now=None):
+        """Serialized periods open at ``now``."""
+        now = now or timezone.now()
+        return [
+            {**data, "is_open": True}
+            for compo_id, start, end, data in self.periods
+            if start <= now <= end
+        ]
+
+
+def build_period_indexes():
+    """Load every active voting period into a PeriodIndex per edition."""
+    # Local import: the serializers validate votes through this module
+    from dpms.compos.serializers import VotingPeriodSerializer
+
+    periods = (
+        VotingPeriod.objects.filter(is_active=True)
+        .select_related("edition", "compo")
+        .order_by("-start_date")
+    )
+
+    by_edition = {}
+    for period in periods:
+        by_edition.setdefault(period.edition_id, []).append((
+            period.compo_id,
+            period.start_date,
+            period.end_date,
+            dict(VotingPeriodSerializer(period).data),
+        ))
+
+    return {
+        edition_id: PeriodIndex(edition_id, edition_periods)
+        for edition_id, edition_periods in by_edition.items()
+    }
+
+
+def get_period_indexes():
+    """
+    Return the PeriodIndex of every edition with active periods.
+
+    Returns:
+        dict: Edition id to PeriodIndex
+    """
+    indexes = indexes_cache.get("all")
+    if indexes is None:
+        indexes = build_period_indexes()
+        indexes_cache.set("all", indexes, CACHE_TIMEOUT)
+    return indexes
+
+
+def get_period_index(edition):
+    """
+    Return the PeriodIndex of an edition.
+
+    Args:
+        edition: Edition instance or id
+
+    Returns:
+        PeriodIndex: Empty (always closed) if the edition has no active periods
+    """
+    edition_id = getattr(edition, "pk", edition)
+    return get_period_indexes().get(edition_id) or PeriodIndex(edition_id)
+
+
+def invalidate_period_index():
+    """Rebuild the indexes on next use, once the current transaction commits."""
+    indexes_cache.invalidate()
@@ -2,6 +2,8 @@
 
 from rest_framework import permissions
 
+from dpms.users.roles import is_dpms_admin
+
 
 class IsAdminOrReadOnly(permissions.BasePermission):
     """
@@ -15,7 +17,7 @@ class IsAdminOrReadOnly(permissions.BasePermission):
             return True
 
         # Write permissions only for authenticated users who are admins
-        return request.user and request.user.is_authenticated and request.user.groups.filter(name='DPMS Admins').exists()
+        return is_dpms_admin(request.user)
 
 
 class IsOwnerOrAdmin(permissions.BasePermission):
@@ -29,7 +31,7 @@ class IsOwnerOrAdmin(permissions.BasePermission):
             return True
 
         # Check if user is admin
-        if request.user.groups.filter(name='DPMS Admins').exists():
+        if is_dpms_admin(request.user):
             return True
 
         # Check if user is the owner
@@ -62,8 +64,4 @@ class IsAdminUser(permissions.BasePermission):
     """
 
     def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.groups.filter(name='DPMS Admins').exists()
-        )
+        return is_dpms_admin(request.user)
@@ -0,0 +1,109 @@
+"""
+Attendance code redemption.
+
+Redeeming a code is a single conditional UPDATE ... RETURNING that only
+matches a code nobody has used yet (or one the same user already redeemed)
+followed by an upsert of the user's AttendeeVerification, both in one
+transaction. The database arbitrates concurrent redemptions of the same
+code: the row lock makes the second UPDATE re-check its condition, so
+exactly one user gets the code and nothing has to be locked beforehand.
+
+Re-entering your own code succeeds again without changing anything, and a
+user who is already verified for the edition does not use up a new code.
+"""
+
+# Django
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.utils import timezone
+
+# Application models
+from dpms.compos.models import AttendanceCode, AttendeeVerification
+from dpms.compos.voter_context import invalidate_voter_context
+
+code_table = AttendanceCode._meta.db_table
+verification_table = AttendeeVerification._meta.db_table
+
+REDEEM_SQL = f"""
+    UPDATE {code_table}
+    SET is_used = %(true)s, used_by_id = %(user)s,
+        used_at = COALESCE(used_at, %(now)s), modified = %(now)s
+    WHERE code = %(code)s AND (
+        used_by_id = %(user)s
+        OR (is_used = %(false)s AND NOT EXISTS (
+            SELECT 1 FROM {verification_table} v
+            WHERE v.user_id = %(user)s AND v.edition_id = {code_table}.edition_id
+                AND v.is_verified = %(true)s
+        ))
+    )
+    RETURNING edition_id, used_at = %(now)s
+"""
+
+
+def redeem_code(code, user):
+    """
+    Use an attendance code to verify the attendance of a user.
+
+    Args:
+        code: Code string
+        user: User redeeming it
+
+    Returns:
+        tuple: (edition id, False if the user had already redeemed it)
+
+    Raises:
+        AttendanceCode.DoesNotExist: If the code does not exist
+        ValidationError: If somebody else used the code, or the user is
+            already verified for its edition
+    """
+    params = {
+        "code": code,
+        "user": user.pk,
+        "now": connection.ops.adapt_datetimefield_value(timezone.now()),
+        "true": True,
+        "false": False,
+    }
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(REDEEM_SQL, params)
+            row = cursor.fetchone()
+
+        if row is None:
+            raise redemption_error(code)
+
+        edition_id, redeemed = row
+        verification = AttendeeVerification(
+            user=user,
+            edition_id=edition_id,
+            is_verified=True,
+            verified_at=timezone.now(),
+            verification_method="code",
+            notes=f"Código: {code}",
+        )
+        if redeemed:
+            # Verifies a pending row too
+            AttendeeVerification.objects.bulk_create(
+                [verification],
+                update_conflicts=True,
+                unique_fields=["user", "edition"],
+                update_fields=[
+                    "is_verified", "verified_at", "verification_method", "notes", "modified",
+                ],
+            )
+        else:
+            # Re-entered code: only restore a verification deleted since
+            AttendeeVerification.objects.bulk_create([verification], ignore_conflicts=True)
+        # bulk_create does not send post_save
+        invalidate_voter_context(edition_id, user.pk)
+
+    return edition_id, bool(redeemed)
+
+
+def redemption_error(code):
+    """Why a code could not be redeemed (only read when redemption fails)."""
+    attendance_code = AttendanceCode.objects.filter(code=code).values("is_used").first()
+    if attendance_code is None:
+        return AttendanceCode.DoesNotExist("Código no válido")
+    if attendance_code["is_used"]:
+        return ValidationError("Este código ya ha sido utilizado")
+    return ValidationError("Ya estás verificado como asistente de esta edición")
@@ -0,0 +1,107 @@
+"""
+Voting results engine.
+
+Computes the live results of an edition with a single query: public/jury
+counts and score sums for every production are read from its
+ProductionTally, and the public/jury/mixed weighting and the per-compo
+rankings are applied in Python.
+"""
+
+# Django
+from django.db.models import F
+from django.db.models.functions import Coalesce
+
+# Application models
+from dpms.compos.models import Production
+
+
+def production_scores(edition):
+    """
+    Return every production of an edition annotated with its vote totals.
+
+    Each production carries ``public_votes``, ``public_sum``, ``jury_votes``
+    and ``jury_sum`` taken from its tally (0 when it has no votes yet).
+    Everything is resolved in one query, compo included.
+
+    Args:
+        edition: Edition instance or id
+
+    Returns:
+        QuerySet: Annotated productions, newest first
+    """
+    return (
+        Production.objects.filter(edition=edition)
+        .select_related("compo")
+        .annotate(
+            public_votes=Coalesce(F("tally__public_count"), 0),
+            public_sum=Coalesce(F("tally__public_sum"), 0),
+            jury_votes=Coalesce(F("tally__jury_count"), 0),
+            jury_sum=Coalesce(F("tally__jury_sum"), 0),
+        )
+        .order_by("-created", "-modified")
+    )
+
+
+def rank_by_compo(results):
+    """
+    Sort results by final score and rank them inside each compo.
+
+    The ``ranking`` of every result is its position within its compo.
+
+    Args:
+        results: List of result dicts with ``final_score`` and ``compo_name``
+
+    Returns:
+        dict: Results grouped by compo name, best first
+    """
+    results.sort(key=lambda x: x["final_score"], reverse=True)
+
+    results_by_compo = {}
+    for result in results:
+        results_by_compo.setdefault(result["compo_name"], []).append(result)
+
+    for compo_results in results_by_compo.values():
+        for i, result in enumerate(compo_results, 1):
+            result["ranking"] = i
+
+    return results_by_compo
+
+
+def edition_results(edition, config):
+    """
+    Compute the live voting results of an edition.
+
+    Args:
+        edition: Edition instance
+        config: VotingConfiguration of the edition
+
+    Returns:
+        tuple: (results_by_compo, all_results)
+    """
+    results = []
+    for production in production_scores(edition):
+        public_avg = (
+            production.public_sum / production.public_votes
+            if production.public_votes else 0
+        )
+        jury_avg = (
+            production.jury_sum / production.jury_votes
+            if production.jury_votes else 0
+        )
+        final_score = config.weighted_score(public_avg, jury_avg)
+
+        results.append({
+            "production_id": production.id,
+            "production_title": production.title,
+            "production_authors": production.authors,
+            "compo_name": production.compo.name,
+            "total_votes": production.public_votes + production.jury_votes,
+            "public_votes": production.public_votes,
+            "jury_votes": production.jury_votes,
+            "public_avg_score": round(public_avg, 2),
+            "jury_avg_score": round(jury_avg, 2),
+            "final_score": round(final_score, 2),
+        })
+
+    results_by_compo = rank_by_compo(results)
+    return results_by_compo, results
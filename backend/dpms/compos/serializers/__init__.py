@@ -19,6 +19,7 @@ from .stagerunner import (
     StageSlideDetailSerializer,
     SlideElementSerializer,
     SlideElementInlineSerializer,
+    TranscodeJobSerializer,
     StagePresentationSerializer,
     StagePresentationListSerializer,
     StagePresentationDetailSerializer,
@@ -34,6 +35,7 @@ from .stagerunner import (
     SponsorForStageSerializer,
     CreateFromTemplateSerializer,
 )
+from .uploads import UploadSessionSerializer
 from .voting import (
     VotingConfigurationSerializer,
     AttendanceCodeSerializer,
@@ -41,10 +43,13 @@ from .voting import (
     AttendanceCodeUseSerializer,
     AttendeeVerificationSerializer,
     AttendeeVerificationCreateSerializer,
+    CheckinScanSerializer,
+    CheckinSerializer,
     JuryMemberSerializer,
     JuryMemberCreateSerializer,
     VoteSerializer,
     VoteCreateSerializer,
+    VoteBatchItemSerializer,
     VotingPeriodSerializer,
     VotingResultsSerializer,
     VotingStatsSerializer,
@@ -81,6 +86,7 @@ __all__ = [
     'StageSlideDetailSerializer',
     'SlideElementSerializer',
     'SlideElementInlineSerializer',
+    'TranscodeJobSerializer',
     'StagePresentationSerializer',
     'StagePresentationListSerializer',
     'StagePresentationDetailSerializer',
@@ -95,16 +101,20 @@ __all__ = [
     'CompoDataSerializer',
     'SponsorForStageSerializer',
     'CreateFromTemplateSerializer',
+    'UploadSessionSerializer',
     'VotingConfigurationSerializer',
     'AttendanceCodeSerializer',
     'AttendanceCodeGenerateSerializer',
     'AttendanceCodeUseSerializer',
     'AttendeeVerificationSerializer',
     'AttendeeVerificationCreateSerializer',
+    'CheckinScanSerializer',
+    'CheckinSerializer',
     'JuryMemberSerializer',
     'JuryMemberCreateSerializer',
     'VoteSerializer',
     'VoteCreateSerializer',
+    'VoteBatchItemSerializer',
     'VotingPeriodSerializer',
     'VotingResultsSerializer',
     'VotingStatsSerializer',
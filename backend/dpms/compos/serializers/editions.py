@@ -3,6 +3,7 @@
 from rest_framework import serializers
 from dpms.compos.models import Edition, HasCompo, Sponsor
 from dpms.users.serializers import ResumedUserModelSerializer
+from dpms.utils.image_fields import RenditionsField
 
 
 EDITION_CONTACT_FIELDS = [
@@ -22,9 +23,11 @@ EDITION_CONTACT_FIELDS = [
 class SponsorInlineSerializer(serializers.ModelSerializer):
     """Inline serializer for sponsors in Edition detail"""
 
+    logo_renditions = RenditionsField(source='logo')
+
     class Meta:
         model = Sponsor
-        fields = ['id', 'name', 'logo', 'url', 'display_order']
+        fields = ['id', 'name', 'logo', 'logo_renditions', 'url', 'display_order']
         read_only_fields = ['id']
 
 
@@ -32,6 +35,8 @@ class EditionListSerializer(serializers.ModelSerializer):
     """Serializer for listing editions (minimal data)"""
 
     uploaded_by = ResumedUserModelSerializer(read_only=True)
+    logo_renditions = RenditionsField(source='logo')
+    poster_renditions = RenditionsField(source='poster')
     compos_count = serializers.SerializerMethodField()
     productions_count = serializers.SerializerMethodField()
 
@@ -45,6 +50,8 @@ class EditionListSerializer(serializers.ModelSerializer):
             'description_en',
             'logo',
             'poster',
+            'logo_renditions',
+            'poster_renditions',
             'logo_border_color',
             'logo_border_width',
             'uploaded_by',
@@ -74,6 +81,8 @@ class EditionSerializer(serializers.ModelSerializer):
     """Standard serializer for Edition CRUD operations"""
 
     uploaded_by = ResumedUserModelSerializer(read_only=True)
+    logo_renditions = RenditionsField(source='logo')
+    poster_renditions = RenditionsField(source='poster')
 
     class Meta:
         model = Edition
@@ -85,6 +94,8 @@ class EditionSerializer(serializers.ModelSerializer):
             'description_en',
             'logo',
             'poster',
+            'logo_renditions',
+            'poster_renditions',
             'logo_border_color',
             'logo_border_width',
             'uploaded_by',
@@ -136,6 +147,8 @@ class EditionDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for Edition with nested compos and sponsors"""
 
     uploaded_by = ResumedUserModelSerializer(read_only=True)
+    logo_renditions = RenditionsField(source='logo')
+    poster_renditions = RenditionsField(source='poster')
     hascompo_set = HasCompoInlineSerializer(many=True, read_only=True)
     sponsors = SponsorInlineSerializer(many=True, read_only=True)
     compos_count = serializers.SerializerMethodField()
@@ -151,6 +164,8 @@ class EditionDetailSerializer(serializers.ModelSerializer):
             'description_en',
             'logo',
             'poster',
+            'logo_renditions',
+            'poster_renditions',
             'logo_border_color',
             'logo_border_width',
             'uploaded_by',
@@ -5,6 +5,17 @@ from rest_framework import serializers
 from dpms.compos.models import File
 from dpms.users.serializers import ResumedUserModelSerializer
 
+# Max file size: 100MB
+MAX_FILE_SIZE = 100 * 1024 * 1024
+
+# Block dangerous file types that could be executed server-side or contain XSS
+BLOCKED_EXTENSIONS = [
+    '.php', '.py', '.rb', '.sh', '.bash', '.cgi', '.pl',
+    '.exe', '.bat', '.cmd', '.com', '.msi', '.scr', '.pif',
+    '.js', '.html', '.htm', '.svg', '.xml', '.xhtml',
+    '.asp', '.aspx', '.jsp', '.war',
+]
+
 
 class FileSerializer(serializers.ModelSerializer):
     """Standard serializer for File listing"""
@@ -76,23 +87,13 @@ class FileUploadSerializer(serializers.ModelSerializer):
 
     def validate_file(self, value):
         """Validate file size and type"""
-        # Max file size: 100MB
-        max_size = 100 * 1024 * 1024  # 100MB in bytes
-
-        if value.size > max_size:
+        if value.size > MAX_FILE_SIZE:
             raise serializers.ValidationError(
                 f"File size cannot exceed 100MB. Your file is {value.size / (1024*1024):.2f}MB."
             )
 
-        # Block dangerous file types that could be executed server-side or contain XSS
-        blocked_extensions = [
-            '.php', '.py', '.rb', '.sh', '.bash', '.cgi', '.pl',
-            '.exe', '.bat', '.cmd', '.com', '.msi', '.scr', '.pif',
-            '.js', '.html', '.htm', '.svg', '.xml', '.xhtml',
-            '.asp', '.aspx', '.jsp', '.war',
-        ]
         ext = os.path.splitext(value.name)[1].lower()
-        if ext in blocked_extensions:
+        if ext in BLOCKED_EXTENSIONS:
             raise serializers.ValidationError(
                 f"File type '{ext}' is not allowed for security reasons."
             )
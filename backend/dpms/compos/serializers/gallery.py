@@ -2,6 +2,7 @@
 
 from rest_framework import serializers
 from dpms.compos.models import GalleryImage, Edition
+from dpms.compos.gallery_renditions import GALLERY_FORMATS, schedule_renditions
 from dpms.users.serializers import ResumedUserModelSerializer
 
 
@@ -12,6 +13,8 @@ class GalleryImageSerializer(serializers.ModelSerializer):
     uploader_name = serializers.SerializerMethodField()
     image_url = serializers.SerializerMethodField()
     thumbnail_url = serializers.SerializerMethodField()
+    renditions = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
     edition_name = serializers.SerializerMethodField()
 
     class Meta:
@@ -27,6 +30,8 @@ class GalleryImageSerializer(serializers.ModelSerializer):
             'original_filename',
             'image_url',
             'thumbnail_url',
+            'renditions',
+            'srcset',
             'public',
             'is_active',
             'created',
@@ -40,6 +45,8 @@ class GalleryImageSerializer(serializers.ModelSerializer):
             'original_filename',
             'image_url',
             'thumbnail_url',
+            'renditions',
+            'srcset',
         ]
 
     def get_image_url(self, obj):
@@ -59,6 +66,27 @@ class GalleryImageSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return None
 
+    def get_renditions(self, obj):
+        """Return the resized copies by size: width, height and URL per format"""
+        request = self.context.get('request')
+        if not request:
+            return {}
+        return {
+            size: {
+                key: request.build_absolute_uri(obj.image.storage.url(value)) if key in GALLERY_FORMATS else value
+                for key, value in rendition.items()
+            }
+            for size, rendition in obj.renditions.items()
+        }
+
+    def get_srcset(self, obj):
+        """Return an HTML srcset per format, from the smallest size"""
+        renditions = sorted(self.get_renditions(obj).values(), key=lambda rendition: rendition['width'])
+        return {
+            fmt: ', '.join(f"{rendition[fmt]} {rendition['width']}w" for rendition in renditions if fmt in rendition)
+            for fmt in GALLERY_FORMATS
+        } if renditions else {}
+
     def get_edition_name(self, obj):
         """Return edition name"""
         if obj.edition:
@@ -108,9 +136,11 @@ class GalleryImageUploadSerializer(serializers.ModelSerializer):
         return value
 
     def create(self, validated_data):
-        """Set uploaded_by to current user"""
+        """Set uploaded_by to current user and render the resized copies"""
         validated_data['uploaded_by'] = self.context['request'].user
-        return super().create(validated_data)
+        image = super().create(validated_data)
+        schedule_renditions(image)
+        return image
 
 
 class GalleryImageUpdateSerializer(serializers.ModelSerializer):
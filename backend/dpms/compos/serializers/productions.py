@@ -4,6 +4,8 @@ from rest_framework import serializers
 from django.utils import timezone
 from dpms.compos.models import Production, File, HasCompo
 from dpms.users.serializers import ResumedUserModelSerializer
+from dpms.utils.image_fields import RenditionsField
+from dpms.utils.media import signed_media_url
 
 
 class ProductionFileSerializer(serializers.ModelSerializer):
@@ -30,7 +32,9 @@ class ProductionFileSerializer(serializers.ModelSerializer):
         """Return download URL for the file"""
         request = self.context.get('request')
         if request and obj.file:
-            return request.build_absolute_uri(obj.file.url)
+            return request.build_absolute_uri(
+                signed_media_url(obj.file.name, obj.get_download_filename())
+            )
         return None
 
     def get_size(self, obj):
@@ -49,6 +53,7 @@ class ProductionSerializer(serializers.ModelSerializer):
     files_count = serializers.SerializerMethodField()
 
     screenshot_url = serializers.SerializerMethodField()
+    screenshot_renditions = RenditionsField(source='screenshot')
 
     class Meta:
         model = Production
@@ -65,6 +70,7 @@ class ProductionSerializer(serializers.ModelSerializer):
             'platform',
             'release_date',
             'screenshot_url',
+            'screenshot_renditions',
             'youtube_url',
             'demozoo_url',
             'pouet_url',
@@ -100,6 +106,7 @@ class ProductionDetailSerializer(serializers.ModelSerializer):
     compo_name = serializers.CharField(source='compo.name', read_only=True)
     files = ProductionFileSerializer(many=True, read_only=True)
     screenshot_url = serializers.SerializerMethodField()
+    screenshot_renditions = RenditionsField(source='screenshot')
     platform_display = serializers.CharField(source='get_platform_display', read_only=True)
 
     class Meta:
@@ -118,6 +125,7 @@ class ProductionDetailSerializer(serializers.ModelSerializer):
             'platform_display',
             'release_date',
             'screenshot_url',
+            'screenshot_renditions',
             'youtube_url',
             'demozoo_url',
             'pouet_url',
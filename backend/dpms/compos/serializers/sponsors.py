@@ -2,17 +2,21 @@
 
 from rest_framework import serializers
 from dpms.compos.models import Sponsor
+from dpms.utils.image_fields import RenditionsField
 
 
 class SponsorSerializer(serializers.ModelSerializer):
     """Standard serializer for Sponsor CRUD operations"""
 
+    logo_renditions = RenditionsField(source='logo')
+
     class Meta:
         model = Sponsor
         fields = [
             'id',
             'name',
             'logo',
+            'logo_renditions',
             'url',
             'description',
             'display_order',
@@ -26,6 +30,7 @@ class SponsorSerializer(serializers.ModelSerializer):
 class SponsorListSerializer(serializers.ModelSerializer):
     """Serializer for listing sponsors (minimal data for display)"""
 
+    logo_renditions = RenditionsField(source='logo')
     editions_names = serializers.SerializerMethodField()
 
     class Meta:
@@ -34,6 +39,7 @@ class SponsorListSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'logo',
+            'logo_renditions',
             'url',
             'display_order',
             'editions_names',
@@ -48,6 +54,7 @@ class SponsorListSerializer(serializers.ModelSerializer):
 class SponsorDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for Sponsor with edition names"""
 
+    logo_renditions = RenditionsField(source='logo')
     editions_names = serializers.SerializerMethodField()
 
     class Meta:
@@ -56,6 +63,7 @@ class SponsorDetailSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'logo',
+            'logo_renditions',
             'url',
             'description',
             'display_order',
@@ -10,12 +10,17 @@ from dpms.compos.models import (
     StageControl,
     Production,
     Sponsor,
+    TranscodeJob,
 )
+from dpms.utils.image_fields import RenditionsField
+from dpms.utils.media import signed_media_url
 
 
 class SlideElementSerializer(serializers.ModelSerializer):
     """Serializer for SlideElement CRUD operations"""
 
+    image_renditions = RenditionsField(source='image')
+
     class Meta:
         model = SlideElement
         fields = [
@@ -31,7 +36,9 @@ class SlideElementSerializer(serializers.ModelSerializer):
             'z_index',
             'content',
             'image',
+            'image_renditions',
             'video',
+            'transcode_job',
             'styles',
             'list_max_items',
             'list_show_position',
@@ -47,12 +54,14 @@ class SlideElementSerializer(serializers.ModelSerializer):
             'created',
             'modified',
         ]
-        read_only_fields = ['id', 'created', 'modified']
+        read_only_fields = ['id', 'transcode_job', 'created', 'modified']
 
 
 class SlideElementInlineSerializer(serializers.ModelSerializer):
     """Inline serializer for SlideElement (used within slide detail)"""
 
+    image_renditions = RenditionsField(source='image')
+
     class Meta:
         model = SlideElement
         fields = [
@@ -67,7 +76,9 @@ class SlideElementInlineSerializer(serializers.ModelSerializer):
             'z_index',
             'content',
             'image',
+            'image_renditions',
             'video',
+            'transcode_job',
             'styles',
             'list_max_items',
             'list_show_position',
@@ -81,12 +92,31 @@ class SlideElementInlineSerializer(serializers.ModelSerializer):
             'enter_delay',
             'is_visible',
         ]
-        read_only_fields = ['id']
+        read_only_fields = ['id', 'transcode_job']
+
+
+class TranscodeJobSerializer(serializers.ModelSerializer):
+    """Progress of a video conversion"""
+
+    class Meta:
+        model = TranscodeJob
+        fields = [
+            'id',
+            'status',
+            'progress',
+            'attempts',
+            'error',
+            'run_after',
+            'modified',
+        ]
+        read_only_fields = fields
 
 
 class StageSlideSerializer(serializers.ModelSerializer):
     """Serializer for StageSlide CRUD operations"""
 
+    background_image_renditions = RenditionsField(source='background_image')
+
     class Meta:
         model = StageSlide
         fields = [
@@ -96,6 +126,7 @@ class StageSlideSerializer(serializers.ModelSerializer):
             'slide_type',
             'background_effect',
             'background_image',
+            'background_image_renditions',
             'background_color',
             'has_compo',
             'production',
@@ -137,6 +168,7 @@ class StageSlideListSerializer(serializers.ModelSerializer):
 class StageSlideDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for StageSlide with elements"""
     elements = SlideElementInlineSerializer(many=True, read_only=True)
+    background_image_renditions = RenditionsField(source='background_image')
     effective_background_effect = serializers.SerializerMethodField()
     has_compo_name = serializers.SerializerMethodField()
     production_title = serializers.SerializerMethodField()
@@ -153,6 +185,7 @@ class StageSlideDetailSerializer(serializers.ModelSerializer):
             'background_effect',
             'effective_background_effect',
             'background_image',
+            'background_image_renditions',
             'background_color',
             'has_compo',
             'has_compo_name',
@@ -370,7 +403,7 @@ class StagePresentationListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
     def get_slide_count(self, obj):
-        return obj.presentation_slides.count()
+        return len(obj.presentation_slides.all())
 
     def get_has_compo_name(self, obj):
         if obj.has_compo:
@@ -378,8 +411,11 @@ class StagePresentationListSerializer(serializers.ModelSerializer):
         return None
 
     def get_slides(self, obj):
-        """Return ordered slides for the presentation"""
-        presentation_slides = obj.presentation_slides.select_related('slide').order_by('display_order')
+        """
+        Return ordered slides for the presentation.
+        Relies on presentation_slides__slide being prefetched (ordered by display_order).
+        """
+        presentation_slides = obj.presentation_slides.all()
         return [
             {
                 'id': ps.slide.id,
@@ -421,6 +457,7 @@ class StagePresentationDetailSerializer(serializers.ModelSerializer):
 # Dynamic data serializers for the viewer
 class ProductionForStageSerializer(serializers.ModelSerializer):
     """Production data for StageRunner display"""
+    screenshot_renditions = RenditionsField(source='screenshot')
     authors = serializers.SerializerMethodField()
     video_url = serializers.SerializerMethodField()
 
@@ -431,6 +468,7 @@ class ProductionForStageSerializer(serializers.ModelSerializer):
             'title',
             'authors',
             'screenshot',
+            'screenshot_renditions',
             'video_url',
             'created',
         ]
@@ -443,7 +481,7 @@ class ProductionForStageSerializer(serializers.ModelSerializer):
         for file in obj.files.filter(is_active=True, is_deleted=False):
             ext = file.original_filename.lower().split('.')[-1]
             if f'.{ext}' in video_extensions:
-                return file.file.url if file.file else None
+                return signed_media_url(file.file.name, file.get_download_filename()) if file.file else None
         return None
 
 
@@ -468,9 +506,11 @@ class CompoDataSerializer(serializers.Serializer):
 class SponsorForStageSerializer(serializers.ModelSerializer):
     """Sponsor data for StageRunner display"""
 
+    logo_renditions = RenditionsField(source='logo')
+
     class Meta:
         model = Sponsor
-        fields = ['id', 'name', 'logo', 'url', 'display_order']
+        fields = ['id', 'name', 'logo', 'logo_renditions', 'url', 'display_order']
 
 
 class StageRunnerFullStateSerializer(serializers.ModelSerializer):
@@ -484,6 +524,8 @@ class StageRunnerFullStateSerializer(serializers.ModelSerializer):
     edition_title = serializers.CharField(source='edition.title', read_only=True)
     edition_logo = serializers.ImageField(source='edition.logo', read_only=True)
     edition_poster = serializers.ImageField(source='edition.poster', read_only=True)
+    edition_logo_renditions = RenditionsField(source='edition.logo')
+    edition_poster_renditions = RenditionsField(source='edition.poster')
 
     class Meta:
         model = StageRunnerConfig
@@ -493,6 +535,8 @@ class StageRunnerFullStateSerializer(serializers.ModelSerializer):
             'edition_title',
             'edition_logo',
             'edition_poster',
+            'edition_logo_renditions',
+            'edition_poster_renditions',
             'default_background_effect',
             'canvas_width',
             'canvas_height',
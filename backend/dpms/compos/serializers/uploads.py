@@ -0,0 +1,111 @@
+"""Resumable upload serializers"""
+
+import os
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.exceptions import PermissionDenied
+from dpms.compos.models import UploadSession
+from dpms.compos.serializers.files import BLOCKED_EXTENSIONS, MAX_FILE_SIZE
+from dpms.compos.uploads import parse_checksum
+from dpms.users.roles import is_dpms_admin
+
+# Largest upload per target: files keep the limit of direct uploads
+MAX_UPLOAD_SIZES = {
+    UploadSession.TARGET_FILE: MAX_FILE_SIZE,
+    UploadSession.TARGET_VIDEO: 4 * 1024 * 1024 * 1024,
+}
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """Resumable upload: created with the file's metadata, then filled by chunks"""
+
+    chunk_size = serializers.SerializerMethodField()
+    expires = serializers.DateTimeField(read_only=True)
+
+    class Meta:
+        model = UploadSession
+        fields = [
+            'id',
+            'target',
+            'filename',
+            'size',
+            'offset',
+            'checksum',
+            'status',
+            'title',
+            'description',
+            'public',
+            'slide_element',
+            'file',
+            'chunk_size',
+            'expires',
+            'created',
+            'modified',
+        ]
+        read_only_fields = [
+            'id',
+            'offset',
+            'status',
+            'file',
+            'created',
+            'modified',
+        ]
+
+    def get_chunk_size(self, obj):
+        """Largest chunk accepted"""
+        return settings.UPLOAD_CHUNK_MAX_SIZE
+
+    def validate_filename(self, value):
+        """Same file types as direct uploads"""
+        ext = os.path.splitext(value)[1].lower()
+        if ext in BLOCKED_EXTENSIONS:
+            raise serializers.ValidationError(
+                f"File type '{ext}' is not allowed for security reasons."
+            )
+        return os.path.basename(value)
+
+    def validate_checksum(self, value):
+        """Checksum of the whole file, in the format of Upload-Checksum"""
+        if value:
+            try:
+                parse_checksum(value)
+            except ValueError as e:
+                raise serializers.ValidationError(str(e))
+        return value
+
+    def validate(self, data):
+        """Check the size limit of the target and who may upload to it"""
+        user = self.context['request'].user
+        target = data['target']
+
+        max_size = MAX_UPLOAD_SIZES[target]
+        if data['size'] > max_size:
+            raise serializers.ValidationError({
+                'size': f"File size cannot exceed {max_size // (1024 * 1024)}MB."
+            })
+
+        if target == UploadSession.TARGET_VIDEO:
+            # Same permission as editing slide elements
+            if not is_dpms_admin(user):
+                raise PermissionDenied('Only admins can upload StageRunner videos.')
+            if not data.get('slide_element'):
+                raise serializers.ValidationError({
+                    'slide_element': 'Required for video uploads.'
+                })
+        else:
+            data['slide_element'] = None
+
+        active = UploadSession.objects.filter(
+            uploaded_by=user, status=UploadSession.STATUS_UPLOADING
+        ).count()
+        if active >= UploadSession.MAX_ACTIVE:
+            raise serializers.ValidationError(
+                f"You cannot have more than {UploadSession.MAX_ACTIVE} uploads in progress."
+            )
+
+        return data
+
+    def create(self, validated_data):
+        """Set uploaded_by to current user"""
+        validated_data['uploaded_by'] = self.context['request'].user
+        return super().create(validated_data)
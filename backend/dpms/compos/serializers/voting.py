@@ -2,6 +2,7 @@
 
 from rest_framework import serializers
 from dpms.compos.models import (
+    Edition,
     VotingConfiguration,
     AttendanceCode,
     AttendeeVerification,
@@ -9,6 +10,8 @@ from dpms.compos.models import (
     Vote,
     VotingPeriod,
 )
+from dpms.compos.voter_context import get_voter_context
+from dpms.compos.checkin import MAX_CHECKIN_BATCH, uses_checkin
 from dpms.users.serializers import ResumedUserModelSerializer
 from dpms.compos.serializers.compos import CompoSerializer
 from dpms.compos.serializers.editions import EditionListSerializer
@@ -89,35 +92,18 @@ class AttendanceCodeGenerateSerializer(serializers.Serializer):
     """Serializer for generating attendance codes"""
 
     edition_id = serializers.IntegerField()
-    quantity = serializers.IntegerField(min_value=1, max_value=1000)
+    quantity = serializers.IntegerField(
+        min_value=1, max_value=AttendanceCode.MAX_GENERATE
+    )
     prefix = serializers.CharField(max_length=10, required=False, allow_blank=True)
 
-    def validate_quantity(self, value):
-        """Validate quantity"""
-        if value > 1000:
-            raise serializers.ValidationError(
-                "Cannot generate more than 1000 codes at once"
-            )
-        return value
-
 
 class AttendanceCodeUseSerializer(serializers.Serializer):
     """Serializer for using an attendance code"""
 
+    # Existence and availability are checked when redeeming it
     code = serializers.CharField(max_length=50)
 
-    def validate_code(self, value):
-        """Validate that code exists and is not used"""
-        try:
-            code = AttendanceCode.objects.get(code=value)
-        except AttendanceCode.DoesNotExist:
-            raise serializers.ValidationError("Invalid code")
-
-        if code.is_used:
-            raise serializers.ValidationError("Code already used")
-
-        return value
-
 
 class AttendeeVerificationSerializer(serializers.ModelSerializer):
     """Serializer for AttendeeVerification"""
@@ -172,6 +158,32 @@ class AttendeeVerificationCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class CheckinScanSerializer(serializers.Serializer):
+    """One scanned QR pass"""
+
+    payload = serializers.CharField(max_length=100)
+    scanned_at = serializers.DateTimeField(required=False)
+
+
+class CheckinSerializer(serializers.Serializer):
+    """Scans uploaded by a door scanner, live (one) or offline (many)"""
+
+    edition = serializers.PrimaryKeyRelatedField(
+        queryset=Edition.objects.select_related("voting_config")
+    )
+    scans = serializers.ListField(
+        child=CheckinScanSerializer(), min_length=1, max_length=MAX_CHECKIN_BATCH
+    )
+
+    def validate_edition(self, value):
+        """Only editions in the checkin access mode check attendees in"""
+        if not uses_checkin(value):
+            raise serializers.ValidationError(
+                "This edition does not use physical check-in"
+            )
+        return value
+
+
 class JuryMemberSerializer(serializers.ModelSerializer):
     """Serializer for JuryMember"""
 
@@ -244,11 +256,16 @@ class VoteSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         """Run model clean validation"""
+        request = self.context["request"]
         instance = Vote(**data)
         if not instance.pk:
             # Set user for validation
-            instance.user = self.context["request"].user
-        instance.clean()
+            instance.user = request.user
+        instance.clean(
+            voter_context=get_voter_context(
+                instance.user, data["production"].edition_id, request
+            )
+        )
         return data
 
 
@@ -266,19 +283,40 @@ class VoteCreateSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
     def create(self, validated_data):
-        """Set user to current user"""
-        validated_data["user"] = self.context["request"].user
-        return super().create(validated_data)
+        """Set user to current user, reusing the context from validation"""
+        request = self.context["request"]
+        vote = Vote(user=request.user, **validated_data)
+        vote.save(
+            voter_context=get_voter_context(
+                request.user, vote.production.edition_id, request
+            )
+        )
+        return vote
 
     def validate(self, data):
         """Run model clean validation only on creation"""
         if not self.instance:
+            request = self.context["request"]
             instance = Vote(**data)
-            instance.user = self.context["request"].user
-            instance.clean()
+            instance.user = request.user
+            instance.clean(
+                voter_context=get_voter_context(
+                    request.user, data["production"].edition_id, request
+                )
+            )
         return data
 
 
+class VoteBatchItemSerializer(serializers.Serializer):
+    """One vote of a batch submission (eligibility is checked by the ballot)"""
+
+    production = serializers.IntegerField()
+    score = serializers.IntegerField(min_value=1, max_value=10)
+    comment = serializers.CharField(
+        max_length=500, allow_blank=True, required=False, default=""
+    )
+
+
 class VotingPeriodSerializer(serializers.ModelSerializer):
     """Serializer for VotingPeriod"""
 
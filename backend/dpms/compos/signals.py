@@ -0,0 +1,131 @@
+"""Signal handlers for the compos app."""
+
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from dpms.compos.control_channel import control_channel
+from dpms.compos.models import (
+    AttendeeVerification,
+    Compo,
+    Edition,
+    HasCompo,
+    JuryMember,
+    PresentationSlide,
+    Production,
+    ProductionTally,
+    SlideElement,
+    StageControl,
+    StagePresentation,
+    StageRunnerConfig,
+    StageSlide,
+    Vote,
+    VotingConfiguration,
+    VotingPeriod,
+)
+from dpms.compos.period_index import invalidate_period_index
+from dpms.compos.voter_context import invalidate_voter_context
+
+
+@receiver(post_delete, sender=Vote, dispatch_uid="vote_tally_on_delete")
+def remove_vote_from_tally(sender, instance, **kwargs):
+    """Keep ProductionTally in sync when a vote is deleted (also on cascades)."""
+    ProductionTally.apply(
+        instance.production_id, instance.is_jury_vote, instance.score, sign=-1
+    )
+
+
+# Voter contexts: drop cached eligibility when what it is built from changes.
+
+@receiver([post_save, post_delete], sender=VotingConfiguration, dispatch_uid="voter_context_config")
+def invalidate_edition_voter_contexts(sender, instance, **kwargs):
+    invalidate_voter_context(instance.edition_id)
+
+
+@receiver([post_save, post_delete], sender=VotingPeriod, dispatch_uid="voting_period_index")
+def rebuild_period_index(sender, instance, **kwargs):
+    """Rebuild the voting period index once the change commits."""
+    invalidate_period_index()
+
+
+@receiver([post_save, post_delete], sender=JuryMember, dispatch_uid="voter_context_jury")
+@receiver([post_save, post_delete], sender=AttendeeVerification, dispatch_uid="voter_context_verification")
+def invalidate_user_voter_context(sender, instance, **kwargs):
+    invalidate_voter_context(instance.edition_id, instance.user_id)
+
+
+@receiver(m2m_changed, sender=JuryMember.compos.through, dispatch_uid="voter_context_jury_compos")
+def invalidate_jury_compos(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        invalidate_voter_context(instance.edition_id, instance.user_id)
+        return
+    # Changed from the compo side: drop the contexts of the affected editions
+    if action == "pre_clear":
+        jury_members = JuryMember.objects.filter(compos=instance)
+    else:
+        jury_members = JuryMember.objects.filter(pk__in=pk_set)
+    for edition_id in set(jury_members.values_list("edition_id", flat=True)):
+        invalidate_voter_context(edition_id)
+
+
+@receiver(post_save, sender=StageControl, dispatch_uid="stage_control_push")
+def push_stage_control(sender, instance, **kwargs):
+    """Wake up the clients watching this control once the change commits."""
+    control_channel.notify(instance.config_id)
+
+
+# StageRunner revisions: every change that alters a StageRunner response
+# bumps the revision of the affected configs, which the views use as ETag.
+
+@receiver(post_save, sender=StageRunnerConfig, dispatch_uid="stagerunner_revision_config")
+def bump_config_revision(sender, instance, **kwargs):
+    StageRunnerConfig.bump_revision(pk=instance.pk)
+
+
+@receiver([post_save, post_delete], sender=StageSlide, dispatch_uid="stagerunner_revision_slide")
+@receiver([post_save, post_delete], sender=StagePresentation, dispatch_uid="stagerunner_revision_presentation")
+@receiver(post_save, sender=StageControl, dispatch_uid="stagerunner_revision_control")
+def bump_revision_by_config(sender, instance, **kwargs):
+    StageRunnerConfig.bump_revision(pk=instance.config_id)
+
+
+@receiver([post_save, post_delete], sender=SlideElement, dispatch_uid="stagerunner_revision_element")
+def bump_revision_by_slide(sender, instance, **kwargs):
+    StageRunnerConfig.bump_revision(slides=instance.slide_id)
+
+
+@receiver([post_save, post_delete], sender=PresentationSlide, dispatch_uid="stagerunner_revision_presentation_slide")
+def bump_revision_by_presentation(sender, instance, **kwargs):
+    StageRunnerConfig.bump_revision(presentations=instance.presentation_id)
+
+
+@receiver(post_save, sender=Edition, dispatch_uid="stagerunner_revision_edition")
+def bump_revision_by_edition(sender, instance, **kwargs):
+    StageRunnerConfig.bump_revision(edition=instance.pk)
+
+
+# Productions and compos are referenced with SET_NULL, so deletions are
+# handled before the references are cleared.
+
+@receiver([post_save, pre_delete], sender=Production, dispatch_uid="stagerunner_revision_production")
+def bump_revision_by_production(sender, instance, **kwargs):
+    StageRunnerConfig.bump_revision(
+        Q(slides__production=instance.pk) | Q(control__current_production=instance.pk)
+    )
+
+
+@receiver([post_save, pre_delete], sender=HasCompo, dispatch_uid="stagerunner_revision_hascompo")
+def bump_revision_by_hascompo(sender, instance, **kwargs):
+    StageRunnerConfig.bump_revision(
+        Q(slides__has_compo=instance.pk) | Q(presentations__has_compo=instance.pk)
+    )
+
+
+@receiver(post_save, sender=Compo, dispatch_uid="stagerunner_revision_compo")
+def bump_revision_by_compo(sender, instance, **kwargs):
+    StageRunnerConfig.bump_revision(
+        Q(slides__has_compo__compo=instance.pk)
+        | Q(presentations__has_compo__compo=instance.pk)
+    )
@@ -0,0 +1,249 @@
+"""
+Video transcoding for StageRunner slide elements.
+
+Uploaded videos that browsers cannot play are converted to MP4 H.264 by
+ffmpeg. Instead of a thread per upload inside the web workers, every
+upload enqueues a persistent TranscodeJob keyed by the file's SHA-256:
+
+- an upload whose content was already converted reuses the result at once;
+- an upload whose content is being converted waits for that job;
+- anything else is converted by ``manage.py run_transcode_worker``, which
+  runs a bounded number of ffmpeg processes, reports their progress and
+  retries failures with backoff. Jobs survive restarts of both the web
+  server and the worker.
+
+When a job is done, every element waiting for it plays the converted file
+and the duplicate uploads are removed.
+"""
+
+# Utilities
+import hashlib
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+import time
+
+# Django
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+# Application models
+from dpms.compos.models import SlideElement, StageRunnerConfig, TranscodeJob
+
+logger = logging.getLogger("dpms")
+
+# Codecs every browser plays without conversion
+COMPATIBLE_CODECS = ("h264", "vp8", "vp9", "av1")
+
+PROBE_TIMEOUT = 30
+TRANSCODE_TIMEOUT = 3600
+# Seconds between progress reports of a running job
+REPORT_INTERVAL = 2
+
+
+def file_hash(name):
+    """SHA-256 of a file in the default storage."""
+    digest = hashlib.sha256()
+    with default_storage.open(name, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def enqueue_transcode(element):
+    """
+    Queue the conversion of the video just uploaded to an element.
+
+    Args:
+        element: Saved SlideElement with a new video
+
+    Returns:
+        TranscodeJob
+    """
+    job, _ = TranscodeJob.objects.get_or_create(
+        content_hash=file_hash(element.video.name),
+        defaults={"source": element.video.name},
+    )
+
+    if job.status == TranscodeJob.STATUS_DONE and default_storage.exists(job.output):
+        # Same content converted before: play that file, drop the upload
+        upload = element.video.name
+        SlideElement.objects.filter(pk=element.pk).update(video=job.output, transcode_job=job)
+        element.video.name = job.output
+        element.transcode_job = job
+        if upload != job.output:
+            transaction.on_commit(lambda: default_storage.delete(upload))
+        return job
+
+    if job.status in (TranscodeJob.STATUS_DONE, TranscodeJob.STATUS_FAILED):
+        # Output gone or given up: convert again, from this upload
+        TranscodeJob.objects.filter(pk=job.pk).update(
+            status=TranscodeJob.STATUS_QUEUED,
+            source=element.video.name,
+            output="",
+            progress=0,
+            attempts=0,
+            error="",
+            run_after=timezone.now(),
+        )
+        job.refresh_from_db()
+
+    SlideElement.objects.filter(pk=element.pk).update(transcode_job=job)
+    element.transcode_job = job
+    logger.info(f"SlideElement {element.pk}: video queued for conversion (job {job.pk})")
+    return job
+
+
+def job_source(job):
+    """Storage name of a file with the job's content, or None if none is left."""
+    candidates = [job.source] + list(
+        job.elements.exclude(video="").values_list("video", flat=True)
+    )
+    return next((name for name in candidates if name and default_storage.exists(name)), None)
+
+
+def probe(path):
+    """
+    Codecs and duration of a video.
+
+    Returns:
+        tuple: (ffprobe output, duration in seconds or None)
+    """
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0",
+         "-show_entries", "format=format_name,duration:stream=codec_name",
+         "-of", "csv=p=0", path],
+        capture_output=True, text=True, timeout=PROBE_TIMEOUT, check=True,
+    )
+    output = result.stdout.strip()
+    duration = None
+    for field in output.replace("\n", ",").split(","):
+        try:
+            duration = float(field)
+        except ValueError:
+            continue
+    return output, duration
+
+
+def transcode(job, source_path, output_path, duration, processes=None):
+    """
+    Convert a video to MP4 H.264, reporting progress on the job.
+
+    Args:
+        processes: Dict where the running ffmpeg process is registered
+            under the job id, so the worker can stop it
+
+    Raises:
+        RuntimeError: If ffmpeg fails or times out
+    """
+    # stderr goes to a file: a pipe nobody reads while the progress is
+    # followed would fill up with errors of a corrupt input and block ffmpeg
+    with tempfile.TemporaryFile(mode="w+") as errors:
+        process = subprocess.Popen(
+            ["ffmpeg", "-y", "-v", "error", "-nostdin", "-i", source_path,
+             "-c:v", "libx264", "-preset", "fast", "-crf", "23",
+             "-c:a", "aac", "-b:a", "128k",
+             "-movflags", "+faststart",
+             "-progress", "pipe:1", "-nostats",
+             output_path],
+            stdout=subprocess.PIPE, stderr=errors, text=True,
+        )
+        if processes is not None:
+            processes[job.pk] = process
+
+        # Kills ffmpeg on time even if it stops writing progress
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(TRANSCODE_TIMEOUT, kill)
+        watchdog.daemon = True
+        watchdog.start()
+        last_report = time.monotonic()
+        try:
+            for line in process.stdout:
+                now = time.monotonic()
+                key, _, value = line.strip().partition("=")
+                # out_time_ms is in microseconds too
+                if key == "out_time_us" and value.isdigit() and now - last_report >= REPORT_INTERVAL:
+                    if duration:
+                        job.report(min(99, int(int(value) / 1e6 / duration * 100)))
+                    else:
+                        job.report(0)
+                    last_report = now
+            process.wait()
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            if processes is not None:
+                processes.pop(job.pk, None)
+
+        if timed_out.is_set():
+            raise RuntimeError(f"ffmpeg timed out after {TRANSCODE_TIMEOUT}s")
+        if process.returncode != 0:
+            errors.seek(0)
+            raise RuntimeError(f"ffmpeg exited with {process.returncode}: {errors.read()[-4000:]}")
+
+
+def run_job(job, processes=None):
+    """
+    Run a claimed job to completion.
+
+    Failures are recorded on the job, which is retried with backoff until
+    it runs out of attempts.
+    """
+    source = job_source(job)
+    if source is None:
+        job.fail("Source video missing", retry=False)
+        return
+
+    source_path = default_storage.path(source)
+    output = os.path.splitext(source)[0] + "_h264.mp4"
+    output_path = default_storage.path(output)
+    try:
+        codecs, duration = probe(source_path)
+        if any(codec in codecs for codec in COMPATIBLE_CODECS):
+            logger.info(f"TranscodeJob {job.pk}: video already compatible")
+            finish(job, source)
+            return
+
+        logger.info(f"TranscodeJob {job.pk}: converting {source} to H.264")
+        transcode(job, source_path, output_path, duration, processes)
+    except (subprocess.SubprocessError, OSError, RuntimeError) as e:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        if isinstance(e, subprocess.CalledProcessError):
+            e = f"{e}: {e.stderr}"
+        logger.error(f"TranscodeJob {job.pk}: conversion failed: {e}")
+        job.fail(str(e))
+        return
+
+    finish(job, output)
+    logger.info(f"TranscodeJob {job.pk}: conversion complete -> {output}")
+
+
+def finish(job, output):
+    """Point the waiting elements to the playable file and drop the uploads."""
+    with transaction.atomic():
+        uploads = set(job.elements.values_list("video", flat=True)) | {job.source}
+        job.elements.update(video=output)
+        TranscodeJob.objects.filter(pk=job.pk).update(
+            status=TranscodeJob.STATUS_DONE, output=output, progress=100, error=""
+        )
+        # Updates bypass the signals: displays must reload the slides
+        StageRunnerConfig.bump_revision(slides__elements__transcode_job=job.pk)
+
+    stale = uploads - {output, ""}
+    # Kept if another element still plays it
+    in_use = set(
+        SlideElement.objects.filter(video__in=stale).values_list("video", flat=True)
+    )
+    for name in stale - in_use:
+        default_storage.delete(name)
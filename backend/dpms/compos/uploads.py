@@ -0,0 +1,280 @@
+"""
+Resumable chunked uploads.
+
+Demos and compo videos are uploaded over venue Wi-Fi, where a single
+100 MB multipart request fails and starts again from zero. Uploads on
+/api/uploads/ follow a protocol modelled on tus (https://tus.io):
+
+1. ``POST /api/uploads/`` with the target (``file`` or ``video``), file
+   name and size creates an UploadSession.
+2. ``PATCH`` (or ``PUT``) ``/api/uploads/<id>/`` sends the next chunk as
+   the raw request body, with the headers ``Upload-Offset`` (the session's
+   offset) and ``Upload-Checksum`` (``sha256 <base64 digest>`` of the
+   chunk; ``sha1`` and ``md5`` are accepted too). A chunk for another
+   offset gets 409 and one whose checksum does not match 460; after a lost
+   connection, ``HEAD`` or ``GET`` the session to learn where to resume.
+3. ``POST /api/uploads/<id>/finalize/`` turns the complete upload into a
+   File, or into the video of a SlideElement (queueing its conversion).
+
+Chunks are streamed to a file of the assembly area (UPLOAD_SESSIONS_ROOT)
+with pwrite at their offset, hashed on the way: only one read buffer of a
+chunk is ever in memory, and the session's offset only moves once the
+checksum matches. The assembly area is on the media volume, so finalizing
+moves the file into the storage instead of copying it.
+
+Sessions that get no chunk for UPLOAD_SESSION_EXPIRY_HOURS are deleted
+with their partial files by ``manage.py purge_upload_sessions``.
+"""
+
+# Utilities
+import base64
+import binascii
+import hashlib
+import os
+from datetime import timedelta
+
+# Django
+from django.conf import settings
+from django.core.files import File as DjangoFile
+from django.utils import timezone
+
+# Application models
+from dpms.compos.models import File, UploadSession
+
+# Bytes of a chunk read from the request at a time
+READ_SIZE = 64 * 1024
+
+CHECKSUM_ALGORITHMS = ("sha256", "sha1", "md5")
+
+
+class OffsetMismatch(ValueError):
+    """A chunk was sent for another offset than the session's."""
+
+
+class ChecksumMismatch(ValueError):
+    """A chunk or the whole upload does not match its checksum."""
+
+
+class AssembledUpload(DjangoFile):
+    """
+    A complete upload of the assembly area.
+
+    Looks like a Django temporary upload, so FileSystemStorage moves it
+    into place instead of copying it.
+    """
+
+    def __init__(self, path, name):
+        super().__init__(open(path, "rb"), name)
+        self.path = path
+
+    def temporary_file_path(self):
+        return self.path
+
+
+def session_path(session):
+    """Partial file of a session in the assembly area."""
+    return os.path.join(settings.UPLOAD_SESSIONS_ROOT, f"{session.pk}.part")
+
+
+def parse_checksum(value):
+    """
+    Algorithm and digest of a checksum header.
+
+    Args:
+        value: "algorithm base64-digest"
+
+    Returns:
+        tuple: (algorithm, digest bytes)
+
+    Raises:
+        ValueError: If it is malformed or of an unsupported algorithm
+    """
+    algorithm, _, digest = value.strip().partition(" ")
+    algorithm = algorithm.lower()
+    if algorithm not in CHECKSUM_ALGORITHMS:
+        raise ValueError(f"Unsupported checksum algorithm '{algorithm}' (use {', '.join(CHECKSUM_ALGORITHMS)})")
+    try:
+        digest = base64.b64decode(digest.strip(), validate=True)
+    except binascii.Error:
+        raise ValueError("The checksum digest is not valid base64")
+    if len(digest) != hashlib.new(algorithm).digest_size:
+        raise ValueError(f"Wrong {algorithm} digest length")
+    return algorithm, digest
+
+
+def write_chunk(session, stream, length, offset, checksum):
+    """
+    Append a chunk to an upload.
+
+    Args:
+        session: UploadSession, locked with select_for_update
+        stream: Request body
+        length: Chunk size in bytes (Content-Length)
+        offset: Upload-Offset the client sent the chunk for
+        checksum: Upload-Checksum of the chunk
+
+    Returns:
+        int: The new offset
+
+    Raises:
+        OffsetMismatch: If offset is not the session's
+        ChecksumMismatch: If the chunk is corrupt (it is discarded)
+        ValueError: If the chunk is too large, incomplete or not expected
+    """
+    if session.status != UploadSession.STATUS_UPLOADING:
+        raise ValueError("The upload is already complete")
+    if offset != session.offset:
+        raise OffsetMismatch(f"Expected offset {session.offset}")
+    if length > settings.UPLOAD_CHUNK_MAX_SIZE:
+        raise ValueError(f"Chunks cannot exceed {settings.UPLOAD_CHUNK_MAX_SIZE} bytes")
+    if offset + length > session.size:
+        raise ValueError("The chunk goes past the end of the file")
+    algorithm, expected = parse_checksum(checksum)
+
+    digest = hashlib.new(algorithm)
+    os.makedirs(settings.UPLOAD_SESSIONS_ROOT, exist_ok=True)
+    fd = os.open(session_path(session), os.O_WRONLY | os.O_CREAT, 0o640)
+    try:
+        position = offset
+        while position < offset + length:
+            data = stream.read(min(READ_SIZE, offset + length - position))
+            if not data:
+                break
+            digest.update(data)
+            view = memoryview(data)
+            while view:
+                written = os.pwrite(fd, view, position)
+                view = view[written:]
+                position += written
+        # Whatever is past the offset is overwritten by the next chunk, but
+        # truncating keeps the partial file as long as what it is worth
+        if position < offset + length:
+            os.ftruncate(fd, offset)
+            raise ValueError("The chunk is incomplete")
+        if digest.digest() != expected:
+            os.ftruncate(fd, offset)
+            raise ChecksumMismatch("The chunk does not match its checksum")
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    session.offset = position
+    session.save(update_fields=["offset", "modified"])
+    return session.offset
+
+
+def file_digest(path, algorithm):
+    """Digest of a file, read in chunks."""
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def restart(session):
+    """Discard the data of an upload so it starts over."""
+    session.offset = 0
+    session.save(update_fields=["offset", "modified"])
+    if os.path.exists(session_path(session)):
+        os.truncate(session_path(session), 0)
+
+
+def finalize(session):
+    """
+    Turn a complete upload into its target.
+
+    Finalizing a session again returns the same result.
+
+    Args:
+        session: UploadSession, locked with select_for_update
+
+    Returns:
+        File or SlideElement
+
+    Raises:
+        ChecksumMismatch: If the upload does not match the session's
+            checksum (it starts over)
+        ValueError: If the upload is not complete
+    """
+    if session.status == UploadSession.STATUS_COMPLETE:
+        return session.file if session.target == UploadSession.TARGET_FILE else session.slide_element
+    if session.offset != session.size:
+        raise ValueError(f"The upload is not complete ({session.offset} of {session.size} bytes)")
+
+    path = session_path(session)
+    if session.size and not os.path.exists(path):
+        restart(session)
+        raise ValueError("The uploaded data was lost, upload the file again")
+    with open(path, "ab") as f:
+        # Drop anything written past the end by a discarded chunk
+        f.truncate(session.size)
+
+    if session.checksum:
+        algorithm, expected = parse_checksum(session.checksum)
+        if file_digest(path, algorithm) != expected:
+            restart(session)
+            raise ChecksumMismatch("The file does not match its checksum, upload it again")
+
+    upload = AssembledUpload(path, session.filename)
+    try:
+        if session.target == UploadSession.TARGET_FILE:
+            result = File.objects.create(
+                title=session.title or session.filename,
+                original_filename=session.filename,
+                description=session.description,
+                uploaded_by=session.uploaded_by,
+                file=upload,
+                public=session.public,
+            )
+            session.file = result
+            # Left in place when the content was already stored
+            discard(path)
+        else:
+            result = session.slide_element
+            # Saving queues the conversion of the new video
+            result.video = upload
+            result.save()
+    finally:
+        upload.close()
+
+    session.status = UploadSession.STATUS_COMPLETE
+    session.save(update_fields=["status", "file", "modified"])
+    return result
+
+
+def discard(path):
+    """Delete a partial file."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def purge_expired():
+    """
+    Delete the sessions that got no chunk for UPLOAD_SESSION_EXPIRY_HOURS.
+
+    Also deletes partial files left without a session (sessions of deleted
+    slide elements or users) once they are as old.
+
+    Returns:
+        tuple: (sessions deleted, partial files deleted)
+    """
+    cutoff = timezone.now() - timedelta(hours=settings.UPLOAD_SESSION_EXPIRY_HOURS)
+    expired = UploadSession.objects.filter(modified__lt=cutoff)
+    expired_files = {f"{pk}.part" for pk in expired.values_list("pk", flat=True)}
+    sessions, _ = expired.delete()
+
+    files = 0
+    if os.path.isdir(settings.UPLOAD_SESSIONS_ROOT):
+        # Skip sessions that got a chunk while being purged
+        active = {f"{pk}.part" for pk in UploadSession.objects.values_list("pk", flat=True)}
+        with os.scandir(settings.UPLOAD_SESSIONS_ROOT) as entries:
+            for entry in entries:
+                if entry.name in active or not entry.name.endswith(".part"):
+                    continue
+                if entry.name in expired_files or entry.stat().st_mtime < cutoff.timestamp():
+                    os.remove(entry.path)
+                    files += 1
+    return sessions, files
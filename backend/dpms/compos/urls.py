@@ -15,9 +15,11 @@ from dpms.compos.views import (
     StageRunnerConfigViewSet,
     StageSlideViewSet,
     SlideElementViewSet,
+    TranscodeJobViewSet,
     StagePresentationViewSet,
     StageControlViewSet,
     StageRunnerDataViewSet,
+    UploadSessionViewSet,
     VotingConfigurationViewSet,
     AttendanceCodeViewSet,
     AttendeeVerificationViewSet,
@@ -25,6 +27,7 @@ from dpms.compos.views import (
     VoteViewSet,
     VotingPeriodViewSet,
     VotingResultsViewSet,
+    signed_media,
 )
 
 router = DefaultRouter()
@@ -33,6 +36,7 @@ router.register(r'compos', CompoViewSet, basename='compos')
 router.register(r'hascompos', HasCompoViewSet, basename='hascompos')
 router.register(r'productions', ProductionViewSet, basename='productions')
 router.register(r'files', FileViewSet, basename='files')
+router.register(r'uploads', UploadSessionViewSet, basename='uploads')
 router.register(r'gallery', GalleryImageViewSet, basename='gallery')
 router.register(r'sponsors', SponsorViewSet, basename='sponsors')
 router.register(r'attendances', AttendanceViewSet, basename='attendances')
@@ -41,6 +45,7 @@ router.register(r'attendances', AttendanceViewSet, basename='attendances')
 router.register(r'stagerunner-config', StageRunnerConfigViewSet, basename='stagerunner-config')
 router.register(r'stage-slides', StageSlideViewSet, basename='stage-slides')
 router.register(r'slide-elements', SlideElementViewSet, basename='slide-elements')
+router.register(r'transcode-jobs', TranscodeJobViewSet, basename='transcode-jobs')
 router.register(r'stage-presentations', StagePresentationViewSet, basename='stage-presentations')
 router.register(r'stage-control', StageControlViewSet, basename='stage-control')
 router.register(r'stagerunner-data', StageRunnerDataViewSet, basename='stagerunner-data')
@@ -55,5 +60,6 @@ router.register(r'voting-periods', VotingPeriodViewSet, basename='voting-periods
 router.register(r'voting-results', VotingResultsViewSet, basename='voting-results')
 
 urlpatterns = [
+    path('media/<str:token>/<path:filename>', signed_media, name='signed-media'),
     path('', include(router.urls)),
 ]
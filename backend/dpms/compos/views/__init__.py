@@ -2,17 +2,19 @@ from .attendance import AttendanceViewSet
 from .editions import EditionViewSet
 from .compos import CompoViewSet, HasCompoViewSet
 from .productions import ProductionViewSet
-from .files import FileViewSet
+from .files import FileViewSet, signed_media
 from .gallery import GalleryImageViewSet
 from .sponsors import SponsorViewSet
 from .stagerunner import (
     StageRunnerConfigViewSet,
     StageSlideViewSet,
     SlideElementViewSet,
+    TranscodeJobViewSet,
     StagePresentationViewSet,
     StageControlViewSet,
     StageRunnerDataViewSet,
 )
+from .uploads import UploadSessionViewSet
 from .voting import (
     VotingConfigurationViewSet,
     AttendanceCodeViewSet,
@@ -35,9 +37,11 @@ __all__ = [
     'StageRunnerConfigViewSet',
     'StageSlideViewSet',
     'SlideElementViewSet',
+    'TranscodeJobViewSet',
     'StagePresentationViewSet',
     'StageControlViewSet',
     'StageRunnerDataViewSet',
+    'UploadSessionViewSet',
     'VotingConfigurationViewSet',
     'AttendanceCodeViewSet',
     'AttendeeVerificationViewSet',
@@ -45,4 +49,5 @@ __all__ = [
     'VoteViewSet',
     'VotingPeriodViewSet',
     'VotingResultsViewSet',
+    'signed_media',
 ]
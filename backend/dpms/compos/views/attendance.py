@@ -4,13 +4,30 @@ from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from dpms.utils.exports import CSVExport
+from dpms.utils.views import AtomicWritesMixin
 
 from dpms.compos.models import Attendance, Edition
 from dpms.compos.permissions import IsAdminUser
+from dpms.users.roles import is_dpms_admin
 from dpms.compos.serializers import AttendanceAdminSerializer, AttendanceSerializer
 
 
-class AttendanceViewSet(viewsets.ModelViewSet):
+ATTENDANCE_EXPORT = CSVExport([
+    ("Email", "user.email"),
+    ("First name", "user.first_name"),
+    ("Last name", "user.last_name"),
+    ("Nickname", "user.profile.nickname"),
+    ("Group", "user.profile.group"),
+    ("Edition", "edition.title"),
+    ("Sleeps at", lambda attendance: attendance.get_sleeps_at_display()),
+    ("Days", "days"),
+    ("Equipment", "equipment"),
+    ("Confirmed at", "created"),
+])
+
+
+class AttendanceViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     Attendance confirmations.
 
@@ -19,6 +36,7 @@ class AttendanceViewSet(viewsets.ModelViewSet):
     - retrieve/update/destroy: owner or admin.
     - me: return the current user's attendance for ?edition=<id>.
     - count: public count for an edition, gated by Edition.attendance_count_public.
+    - export: CSV of the RSVPs, filterable by ?edition= (admin only).
     """
 
     queryset = Attendance.objects.select_related("user", "edition", "user__profile")
@@ -31,6 +49,8 @@ class AttendanceViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action == "count":
             return [AllowAny()]
+        if self.action == "export":
+            return [IsAdminUser()]
         return [IsAuthenticated()]
 
     def get_queryset(self):
@@ -118,14 +138,17 @@ class AttendanceViewSet(viewsets.ModelViewSet):
             {"count": Attendance.objects.filter(edition=edition).count()}
         )
 
-    def _user_is_admin(self):
-        user = getattr(self.request, "user", None)
-        return bool(
-            user
-            and user.is_authenticated
-            and user.groups.filter(name="DPMS Admins").exists()
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """Stream the RSVPs as CSV, optionally for a single ?edition=<id>."""
+        edition_id = request.query_params.get("edition", "all")
+        return ATTENDANCE_EXPORT.response(
+            self.get_queryset(), f"attendance_edition_{edition_id}.csv"
         )
 
+    def _user_is_admin(self):
+        return is_dpms_admin(getattr(self.request, "user", None))
+
     def _check_ownership(self, obj):
         if self._user_is_admin() or obj.user_id == self.request.user.id:
             return
@@ -4,6 +4,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from dpms.utils.views import AtomicWritesMixin
 
 from dpms.compos.models import Compo, HasCompo
 from dpms.compos.serializers import (
@@ -15,7 +16,7 @@ from dpms.compos.serializers import (
 from dpms.compos.permissions import IsAdminOrReadOnly, IsOwnerOrAdmin
 
 
-class CompoViewSet(viewsets.ModelViewSet):
+class CompoViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Compos (competition types).
 
@@ -27,6 +28,7 @@ class CompoViewSet(viewsets.ModelViewSet):
     productions: List all productions for this compo
     """
 
+    pagination_class = None
     queryset = Compo.objects.all().select_related('created_by')
     permission_classes = [IsAdminOrReadOnly]
 
@@ -63,7 +65,7 @@ class CompoViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class HasCompoViewSet(viewsets.ModelViewSet):
+class HasCompoViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing HasCompo (Edition-Compo associations).
 
@@ -74,6 +76,7 @@ class HasCompoViewSet(viewsets.ModelViewSet):
     destroy: Remove association (admin only)
     """
 
+    pagination_class = None
     queryset = HasCompo.objects.all().select_related('edition', 'compo', 'created_by')
     serializer_class = HasCompoSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
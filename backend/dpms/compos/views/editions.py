@@ -5,10 +5,11 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from rest_framework.throttling import SimpleRateThrottle
+from dpms.utils.throttling import SharedRateThrottle
+from dpms.utils.views import AtomicWritesMixin
 
 
-class ContactRateThrottle(SimpleRateThrottle):
+class ContactRateThrottle(SharedRateThrottle):
     rate = '3/minute'
 
     def get_cache_key(self, request, view):
@@ -29,9 +30,10 @@ from dpms.compos.serializers import (
     ContactFormSerializer,
 )
 from dpms.compos.permissions import IsAdminOrReadOnly, IsOwnerOrAdmin
+from dpms.users.roles import is_dpms_admin
 
 
-class EditionViewSet(viewsets.ModelViewSet):
+class EditionViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Editions (demo party events).
 
@@ -44,6 +46,7 @@ class EditionViewSet(viewsets.ModelViewSet):
     productions: List productions for this edition
     """
 
+    pagination_class = None
     queryset = Edition.objects.all().select_related('uploaded_by').prefetch_related('compos')
     permission_classes = [IsAdminOrReadOnly]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
@@ -108,9 +111,7 @@ class EditionViewSet(viewsets.ModelViewSet):
         productions = edition.productions.all().select_related('uploaded_by', 'compo')
 
         # Non-admin users only see approved productions
-        is_admin = request.user.is_authenticated and request.user.groups.filter(
-            name="DPMS Admins"
-        ).exists()
+        is_admin = is_dpms_admin(request.user)
         if not is_admin:
             productions = productions.filter(status='approved')
 
@@ -5,8 +5,12 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
-from django.http import FileResponse, Http404
+from dpms.utils.views import AtomicWritesMixin
+from django.db import transaction
+from django.http import Http404
+from dpms.utils.media import read_signed_media, serve_media_file
 
+from dpms.compos.blobs import release_blob
 from dpms.compos.models import File
 from dpms.compos.serializers import (
     FileSerializer,
@@ -14,9 +18,10 @@ from dpms.compos.serializers import (
     FileUpdateSerializer,
 )
 from dpms.compos.permissions import IsOwnerOrAdmin
+from dpms.users.roles import is_dpms_admin
 
 
-class FileViewSet(viewsets.ModelViewSet):
+class FileViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Files.
 
@@ -37,7 +42,7 @@ class FileViewSet(viewsets.ModelViewSet):
         queryset = super().get_queryset()
 
         # Admins can see all files
-        if self.request.user.groups.filter(name='DPMS Admins').exists():
+        if is_dpms_admin(self.request.user):
             return queryset
 
         # Regular users only see their own files
@@ -52,10 +57,12 @@ class FileViewSet(viewsets.ModelViewSet):
         return FileSerializer
 
     def perform_destroy(self, instance):
-        """Soft delete: mark as deleted instead of actually deleting"""
+        """Soft delete: mark as deleted and drop the reference to its content"""
         instance.is_deleted = True
         instance.is_active = False
         instance.save()
+        if instance.blob_id:
+            release_blob(instance.blob_id)
 
     @action(detail=True, methods=['get'])
     def download(self, request, pk=None):
@@ -69,7 +76,7 @@ class FileViewSet(viewsets.ModelViewSet):
         # Check if file is public or user has permission
         if not file_obj.public and file_obj.uploaded_by != request.user:
             # Check if user is admin
-            if not request.user.groups.filter(name='DPMS Admins').exists():
+            if not is_dpms_admin(request.user):
                 return Response(
                     {'detail': 'You do not have permission to download this file.'},
                     status=status.HTTP_403_FORBIDDEN
@@ -78,10 +85,21 @@ class FileViewSet(viewsets.ModelViewSet):
         if not file_obj.file:
             raise Http404("File not found")
 
-        # Return file for download
-        response = FileResponse(
-            file_obj.file.open('rb'),
+        # Return file for download (sent by nginx when behind it)
+        return serve_media_file(
+            request,
+            file_obj.file.name,
             as_attachment=True,
             filename=file_obj.get_download_filename()
         )
-        return response
+
+
+@transaction.non_atomic_requests
+def signed_media(request, token, filename):
+    """
+    Media file of a signed URL (see dpms.utils.media.signed_media_url).
+
+    For links that cannot send credentials, such as the StageRunner <video>
+    tags: the signature is the permission.
+    """
+    return serve_media_file(request, read_signed_media(token), filename=filename)
@@ -5,6 +5,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.parsers import MultiPartParser, FormParser
+from dpms.utils.views import AtomicWritesMixin
 
 from dpms.compos.models import GalleryImage, Edition
 from dpms.compos.serializers import (
@@ -14,9 +15,10 @@ from dpms.compos.serializers import (
     GalleryImageDetailSerializer,
 )
 from dpms.compos.permissions import IsOwnerOrAdmin
+from dpms.users.roles import is_dpms_admin
 
 
-class GalleryImageViewSet(viewsets.ModelViewSet):
+class GalleryImageViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Gallery Images.
 
@@ -56,10 +58,10 @@ class GalleryImageViewSet(viewsets.ModelViewSet):
 
         # For update/delete actions, only show own images (unless admin)
         elif self.action in ['update', 'partial_update', 'destroy']:
-            if not self.request.user.groups.filter(name='DPMS Admins').exists():
+            if not is_dpms_admin(self.request.user):
                 queryset = queryset.filter(uploaded_by=self.request.user)
 
-        return queryset.order_by('-created')
+        return queryset.order_by('-created', 'id')
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -7,6 +7,8 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from dpms.utils.exports import CSVExport
+from dpms.utils.views import AtomicWritesMixin
 
 from dpms.compos.models import Production
 from dpms.compos.models.productions import STATUS_CHOICES, REJECTION_REASONS
@@ -16,9 +18,25 @@ from dpms.compos.serializers import (
     ProductionCreateSerializer,
 )
 from dpms.compos.permissions import IsOwnerOrAdmin
+from dpms.users.roles import is_dpms_admin
 
 
-class ProductionViewSet(viewsets.ModelViewSet):
+PRODUCTIONS_EXPORT = CSVExport([
+    ('ID', 'id'),
+    ('Edition', 'edition.title'),
+    ('Compo', 'compo.name'),
+    ('Title', 'title'),
+    ('Authors', 'authors'),
+    ('Platform', 'platform'),
+    ('Status', 'status'),
+    ('Uploaded By', 'uploaded_by.email'),
+    ('Ranking', 'ranking_position'),
+    ('Score', 'ranking_score'),
+    ('Submitted At', 'created'),
+])
+
+
+class ProductionViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Productions (submitted works).
 
@@ -28,6 +46,7 @@ class ProductionViewSet(viewsets.ModelViewSet):
     update: Update production (owner or admin, if updates allowed)
     destroy: Delete production (owner or admin)
     my_productions: List current user's productions
+    export: CSV of the productions (admin only)
     update_status: Change production status (admin only)
 
     Productions visibility:
@@ -48,7 +67,7 @@ class ProductionViewSet(viewsets.ModelViewSet):
         user = self.request.user
         if not user.is_authenticated:
             return False
-        return user.is_staff or user.groups.filter(name='DPMS Admins').exists()
+        return user.is_staff or is_dpms_admin(user)
 
     def get_queryset(self):
         """Filter productions based on query params and visibility rules"""
@@ -90,7 +109,7 @@ class ProductionViewSet(viewsets.ModelViewSet):
                         status='approved'
                     )
 
-        return queryset.order_by('-created')
+        return queryset.order_by('-created', 'id')
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -123,6 +142,24 @@ class ProductionViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(productions, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def export(self, request):
+        """
+        Export productions as CSV (admin only), streamed row by row.
+
+        GET /api/productions/export/?edition={id}&compo={id}&status=...
+        """
+        if not self._is_admin():
+            return Response(
+                {"error": "Only admins can export productions"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        # Files are not exported: drop the prefetch, it would run per chunk
+        productions = self.get_queryset().prefetch_related(None)
+        edition_id = request.query_params.get('edition', 'all')
+        return PRODUCTIONS_EXPORT.response(productions, f'productions_edition_{edition_id}.csv')
+
     @action(detail=True, methods=['patch'], permission_classes=[IsAuthenticated])
     def update_status(self, request, pk=None):
         """
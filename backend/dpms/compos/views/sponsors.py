@@ -5,6 +5,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from dpms.utils.views import AtomicWritesMixin
 
 from dpms.compos.models import Sponsor
 from dpms.compos.serializers import (
@@ -15,7 +16,7 @@ from dpms.compos.serializers import (
 from dpms.compos.permissions import IsAdminUser
 
 
-class SponsorViewSet(viewsets.ModelViewSet):
+class SponsorViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Sponsors.
 
@@ -27,6 +28,7 @@ class SponsorViewSet(viewsets.ModelViewSet):
     by_edition: Get sponsors for a specific edition
     """
 
+    pagination_class = None
     queryset = Sponsor.objects.all().prefetch_related('editions')
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
@@ -1,13 +1,17 @@
 """StageRunner ViewSets"""
 
-from rest_framework import viewsets, status
+from rest_framework import generics, viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from dpms.utils.views import AtomicWritesMixin
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.db.models import Sum, Count
+from django.utils.http import parse_etags
+from django.db.models import F
+from django.db.models.functions import Coalesce
 
 from dpms.compos.models import (
     StageRunnerConfig,
@@ -20,7 +24,7 @@ from dpms.compos.models import (
     HasCompo,
     Edition,
     Sponsor,
-    Vote,
+    TranscodeJob,
 )
 from dpms.compos.serializers import (
     StageRunnerConfigSerializer,
@@ -30,6 +34,7 @@ from dpms.compos.serializers import (
     StageSlideListSerializer,
     StageSlideDetailSerializer,
     SlideElementSerializer,
+    TranscodeJobSerializer,
     StagePresentationSerializer,
     StagePresentationListSerializer,
     StagePresentationDetailSerializer,
@@ -42,9 +47,39 @@ from dpms.compos.serializers import (
     CreateFromTemplateSerializer,
 )
 from dpms.compos.permissions import IsAdminUser
+from dpms.compos.control_channel import ChannelBusy, control_channel
+from dpms.compos.full_state import full_state_json
 
 
-class StageRunnerConfigViewSet(viewsets.ModelViewSet):
+def revision_etag(kind, config_id, revision):
+    """Strong ETag of a StageRunner representation at a given revision."""
+    return f'"{kind}-{config_id}-{revision}"'
+
+
+def not_modified(request, etag):
+    """
+    Return a 304 response if the request's If-None-Match matches ``etag``.
+
+    Compared weakly, as RFC 9110 asks for If-None-Match (proxies such as
+    nginx's gzip turn strong ETags into weak ones).
+    """
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match:
+        return None
+    etags = [tag.removeprefix('W/') for tag in parse_etags(if_none_match)]
+    if etag in etags or '*' in etags:
+        return with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+    return None
+
+
+def with_etag(response, etag):
+    """Attach ``etag`` to a response and make clients revalidate it."""
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+class StageRunnerConfigViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing StageRunner configurations.
 
@@ -56,6 +91,7 @@ class StageRunnerConfigViewSet(viewsets.ModelViewSet):
     full_state: Get complete state for visualizer
     """
 
+    pagination_class = None
     queryset = StageRunnerConfig.objects.all().select_related('edition')
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
@@ -98,9 +134,20 @@ class StageRunnerConfigViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        config = get_object_or_404(StageRunnerConfig, edition_id=edition_id)
+        config_id, revision = generics.get_object_or_404(
+            StageRunnerConfig.objects.values_list('id', 'revision'),
+            edition_id=edition_id
+        )
+        etag = revision_etag('config', config_id, revision)
+        response = not_modified(request, etag)
+        if response:
+            return response
+
+        config = StageRunnerConfig.objects.select_related('edition').prefetch_related(
+            'slides'
+        ).get(pk=config_id)
         serializer = StageRunnerConfigDetailSerializer(config)
-        return Response(serializer.data)
+        return with_etag(Response(serializer.data), etag)
 
     @action(detail=True, methods=['get'], permission_classes=[AllowAny], url_path='full-state')
     def full_state(self, request, pk=None):
@@ -109,24 +156,31 @@ class StageRunnerConfigViewSet(viewsets.ModelViewSet):
         Includes config, all slides with elements, presentations, and control state.
 
         GET /api/stagerunner-config/<id>/full-state/
-        """
-        config = self.get_object()
 
-        # Prefetch related data for performance
-        config = StageRunnerConfig.objects.prefetch_related(
-            'slides__elements',
-            'presentations__presentation_slides__slide',
-            'control'
-        ).select_related('edition').get(pk=config.pk)
+        Carries an ETag derived from the config revision; a matching
+        If-None-Match is answered with 304 without serializing anything.
+        The JSON itself comes from the full-state cache (dpms.compos.full_state).
+        """
+        revision = generics.get_object_or_404(
+            StageRunnerConfig.objects.values_list('revision', flat=True), pk=pk
+        )
+        etag = revision_etag('full-state', pk, revision)
+        response = not_modified(request, etag)
+        if response:
+            return response
 
         # Ensure control object exists
-        StageControl.objects.get_or_create(config=config)
+        control, created = StageControl.objects.get_or_create(config_id=pk)
+        if created:
+            revision = StageRunnerConfig.objects.values_list('revision', flat=True).get(pk=pk)
+            etag = revision_etag('full-state', pk, revision)
 
-        serializer = StageRunnerFullStateSerializer(config)
-        return Response(serializer.data)
+        # Rendered once per revision and served as pre-encoded bytes
+        content = full_state_json(pk, revision)
+        return with_etag(HttpResponse(content, content_type='application/json'), etag)
 
 
-class StageSlideViewSet(viewsets.ModelViewSet):
+class StageSlideViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing StageRunner slides.
 
@@ -139,6 +193,7 @@ class StageSlideViewSet(viewsets.ModelViewSet):
     duplicate: Duplicate a slide (admin only)
     """
 
+    pagination_class = None
     queryset = StageSlide.objects.all().select_related('config', 'has_compo')
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
@@ -195,6 +250,9 @@ class StageSlideViewSet(viewsets.ModelViewSet):
         for order, slide_id in enumerate(slide_ids):
             StageSlide.objects.filter(id=slide_id).update(display_order=order)
 
+        # Queryset updates send no signals
+        StageRunnerConfig.bump_revision(slides__in=slide_ids)
+
         return Response({'status': 'ok'})
 
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsAdminUser])
@@ -258,7 +316,7 @@ class StageSlideViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class SlideElementViewSet(viewsets.ModelViewSet):
+class SlideElementViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing slide elements.
 
@@ -269,6 +327,7 @@ class SlideElementViewSet(viewsets.ModelViewSet):
     destroy: Delete element (admin only)
     """
 
+    pagination_class = None
     queryset = SlideElement.objects.all().select_related('slide')
     serializer_class = SlideElementSerializer
     parser_classes = [MultiPartParser, FormParser, JSONParser]
@@ -291,7 +350,35 @@ class SlideElementViewSet(viewsets.ModelViewSet):
         return queryset.order_by('z_index', 'created')
 
 
-class StageControlViewSet(viewsets.ModelViewSet):
+class TranscodeJobViewSet(AtomicWritesMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Progress of the video conversions (admin only).
+
+    list: Jobs, filtered by ?slide=<id> (videos of its elements) or ?ids=1,2
+    retrieve: Job detail
+    """
+
+    pagination_class = None
+    queryset = TranscodeJob.objects.all()
+    serializer_class = TranscodeJobSerializer
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get_queryset(self):
+        """Filter jobs based on query params"""
+        queryset = super().get_queryset()
+
+        slide_id = self.request.query_params.get('slide')
+        if slide_id:
+            queryset = queryset.filter(elements__slide_id=slide_id).distinct()
+
+        ids = self.request.query_params.get('ids')
+        if ids:
+            queryset = queryset.filter(pk__in=[pk for pk in ids.split(',') if pk.isdigit()])
+
+        return queryset.order_by('id')
+
+
+class StageControlViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing StageRunner control state.
 
@@ -301,13 +388,21 @@ class StageControlViewSet(viewsets.ModelViewSet):
     next: Go to next slide/production (admin only)
     previous: Go to previous slide/production (admin only)
     toggle_play: Toggle auto-advance (admin only)
+    watch: Long-poll the control state of a config (public for visualizer)
     """
 
+    pagination_class = None
     queryset = StageControl.objects.all().select_related(
         'config', 'current_slide', 'current_production'
     )
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
+    # Long-poll wait bounds, in seconds
+    WATCH_TIMEOUT = 25
+    WATCH_MAX_TIMEOUT = 55
+    # Seconds a client turned away because too many are waiting retries after
+    WATCH_RETRY_AFTER = 5
+
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
         if self.action == 'retrieve':
@@ -316,7 +411,7 @@ class StageControlViewSet(viewsets.ModelViewSet):
 
     def get_permissions(self):
         """Set permissions based on action"""
-        if self.action in ['retrieve', 'by_config']:
+        if self.action in ['retrieve', 'by_config', 'watch']:
             return [AllowAny()]
         return [IsAuthenticated(), IsAdminUser()]
 
@@ -350,11 +445,81 @@ class StageControlViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        control, created = StageControl.objects.get_or_create(
-            config_id=config_id
+        revision = generics.get_object_or_404(
+            StageRunnerConfig.objects.values_list('revision', flat=True), pk=config_id
         )
+        etag = revision_etag('control', config_id, revision)
+        response = not_modified(request, etag)
+        if response:
+            return response
+
+        control, created = StageControl.objects.select_related(
+            'config', 'current_slide', 'current_production', 'current_presentation'
+        ).get_or_create(config_id=config_id)
+        if created:
+            revision = StageRunnerConfig.objects.values_list('revision', flat=True).get(pk=config_id)
+            etag = revision_etag('control', config_id, revision)
+
         serializer = StageControlDetailSerializer(control)
-        return Response(serializer.data)
+        return with_etag(Response(serializer.data), etag)
+
+    @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    def watch(self, request):
+        """
+        Long-poll the control state of a config.
+
+        GET /api/stage-control/watch/?config=<id>&timeout=<seconds>
+        Header: If-None-Match: <etag of the state the client has>
+
+        Answers right away with the state when it differs from the client's
+        ETag, otherwise waits until it changes (200) or the timeout expires
+        (304). The ETag is the quoted command_timestamp of the payload.
+        When the process already holds its maximum of waiting requests
+        (STAGE_CONTROL_MAX_WATCHERS), answers 503 with Retry-After.
+        """
+        try:
+            config_id = int(request.query_params.get('config', ''))
+        except ValueError:
+            return Response(
+                {'error': 'config parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            timeout = float(request.query_params.get('timeout', self.WATCH_TIMEOUT))
+        except ValueError:
+            timeout = self.WATCH_TIMEOUT
+        timeout = max(0, min(timeout, self.WATCH_MAX_TIMEOUT))
+
+        # Before the channel keeps anything for the id
+        config = get_object_or_404(StageRunnerConfig, id=config_id)
+
+        def load():
+            control, created = StageControl.objects.select_related(
+                'config', 'current_slide', 'current_production', 'current_presentation'
+            ).get_or_create(config=config)
+            data = StageControlDetailSerializer(control).data
+            return f'"{data["command_timestamp"]}"', data
+
+        try:
+            etag, data = control_channel.wait(
+                config_id, request.headers.get('If-None-Match'), load, timeout
+            )
+        except ChannelBusy:
+            response = Response(
+                {'error': 'Too many clients waiting, retry later'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+            response['Retry-After'] = str(self.WATCH_RETRY_AFTER)
+            return response
+
+        if data is None:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'
+        return response
 
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsAdminUser])
     def navigate(self, request, pk=None):
@@ -571,7 +736,7 @@ class StageControlViewSet(viewsets.ModelViewSet):
         return Response(StageControlDetailSerializer(control).data)
 
 
-class StagePresentationViewSet(viewsets.ModelViewSet):
+class StagePresentationViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing StageRunner presentations.
 
@@ -581,7 +746,10 @@ class StagePresentationViewSet(viewsets.ModelViewSet):
     - Awards: Reveal results with podium
     """
 
-    queryset = StagePresentation.objects.all().select_related('config', 'has_compo')
+    pagination_class = None
+    queryset = StagePresentation.objects.all().select_related(
+        'config', 'has_compo__compo'
+    ).prefetch_related('presentation_slides__slide')
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
     def get_serializer_class(self):
@@ -666,6 +834,9 @@ class StagePresentationViewSet(viewsets.ModelViewSet):
                 slide_id=slide_id
             ).update(display_order=order)
 
+        # Queryset updates send no signals
+        StageRunnerConfig.bump_revision(pk=presentation.config_id)
+
         return Response(StagePresentationDetailSerializer(presentation).data)
 
     @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, IsAdminUser], url_path='from-template')
@@ -1024,7 +1195,7 @@ class StagePresentationViewSet(viewsets.ModelViewSet):
             order += 1
 
 
-class StageRunnerDataViewSet(viewsets.ViewSet):
+class StageRunnerDataViewSet(AtomicWritesMixin, viewsets.ViewSet):
     """
     ViewSet for dynamic data used by StageRunner visualizer.
     Provides endpoints for compo data, results, sponsors, etc.
@@ -1065,23 +1236,21 @@ class StageRunnerDataViewSet(viewsets.ViewSet):
         """
         has_compo = get_object_or_404(HasCompo, pk=has_compo_id)
 
+        # Scores come from the per-production vote tallies
         productions = Production.objects.filter(
             edition=has_compo.edition,
             compo=has_compo.compo
+        ).annotate(
+            total_score=Coalesce(F('tally__public_sum') + F('tally__jury_sum'), 0),
+            votes_count=Coalesce(F('tally__public_count') + F('tally__jury_count'), 0),
         )
 
         results = []
         for prod in productions:
-            # Calculate score from votes
-            votes = Vote.objects.filter(production=prod)
-            total_score = votes.aggregate(
-                total=Sum('score')
-            )['total'] or 0
-
             results.append({
                 'production': ProductionForStageSerializer(prod).data,
-                'score': float(total_score),
-                'votes_count': votes.count(),
+                'score': float(prod.total_score),
+                'votes_count': prod.votes_count,
                 'position': 0  # Will be set after sorting
             })
 
@@ -0,0 +1,148 @@
+"""Resumable upload ViewSet"""
+
+from rest_framework import mixins, viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.parsers import JSONParser
+from dpms.utils.views import AtomicWritesMixin
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+
+from dpms.compos.models import UploadSession
+from dpms.compos.serializers import (
+    FileSerializer,
+    SlideElementSerializer,
+    UploadSessionSerializer,
+)
+from dpms.compos.uploads import (
+    ChecksumMismatch,
+    OffsetMismatch,
+    discard,
+    finalize as finalize_upload,
+    session_path,
+    write_chunk,
+)
+
+# tus status for a chunk that does not match its checksum
+HTTP_460_CHECKSUM_MISMATCH = 460
+
+
+class UploadSessionViewSet(AtomicWritesMixin,
+                           mixins.CreateModelMixin,
+                           mixins.RetrieveModelMixin,
+                           mixins.DestroyModelMixin,
+                           viewsets.GenericViewSet):
+    """
+    Resumable chunked uploads (protocol in dpms.compos.uploads).
+
+    create: Start an upload (target, filename, size, optional checksum)
+    retrieve: Upload state and the offset to resume from (also HEAD)
+    partial_update: Send the next chunk as the raw body (PATCH)
+    update: Same as partial_update (PUT)
+    destroy: Abort an upload
+    finalize: Turn the complete upload into its File or StageRunner video
+    """
+
+    pagination_class = None
+    serializer_class = UploadSessionSerializer
+    permission_classes = [IsAuthenticated]
+    # Chunks are read from the request stream, never parsed
+    parser_classes = [JSONParser]
+
+    def get_queryset(self):
+        """Users only see their own uploads"""
+        return UploadSession.objects.filter(uploaded_by=self.request.user)
+
+    def get_locked_session(self, pk):
+        """The session, locked until the end of the request"""
+        return get_object_or_404(self.get_queryset().select_for_update(), pk=pk)
+
+    def session_response(self, session, status_code=status.HTTP_200_OK):
+        """Session state, with its offset also in the tus header"""
+        response = Response(self.get_serializer(session).data, status=status_code)
+        response['Upload-Offset'] = str(session.offset)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Upload state.
+
+        GET|HEAD /api/uploads/{id}/
+        """
+        return self.session_response(self.get_object())
+
+    def partial_update(self, request, pk=None):
+        """
+        Send a chunk.
+
+        PATCH /api/uploads/{id}/
+        Headers: Upload-Offset, Upload-Checksum ("sha256 <base64 digest>")
+        Body: the chunk's bytes
+        """
+        session = self.get_locked_session(pk)
+
+        try:
+            length = int(request.META.get('CONTENT_LENGTH') or '')
+        except ValueError:
+            return Response(
+                {'detail': 'Content-Length is required.'},
+                status=status.HTTP_411_LENGTH_REQUIRED
+            )
+        try:
+            offset = int(request.headers.get('Upload-Offset', ''))
+        except ValueError:
+            return Response(
+                {'detail': 'The Upload-Offset header is required.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        checksum = request.headers.get('Upload-Checksum')
+        if not checksum:
+            return Response(
+                {'detail': 'The Upload-Checksum header is required.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            write_chunk(session, request.stream, length, offset, checksum)
+        except OffsetMismatch as e:
+            response = self.session_response(session, status.HTTP_409_CONFLICT)
+            response.data['detail'] = str(e)
+            return response
+        except ChecksumMismatch as e:
+            return Response({'detail': str(e)}, status=HTTP_460_CHECKSUM_MISMATCH)
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return self.session_response(session)
+
+    update = partial_update
+
+    def perform_destroy(self, instance):
+        """Abort: delete the session and, once committed, its partial file"""
+        path = session_path(instance)
+        instance.delete()
+        transaction.on_commit(lambda: discard(path))
+
+    @action(detail=True, methods=['post'])
+    def finalize(self, request, pk=None):
+        """
+        Turn the complete upload into its target.
+
+        POST /api/uploads/{id}/finalize/
+
+        Returns the File for file uploads, the SlideElement for videos.
+        """
+        session = self.get_locked_session(pk)
+        try:
+            result = finalize_upload(session)
+        except ChecksumMismatch as e:
+            return Response({'detail': str(e)}, status=HTTP_460_CHECKSUM_MISMATCH)
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if session.target == UploadSession.TARGET_FILE:
+            serializer = FileSerializer(result, context=self.get_serializer_context())
+        else:
+            serializer = SlideElementSerializer(result, context=self.get_serializer_context())
+        return Response(serializer.data)
@@ -1,11 +1,17 @@
 """Voting system ViewSets"""
 
+import segno
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.db import transaction
-from django.db.models import Q, Avg, Count
+from dpms.utils.exports import CSVExport
+from dpms.utils.throttling import SharedRateThrottle
+from dpms.utils.views import AtomicWritesMixin
+from dpms.utils.media import serve_media_file
+from django.db.models import Q, F, Sum
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 
@@ -18,6 +24,7 @@ from dpms.compos.models import (
     VotingPeriod,
     Edition,
     Production,
+    ProductionTally,
 )
 from dpms.compos.serializers import (
     VotingConfigurationSerializer,
@@ -26,18 +33,60 @@ from dpms.compos.serializers import (
     AttendanceCodeUseSerializer,
     AttendeeVerificationSerializer,
     AttendeeVerificationCreateSerializer,
+    CheckinSerializer,
     JuryMemberSerializer,
     JuryMemberCreateSerializer,
     VoteSerializer,
     VoteCreateSerializer,
+    VoteBatchItemSerializer,
     VotingPeriodSerializer,
     VotingResultsSerializer,
     VotingStatsSerializer,
 )
 from dpms.compos.permissions import IsAdminOrReadOnly, IsOwnerOrAdmin
+from dpms.users.roles import is_dpms_admin
+from dpms.compos.results import edition_results
+from dpms.compos.ballots import MAX_BALLOT_SIZE, submit_ballot
+from dpms.compos.checkin import check_in, make_checkin_payload, uses_checkin
+from dpms.compos.code_sheets import get_or_build_sheets
+from dpms.compos.redemption import redeem_code
+from dpms.compos.period_index import get_period_index, get_period_indexes
+
+
+class CheckinRateThrottle(SharedRateThrottle):
+    """A door scanner reads a pass every couple of seconds at peak times."""
+
+    rate = "600/minute"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": "checkin",
+            "ident": request.user.pk,
+        }
 
 
-class VotingConfigurationViewSet(viewsets.ModelViewSet):
+CODES_EXPORT = CSVExport([
+    ("Code", "code"),
+    ("Used", "is_used"),
+    ("Used By", "used_by.email"),
+    ("Used At", "used_at"),
+])
+
+VOTES_EXPORT = CSVExport([
+    ("Voter", "user.email"),
+    ("Nickname", "user.profile.nickname"),
+    ("Compo", "production.compo.name"),
+    ("Production ID", "production_id"),
+    ("Production", "production.title"),
+    ("Authors", "production.authors"),
+    ("Score", "score"),
+    ("Jury", "is_jury_vote"),
+    ("Comment", "comment"),
+    ("Voted At", "created"),
+])
+
+
+class VotingConfigurationViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing VotingConfiguration.
 
@@ -49,6 +98,7 @@ class VotingConfigurationViewSet(viewsets.ModelViewSet):
     publish_results: Publish results for an edition
     """
 
+    pagination_class = None
     queryset = VotingConfiguration.objects.all().select_related("edition")
     serializer_class = VotingConfigurationSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
@@ -73,7 +123,7 @@ class VotingConfigurationViewSet(viewsets.ModelViewSet):
         config = self.get_object()
 
         # Check if user is admin
-        if not request.user.groups.filter(name="DPMS Admins").exists():
+        if not is_dpms_admin(request.user):
             return Response(
                 {"error": "Only admins can publish results"},
                 status=status.HTTP_403_FORBIDDEN,
@@ -91,7 +141,7 @@ class VotingConfigurationViewSet(viewsets.ModelViewSet):
         )
 
 
-class AttendanceCodeViewSet(viewsets.ModelViewSet):
+class AttendanceCodeViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing AttendanceCodes.
 
@@ -102,9 +152,12 @@ class AttendanceCodeViewSet(viewsets.ModelViewSet):
     generate: Generate batch of attendance codes (admin only)
     use: Use an attendance code (authenticated users)
     export: Export attendance codes for printing (admin only)
+    sheets: Printable PDF sheets of the unused codes with QR codes (admin only)
     """
 
     queryset = AttendanceCode.objects.all().select_related("edition", "used_by")
+    # Codes are unique, so they page on their own
+    cursor_ordering = ("code",)
     serializer_class = AttendanceCodeSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
 
@@ -135,7 +188,7 @@ class AttendanceCodeViewSet(viewsets.ModelViewSet):
         }
         """
         # Check if user is admin
-        if not request.user.groups.filter(name="DPMS Admins").exists():
+        if not is_dpms_admin(request.user):
             return Response(
                 {"error": "Only admins can generate codes"},
                 status=status.HTTP_403_FORBIDDEN,
@@ -181,44 +234,31 @@ class AttendanceCodeViewSet(viewsets.ModelViewSet):
         serializer = AttendanceCodeUseSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        code_string = serializer.validated_data["code"]
-
         try:
-            with transaction.atomic():
-                code = AttendanceCode.objects.select_for_update().get(
-                    code=code_string
-                )
-
-                if code.is_used:
-                    return Response(
-                        {"error": "Code already used"},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-
-                code.use_code(request.user)
+            edition_id, _ = redeem_code(serializer.validated_data["code"], request.user)
         except AttendanceCode.DoesNotExist:
             return Response(
                 {"error": "Invalid code"}, status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except ValidationError as e:
+            return Response({"error": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response(
             {
                 "message": "Code used successfully. You are now verified as an attendee.",
-                "edition": code.edition.title,
+                "edition": Edition.objects.values_list("title", flat=True).get(pk=edition_id),
             }
         )
 
     @action(detail=False, methods=["get"])
     def export(self, request):
         """
-        Export attendance codes for an edition.
+        Export attendance codes for an edition as CSV, streamed row by row.
 
-        GET /api/attendance-codes/export/?edition={id}
+        GET /api/attendance-codes/export/?edition={id}&used=true|false
         """
         # Check if user is admin
-        if not request.user.groups.filter(name="DPMS Admins").exists():
+        if not is_dpms_admin(request.user):
             return Response(
                 {"error": "Only admins can export codes"},
                 status=status.HTTP_403_FORBIDDEN,
@@ -230,30 +270,60 @@ class AttendanceCodeViewSet(viewsets.ModelViewSet):
                 {"error": "Edition ID required"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        codes = AttendanceCode.objects.filter(edition_id=edition_id).order_by("code")
+        codes = (
+            AttendanceCode.objects.filter(edition_id=edition_id)
+            .select_related("used_by")
+            .order_by("code")
+        )
+        used = request.query_params.get("used")
+        if used is not None:
+            codes = codes.filter(is_used=used.lower() == "true")
+
+        return CODES_EXPORT.response(codes, f"codes_edition_{edition_id}.csv")
 
-        # Return as CSV data
-        import csv
-        from django.http import HttpResponse
+    @action(detail=False, methods=["get"])
+    def sheets(self, request):
+        """
+        Download the unused codes of an edition as printable PDF sheets.
 
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="codes_edition_{edition_id}.csv"'
+        GET /api/attendance-codes/sheets/?edition={id}
 
-        writer = csv.writer(response)
-        writer.writerow(["Code", "Used", "Used By", "Used At"])
+        Sheets are rendered in the background: until they are ready the
+        response is 202 {"status": "building"} and the client polls again.
+        """
+        # Check if user is admin
+        if not is_dpms_admin(request.user):
+            return Response(
+                {"error": "Only admins can print codes"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
 
-        for code in codes:
-            writer.writerow([
-                code.code,
-                "Yes" if code.is_used else "No",
-                code.used_by.email if code.used_by else "",
-                code.used_at.strftime("%Y-%m-%d %H:%M") if code.used_at else "",
-            ])
+        edition_id = request.query_params.get("edition")
+        if not edition_id:
+            return Response(
+                {"error": "Edition ID required"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        edition = get_object_or_404(Edition, pk=edition_id)
 
-        return response
+        path, ready = get_or_build_sheets(edition)
+        if path is None:
+            return Response(
+                {"error": "No unused codes to print"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not ready:
+            return Response({"status": "building"}, status=status.HTTP_202_ACCEPTED)
+
+        return serve_media_file(
+            request,
+            path,
+            as_attachment=True,
+            filename=f"codes_edition_{edition.pk}.pdf",
+            content_type="application/pdf",
+        )
 
 
-class AttendeeVerificationViewSet(viewsets.ModelViewSet):
+class AttendeeVerificationViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing AttendeeVerifications.
 
@@ -263,6 +333,8 @@ class AttendeeVerificationViewSet(viewsets.ModelViewSet):
     update: Update verification (admin only)
     destroy: Delete verification (admin only)
     stats: Get verification statistics (admin only)
+    checkin: Check in attendees from scanned QR passes (admin only)
+    checkin_pass: QR pass of the current user (authenticated users)
     """
 
     queryset = AttendeeVerification.objects.all().select_related(
@@ -288,7 +360,7 @@ class AttendeeVerificationViewSet(viewsets.ModelViewSet):
         if is_verified is not None:
             queryset = queryset.filter(is_verified=is_verified.lower() == "true")
 
-        return queryset.order_by("-created")
+        return queryset.order_by("-created", "id")
 
     @action(detail=False, methods=["get"])
     def stats(self, request):
@@ -298,7 +370,7 @@ class AttendeeVerificationViewSet(viewsets.ModelViewSet):
         GET /api/attendee-verification/stats/?edition={id}
         """
         # Check if user is admin
-        if not request.user.groups.filter(name="DPMS Admins").exists():
+        if not is_dpms_admin(request.user):
             return Response(
                 {"error": "Only admins can view stats"},
                 status=status.HTTP_403_FORBIDDEN,
@@ -325,8 +397,72 @@ class AttendeeVerificationViewSet(viewsets.ModelViewSet):
 
         return Response(stats)
 
+    @action(detail=False, methods=["post"], throttle_classes=[CheckinRateThrottle])
+    def checkin(self, request):
+        """
+        Check in attendees from the QR passes read by a door scanner.
 
-class JuryMemberViewSet(viewsets.ModelViewSet):
+        POST /api/attendee-verification/checkin/
+        Body: {
+            "edition": 1,
+            "scans": [{"payload": "DPMS1:1:42:...", "scanned_at": "..."}, ...]
+        }
+
+        Live scanners send one scan per request; offline scanners upload
+        everything they read at once (scanned_at is optional). Returns one
+        result per scan, in order.
+        """
+        # Check if user is admin
+        if not is_dpms_admin(request.user):
+            return Response(
+                {"error": "Only admins can check in attendees"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        serializer = CheckinSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = check_in(
+            serializer.validated_data["edition"].pk,
+            serializer.validated_data["scans"],
+            request.user,
+        )
+        return Response({
+            "checked_in": sum(1 for result in results if result["status"] == "checked_in"),
+            "results": results,
+        })
+
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    def checkin_pass(self, request):
+        """
+        QR pass of the current user to check in at the door.
+
+        GET /api/attendee-verification/checkin_pass/?edition={id}
+        """
+        edition_id = request.query_params.get("edition")
+        if not edition_id or not edition_id.isdigit():
+            return Response(
+                {"error": "Edition ID required"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        edition = get_object_or_404(
+            Edition.objects.select_related("voting_config"), pk=edition_id
+        )
+        if not uses_checkin(edition):
+            return Response(
+                {"error": "This edition does not use physical check-in"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        payload = make_checkin_payload(edition.pk, request.user.pk)
+        return Response({
+            "edition": edition.pk,
+            "payload": payload,
+            "qr": segno.make_qr(payload, error="m").svg_data_uri(scale=8),
+        })
+
+
+class JuryMemberViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing JuryMembers.
 
@@ -338,6 +474,7 @@ class JuryMemberViewSet(viewsets.ModelViewSet):
     voting_progress: Get detailed voting progress
     """
 
+    pagination_class = None
     queryset = JuryMember.objects.all().select_related("user", "edition").prefetch_related("compos")
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
 
@@ -360,7 +497,7 @@ class JuryMemberViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(user_id=user_id)
 
         # Non-admin users can only see their own jury memberships
-        if not self.request.user.groups.filter(name="DPMS Admins").exists():
+        if not is_dpms_admin(self.request.user):
             queryset = queryset.filter(user=self.request.user)
 
         return queryset.order_by("-created")
@@ -378,7 +515,7 @@ class JuryMemberViewSet(viewsets.ModelViewSet):
         return Response(progress)
 
 
-class VoteViewSet(viewsets.ModelViewSet):
+class VoteViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Votes.
 
@@ -386,6 +523,7 @@ class VoteViewSet(viewsets.ModelViewSet):
     retrieve: Get vote details
     create: Create vote
     update: Update vote (within voting period)
+    batch: Create or update many votes at once
     my_votes: Get current user's votes
     production_votes: Get votes for a production
     """
@@ -405,7 +543,7 @@ class VoteViewSet(viewsets.ModelViewSet):
         queryset = super().get_queryset()
 
         # Non-admin users can only see their own votes
-        if not self.request.user.groups.filter(name="DPMS Admins").exists():
+        if not is_dpms_admin(self.request.user):
             queryset = queryset.filter(user=self.request.user)
 
         # Filter by query params
@@ -426,7 +564,72 @@ class VoteViewSet(viewsets.ModelViewSet):
         if is_jury is not None:
             queryset = queryset.filter(is_jury_vote=is_jury.lower() == "true")
 
-        return queryset.order_by("-created")
+        return queryset.order_by("-created", "id")
+
+    @action(detail=False, methods=["post"])
+    def batch(self, request):
+        """
+        Create or update many votes at once.
+
+        POST /api/votes/batch/
+        Body: [{"production": 1, "score": 8, "comment": ""}, ...]
+
+        Eligibility is resolved once and every vote is validated in memory;
+        the valid ones are upserted in a single transaction. Returns one
+        result per item, in order.
+        """
+        if not isinstance(request.data, list) or not request.data:
+            return Response(
+                {"error": "Se espera una lista de votos"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(request.data) > MAX_BALLOT_SIZE:
+            return Response(
+                {"error": f"Máximo {MAX_BALLOT_SIZE} votos por envío"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = [None] * len(request.data)
+        items = []
+        positions = []
+        for index, data in enumerate(request.data):
+            serializer = VoteBatchItemSerializer(data=data)
+            if serializer.is_valid():
+                items.append(serializer.validated_data)
+                positions.append(index)
+            else:
+                production = data.get("production") if isinstance(data, dict) else None
+                results[index] = {
+                    "production": production,
+                    "status": "error",
+                    "error": serializer.errors,
+                }
+
+        for index, result in zip(positions, submit_ballot(request.user, items, request)):
+            results[index] = result
+
+        saved = sum(1 for result in results if result["status"] != "error")
+        return Response(
+            {"saved": saved, "results": results},
+            status=status.HTTP_200_OK if saved else status.HTTP_400_BAD_REQUEST,
+        )
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        Export votes as CSV (admin only), streamed row by row.
+
+        GET /api/votes/export/?edition={id}&compo={id}&is_jury_vote=true|false
+        """
+        if not is_dpms_admin(request.user):
+            return Response(
+                {"error": "Only admins can export votes"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        votes = self.get_queryset().select_related("user__profile", "production__compo")
+        edition_id = request.query_params.get("edition", "all")
+        return VOTES_EXPORT.response(votes, f"votes_edition_{edition_id}.csv")
 
     @action(detail=False, methods=["get"])
     def my_votes(self, request):
@@ -465,7 +668,7 @@ class VoteViewSet(viewsets.ModelViewSet):
         production = get_object_or_404(Production, pk=production_id)
         config = getattr(production.edition, "voting_config", None)
 
-        is_admin = request.user.groups.filter(name="DPMS Admins").exists()
+        is_admin = is_dpms_admin(request.user)
 
         if not is_admin and (not config or not config.results_published):
             return Response(
@@ -473,32 +676,29 @@ class VoteViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        votes = Vote.objects.filter(production_id=production_id)
+        tally = ProductionTally.objects.filter(production=production).first()
+        tally = tally or ProductionTally(production=production)
 
         # Calculate statistics
         stats = {
-            "total_votes": votes.count(),
-            "public_votes": votes.filter(is_jury_vote=False).count(),
-            "jury_votes": votes.filter(is_jury_vote=True).count(),
-            "average_score": votes.aggregate(Avg("score"))["score__avg"] or 0,
-            "public_avg": votes.filter(is_jury_vote=False).aggregate(Avg("score"))[
-                "score__avg"
-            ]
-            or 0,
-            "jury_avg": votes.filter(is_jury_vote=True).aggregate(Avg("score"))[
-                "score__avg"
-            ]
-            or 0,
+            "total_votes": tally.total_count,
+            "public_votes": tally.public_count,
+            "jury_votes": tally.jury_count,
+            "average_score": tally.average,
+            "public_avg": tally.public_avg,
+            "jury_avg": tally.jury_avg,
         }
 
         # Add final score if config exists
         if config:
-            stats["final_score"] = config.calculate_final_score(production)
+            stats["final_score"] = config.weighted_score(
+                tally.public_avg, tally.jury_avg
+            )
 
         return Response(stats)
 
 
-class VotingPeriodViewSet(viewsets.ModelViewSet):
+class VotingPeriodViewSet(AtomicWritesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing VotingPeriods.
 
@@ -508,8 +708,10 @@ class VotingPeriodViewSet(viewsets.ModelViewSet):
     update: Update voting period (admin only)
     destroy: Delete voting period (admin only)
     current: Get currently active voting periods
+    open_status: Get open state of an edition and its compos
     """
 
+    pagination_class = None
     queryset = VotingPeriod.objects.all().select_related("edition", "compo")
     serializer_class = VotingPeriodSerializer
     permission_classes = [IsAdminOrReadOnly]
@@ -540,18 +742,66 @@ class VotingPeriodViewSet(viewsets.ModelViewSet):
         """
         Get currently open voting periods.
 
-        GET /api/voting-periods/current/
+        GET /api/voting-periods/current/?edition=X
+
+        Answered from the period index, without querying the periods.
         """
         now = timezone.now()
-        periods = VotingPeriod.objects.filter(
-            is_active=True, start_date__lte=now, end_date__gte=now
-        ).select_related("edition", "compo")
+        edition_id = request.query_params.get("edition")
 
-        serializer = self.get_serializer(periods, many=True)
-        return Response(serializer.data)
+        if edition_id:
+            try:
+                indexes = [get_period_index(int(edition_id))]
+            except ValueError:
+                return Response(
+                    {"error": "Invalid edition ID"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        else:
+            indexes = get_period_indexes().values()
 
+        periods = [period for index in indexes for period in index.open_periods(now)]
+        periods.sort(key=lambda period: period["start_date"], reverse=True)
+        return Response(periods)
 
-class VotingResultsViewSet(viewsets.ReadOnlyModelViewSet):
+    @action(detail=False, methods=["get"], url_path="status")
+    def open_status(self, request):
+        """
+        Get whether voting is open in an edition, edition-wide and for each
+        compo with voting periods of its own.
+
+        GET /api/voting-periods/status/?edition=X
+
+        Compos not listed follow the edition-wide state.
+        """
+        edition_id = request.query_params.get("edition")
+        if not edition_id:
+            return Response(
+                {"error": "Edition ID required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            index = get_period_index(int(edition_id))
+        except ValueError:
+            return Response(
+                {"error": "Invalid edition ID"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        now = timezone.now()
+        compos = {
+            compo_id: index.status(compo_id, now)
+            for compo_id in index.intervals
+            if compo_id is not None
+        }
+        return Response({
+            "edition": index.edition_id,
+            **index.status(None, now),
+            "compos": compos,
+        })
+
+
+class VotingResultsViewSet(AtomicWritesMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing voting results.
 
@@ -594,9 +844,7 @@ class VotingResultsViewSet(viewsets.ReadOnlyModelViewSet):
             )
 
         # For editions with VotingConfiguration, check permissions
-        is_admin = request.user.is_authenticated and request.user.groups.filter(
-            name="DPMS Admins"
-        ).exists()
+        is_admin = is_dpms_admin(request.user)
 
         if config and not is_admin and not config.results_published:
             return Response(
@@ -651,49 +899,7 @@ class VotingResultsViewSet(viewsets.ReadOnlyModelViewSet):
             })
 
         # Live voting results
-        productions = Production.objects.filter(edition=edition).prefetch_related(
-            "votes"
-        )
-
-        results = []
-        for production in productions:
-            public_votes = production.votes.filter(is_jury_vote=False)
-            jury_votes = production.votes.filter(is_jury_vote=True)
-
-            public_avg = public_votes.aggregate(Avg("score"))["score__avg"] or 0
-            jury_avg = jury_votes.aggregate(Avg("score"))["score__avg"] or 0
-            final_score = config.calculate_final_score(production)
-
-            results.append({
-                "production_id": production.id,
-                "production_title": production.title,
-                "production_authors": production.authors,
-                "compo_name": production.compo.name,
-                "total_votes": production.votes.count(),
-                "public_votes": public_votes.count(),
-                "jury_votes": jury_votes.count(),
-                "public_avg_score": round(public_avg, 2),
-                "jury_avg_score": round(jury_avg, 2),
-                "final_score": round(final_score, 2),
-            })
-
-        # Sort by final score and add ranking
-        results.sort(key=lambda x: x["final_score"], reverse=True)
-        for i, result in enumerate(results, 1):
-            result["ranking"] = i
-
-        # Group by compo
-        results_by_compo = {}
-        for result in results:
-            compo = result["compo_name"]
-            if compo not in results_by_compo:
-                results_by_compo[compo] = []
-            results_by_compo[compo].append(result)
-
-        # Recalculate ranking per compo
-        for compo, compo_results in results_by_compo.items():
-            for i, result in enumerate(compo_results, 1):
-                result["ranking"] = i
+        results_by_compo, results = edition_results(edition, config)
 
         return Response({
             "edition": edition.title,
@@ -726,23 +932,35 @@ class VotingResultsViewSet(viewsets.ReadOnlyModelViewSet):
                 {"error": "Edition not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        # Get votes for this edition
-        votes = Vote.objects.filter(production__edition=edition)
+        # Vote totals come from the per-production tallies
+        tallies = ProductionTally.objects.filter(production__edition=edition)
+        totals = tallies.aggregate(
+            public_votes=Sum("public_count", default=0),
+            jury_votes=Sum("jury_count", default=0),
+            **{
+                field: Sum(field, default=0)
+                for field in ProductionTally.HISTOGRAM_FIELDS
+            },
+        )
 
         # Calculate stats
         stats = {
-            "total_votes": votes.count(),
-            "public_votes": votes.filter(is_jury_vote=False).count(),
-            "jury_votes": votes.filter(is_jury_vote=True).count(),
-            "total_voters": votes.values("user").distinct().count(),
+            "total_votes": totals["public_votes"] + totals["jury_votes"],
+            "public_votes": totals["public_votes"],
+            "jury_votes": totals["jury_votes"],
+            "total_voters": Vote.objects.filter(production__edition=edition)
+            .values("user")
+            .distinct()
+            .count(),
             "votes_by_compo": {},
             "votes_by_score": {},
         }
 
         # Votes by compo
         compo_votes = (
-            votes.values("production__compo__name")
-            .annotate(count=Count("id"))
+            tallies.values("production__compo__name")
+            .annotate(count=Sum(F("public_count") + F("jury_count")))
+            .filter(count__gt=0)
             .order_by("-count")
         )
 
@@ -750,12 +968,10 @@ class VotingResultsViewSet(viewsets.ReadOnlyModelViewSet):
             stats["votes_by_compo"][item["production__compo__name"]] = item["count"]
 
         # Votes by score
-        score_distribution = (
-            votes.values("score").annotate(count=Count("id")).order_by("score")
-        )
-
-        for item in score_distribution:
-            stats["votes_by_score"][str(item["score"])] = item["count"]
+        for score in range(1, 11):
+            count = totals[f"score_{score}"]
+            if count:
+                stats["votes_by_score"][str(score)] = count
 
         # Participation rate (if we have verified attendees)
         verified = AttendeeVerification.objects.filter(
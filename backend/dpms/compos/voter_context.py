@@ -0,0 +1,175 @@
+"""
+Voter eligibility context.
+
+Everything needed to decide whether a user may vote in an edition (voting
+configuration, jury membership with its compos and attendee verification)
+is loaded once into a VoterContext. Contexts are memoized on the request
+and kept in the Django cache for a short time, so validating and saving a
+vote does not re-read them. Voting periods are answered by the shared
+period index (see dpms.compos.period_index).
+
+Cached contexts are dropped by the signal handlers in dpms.compos.signals:
+per user when a jury membership or attendee verification changes, and for
+the whole edition when its voting configuration changes.
+"""
+
+# Django
+from django.conf import settings
+from django.db import transaction
+
+# Application models
+from dpms.compos.models import AttendeeVerification, JuryMember, VotingConfiguration
+from dpms.compos.period_index import get_period_index
+
+# Utilities
+from dpms.utils.cache import CacheNamespace
+
+# Keyed by user id, scoped by edition id
+contexts = CacheNamespace("voter-context")
+
+
+class VoterContext:
+    """
+    Eligibility of a user to vote in an edition.
+
+    Attributes:
+        config: VotingConfiguration of the edition, or None
+        is_jury: Whether the user is a jury member of the edition
+        jury_compo_ids: Compos assigned to the jury member (empty = all)
+        is_verified: Whether the user is a verified attendee
+    """
+
+    def __init__(self, edition_id, config, is_jury, jury_compo_ids, is_verified):
+        self.edition_id = edition_id
+        self.config = config
+        self.is_jury = is_jury
+        self.jury_compo_ids = jury_compo_ids
+        self.is_verified = is_verified
+
+    @classmethod
+    def build(cls, user, edition_id):
+        """Load the context of a user in an edition from the database."""
+        config = VotingConfiguration.objects.filter(edition_id=edition_id).first()
+
+        jury_member = (
+            JuryMember.objects.filter(user=user, edition_id=edition_id)
+            .prefetch_related("compos")
+            .first()
+        )
+        jury_compo_ids = (
+            frozenset(compo.id for compo in jury_member.compos.all())
+            if jury_member else frozenset()
+        )
+
+        is_verified = AttendeeVerification.objects.filter(
+            user=user, edition_id=edition_id, is_verified=True
+        ).exists()
+
+        return cls(
+            edition_id, config, jury_member is not None, jury_compo_ids, is_verified,
+        )
+
+    def __getstate__(self):
+        # The period index is cached on its own, keep it out of the context
+        state = self.__dict__.copy()
+        state.pop("_period_index", None)
+        return state
+
+    @property
+    def period_index(self):
+        """PeriodIndex of the edition, looked up once per context."""
+        if "_period_index" not in self.__dict__:
+            self._period_index = get_period_index(self.edition_id)
+        return self._period_index
+
+    def voting_open(self, compo_id=None, now=None):
+        """Whether voting is open for a compo (or edition-wide)."""
+        return self.period_index.is_open(compo_id, now)
+
+    def can_vote_in_compo(self, compo_id):
+        """Whether the user, as jury member, may vote in a compo."""
+        return self.is_jury and (
+            not self.jury_compo_ids or compo_id in self.jury_compo_ids
+        )
+
+    def check_vote(self, production, is_jury_vote):
+        """
+        Validate a vote on a production (the rules of Vote.clean).
+
+        Args:
+            production: Production being voted
+            is_jury_vote: Whether the vote counts as a jury vote
+
+        Returns:
+            str: Error message, or None if the vote is allowed
+        """
+        if self.config is None:
+            return "La edición no tiene configuración de votación"
+
+        if not self.voting_open(production.compo_id):
+            return "El período de votación no está abierto"
+
+        if self.config.voting_mode == "jury" and not is_jury_vote:
+            return "Esta edición solo acepta votos del jurado"
+
+        if is_jury_vote:
+            if not self.is_jury:
+                return "El usuario no es miembro del jurado de esta edición"
+            if not self.can_vote_in_compo(production.compo_id):
+                return f"El jurado no está asignado a la compo {production.compo.name}"
+
+        if not is_jury_vote and self.config.access_mode != "open" and not self.is_verified:
+            return "El usuario no está verificado como asistente"
+
+        return None
+
+
+def get_voter_context(user, edition, request=None):
+    """
+    Return the VoterContext of a user in an edition.
+
+    Args:
+        user: Voting user
+        edition: Edition instance or id
+        request: Current request, to memoize the context on it
+
+    Returns:
+        VoterContext
+    """
+    edition_id = getattr(edition, "pk", edition)
+
+    memo = None
+    if request is not None:
+        # Stored on the Django request so every DRF wrapper shares it
+        http_request = getattr(request, "_request", request)
+        memo = http_request.__dict__.setdefault("_voter_contexts", {})
+        if edition_id in memo:
+            return memo[edition_id]
+
+    timeout = settings.VOTER_CONTEXT_CACHE_TIMEOUT
+    context = None
+    if timeout:
+        context = contexts.get(user.pk, scope=edition_id)
+
+    if context is None:
+        context = VoterContext.build(user, edition_id)
+        if timeout:
+            contexts.set(user.pk, context, timeout, scope=edition_id)
+
+    if memo is not None:
+        memo[edition_id] = context
+    return context
+
+
+def invalidate_voter_context(edition_id, user_id=None):
+    """
+    Drop cached contexts of an edition once the current transaction commits.
+
+    Args:
+        edition_id: Edition id
+        user_id: Only drop this user's context (default: every user)
+    """
+    if user_id is None:
+        contexts.invalidate(scope=edition_id)
+    else:
+        transaction.on_commit(lambda: contexts.delete(user_id, scope=edition_id))
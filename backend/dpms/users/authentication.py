@@ -0,0 +1,192 @@
+""" User authentication """
+
+# Django
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+# Django REST Framework
+from rest_framework import exceptions
+from rest_framework.authentication import (
+    BaseAuthentication,
+    TokenAuthentication,
+    get_authorization_header,
+)
+from rest_framework.authtoken.models import Token
+
+# Models
+from dpms.users.models import User
+
+# Roles
+from dpms.users.roles import get_group_names, group_names
+
+# Utilities
+from datetime import timedelta
+import jwt
+
+from dpms.utils.cache import CacheNamespace
+
+# Keyed by token key
+tokens = CacheNamespace("auth-token")
+
+# Keyed by user id: timestamp of the user's tokens_revoked_before, 0 if none
+revocations = CacheNamespace("jwt-revocations", versioned=False)
+# A miss costs one query by primary key
+REVOCATION_CACHE_TIMEOUT = 24 * 60 * 60
+
+ACCESS_TOKEN_TYPE = "access"
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that caches the resolved token for a short time.
+
+    The token is cached with its user, the user's profile and group names
+    for AUTH_TOKEN_CACHE_TIMEOUT seconds, so repeated requests with the same
+    token run no authentication queries. Entries are dropped when the token
+    is deleted (login in single session mode, password reset) and when the
+    user, its profile or its groups change (see dpms.users.signals).
+    """
+
+    def authenticate_credentials(self, key):
+        timeout = settings.AUTH_TOKEN_CACHE_TIMEOUT
+        token = tokens.get(key) if timeout else None
+
+        if token is None:
+            model = self.get_model()
+            try:
+                token = model.objects.select_related("user", "user__profile").get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_("Invalid token."))
+
+            if timeout and token.user.is_active:
+                get_group_names(token.user)
+                tokens.set(key, token, timeout)
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+
+        return (token.user, token)
+
+
+def invalidate_token(key):
+    """Drop a cached token once the current transaction commits."""
+    transaction.on_commit(lambda: tokens.delete(key))
+
+
+def invalidate_user_tokens(user_id):
+    """Drop the cached tokens of a user once the current transaction commits."""
+    for key in Token.objects.filter(user_id=user_id).values_list("key", flat=True):
+        invalidate_token(key)
+
+
+def invalidate_tokens():
+    """Drop every cached token once the current transaction commits."""
+    tokens.invalidate()
+
+
+def issue_access_token(user):
+    """
+    Return a signed JWT (HS256, settings.SECRET_KEY) for a user.
+
+    Besides the user id it carries the user's group names and the group
+    membership version they were read at, so JWTAuthentication can check
+    roles without the database while that version is current.
+    """
+    now = timezone.now()
+    payload = {
+        "user_id": user.id,
+        # Sub-second, so tokens issued right after a revocation stay valid
+        "iat": now.timestamp(),
+        "exp": int((now + timedelta(days=30)).timestamp()),
+        "type": ACCESS_TOKEN_TYPE,
+        "verified": user.is_verified,
+        "groups": sorted(get_group_names(user)),
+        "groups_version": group_names.version(),
+    }
+    return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+
+
+def revoke_access_tokens(user):
+    """Reject every JWT issued to a user until now."""
+    revoked_before = timezone.now()
+    User.objects.filter(pk=user.pk).update(tokens_revoked_before=revoked_before)
+    transaction.on_commit(
+        lambda: revocations.set(user.pk, revoked_before.timestamp(), REVOCATION_CACHE_TIMEOUT)
+    )
+
+
+def revoked_before(user_id):
+    """
+    Timestamp before which a user's tokens are revoked, or None.
+
+    Cached per user, so checking a token costs one cache read. Misses are
+    filled with add() and revocations with set(), so a request that read
+    the database before a revocation cannot overwrite the new value.
+    """
+    timestamp = revocations.get(user_id)
+    if timestamp is None:
+        value = User.objects.filter(pk=user_id).values_list("tokens_revoked_before", flat=True).first()
+        timestamp = value.timestamp() if value else 0
+        revocations.add(user_id, timestamp, REVOCATION_CACHE_TIMEOUT)
+    return timestamp or None
+
+
+class JWTAuthentication(BaseAuthentication):
+    """
+    Stateless authentication with the JWT returned at login.
+
+    Clients send ``Authorization: Bearer <jwt_access_token>``. The token is
+    verified with settings.SECRET_KEY and checked against the user's
+    revocation date (cached), and the user is built from its claims
+    without any query: the fields not in the token are deferred and loaded
+    on first access. Group
+    names come from the claims unless group membership changed since the
+    token was issued, in which case they are resolved as usual.
+    """
+
+    keyword = "Bearer"
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+
+        if len(auth) != 2:
+            msg = _("Invalid token header. Token string should not contain spaces.")
+            raise exceptions.AuthenticationFailed(msg)
+
+        try:
+            payload = jwt.decode(
+                auth[1],
+                settings.SECRET_KEY,
+                algorithms=["HS256"],
+                options={"require": ["exp", "iat", "user_id"]},
+            )
+        except jwt.PyJWTError:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+
+        if payload.get("type") != ACCESS_TOKEN_TYPE:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+
+        revoked = revoked_before(payload["user_id"])
+        if revoked is not None and payload["iat"] < revoked:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+
+        return (self.get_user(payload), payload)
+
+    def get_user(self, payload):
+        # Deactivating a user revokes its tokens, so it is active
+        user = User.from_db(
+            None,
+            ["id", "is_active", "is_verified"],
+            [payload["user_id"], True, payload.get("verified", False)],
+        )
+        if payload.get("groups_version") == group_names.version():
+            user.__dict__["_group_names"] = frozenset(payload.get("groups", ()))
+        return user
+
+    def authenticate_header(self, request):
+        return self.keyword
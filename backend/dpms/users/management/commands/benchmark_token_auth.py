@@ -0,0 +1,147 @@
+"""
+Management command to benchmark token authentication.
+
+Usage:
+    python manage.py benchmark_token_auth [--users 300] [--requests 3000]
+
+Builds N throwaway users with a token and a profile, then sends authenticated
+requests round-robin over their tokens to a minimal view (checks the admin
+role and the verified flag, as the voting endpoints do) and measures queries per
+request and throughput of:
+
+    legacy  DRF TokenAuthentication, a token/user query on every request
+    cold    CachedTokenAuthentication with an empty token cache
+    warm    CachedTokenAuthentication with every token cached
+    jwt     JWTAuthentication with the access JWTs issued at login
+
+Everything is created inside a transaction that is rolled back at the end.
+"""
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from dpms.users.authentication import (
+    CachedTokenAuthentication,
+    JWTAuthentication,
+    issue_access_token,
+    tokens,
+)
+from dpms.users.models import Profile
+from dpms.users.roles import is_dpms_admin
+
+User = get_user_model()
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark fixture."""
+
+
+class WhoAmIView(APIView):
+    """Minimal authenticated endpoint."""
+
+    permission_classes = [IsAuthenticated]
+    # Throttle counters would only add cache traffic unrelated to authentication
+    throttle_classes = []
+
+    def get(self, request):
+        return Response({
+            "id": request.user.id,
+            "admin": is_dpms_admin(request.user),
+            "verified": request.user.is_verified,
+        })
+
+
+class Command(BaseCommand):
+    help = "Benchmark authenticated request throughput with and without the token cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=300,
+            help="Number of users (tokens) in the fixture",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=3000,
+            help="Measured requests per implementation",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                keys, jwts = self.build_fixture(options["users"])
+                self.run(keys, jwts, options["requests"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, keys, jwts, count):
+        factory = APIRequestFactory()
+        requests = [
+            factory.get("/whoami/", HTTP_AUTHORIZATION=f"Token {keys[i % len(keys)]}")
+            for i in range(count)
+        ]
+        bearer_requests = [
+            factory.get("/whoami/", HTTP_AUTHORIZATION=f"Bearer {jwts[i % len(jwts)]}")
+            for i in range(count)
+        ]
+        legacy = WhoAmIView.as_view(authentication_classes=[TokenAuthentication])
+        cached = WhoAmIView.as_view(authentication_classes=[CachedTokenAuthentication])
+        stateless = WhoAmIView.as_view(authentication_classes=[JWTAuthentication])
+
+        def clear():
+            for key in keys:
+                tokens.delete(key)
+
+        self.stdout.write(f"{'impl':>8} {'queries/req':>12} {'req/s':>10}")
+        self.measure("legacy", legacy, requests)
+        clear()
+        self.measure("cold", cached, requests[:len(keys)])
+        self.measure("warm", cached, requests)
+        clear()
+        self.measure("jwt", stateless, bearer_requests)
+
+    def measure(self, label, view, requests):
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            for request in requests:
+                response = view(request)
+                assert response.status_code == 200, response.status_code
+            elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"{label:>8} {len(ctx.captured_queries) / len(requests):>12.2f} "
+            f"{len(requests) / elapsed:>10.0f}"
+        )
+
+    def build_fixture(self, users_count):
+        suffix = timezone.now().strftime("%Y%m%d%H%M%S%f")
+        users = User.objects.bulk_create([
+            User(
+                email=f"bench-auth-{suffix}-{i}@example.com",
+                username=f"bench-auth-{suffix}-{i}",
+            )
+            for i in range(users_count)
+        ])
+        Profile.objects.bulk_create([
+            Profile(user=user, nickname=f"bench {i}") for i, user in enumerate(users)
+        ])
+        created = Token.objects.bulk_create([
+            Token(user=user, key=Token.generate_key()) for user in users
+        ])
+        return (
+            [token.key for token in created],
+            [issue_access_token(user) for user in users],
+        )
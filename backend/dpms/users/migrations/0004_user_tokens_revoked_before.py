@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_date_joined_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='tokens_revoked_before',
+            field=models.DateTimeField(blank=True, help_text='Access tokens (JWT) issued before this date are rejected', null=True, verbose_name='Tokens revoked before'),
+        ),
+    ]
@@ -38,8 +38,21 @@ class User(BaseModel, AbstractUser):
         ),
     )
 
+    tokens_revoked_before = models.DateTimeField(
+        _("Tokens revoked before"),
+        null=True,
+        blank=True,
+        help_text=_("Access tokens (JWT) issued before this date are rejected"),
+    )
+
     objects = UserManager()
 
+    class Meta(BaseModel.Meta):
+        indexes = [
+            # Cursor pagination order of the admin user list
+            models.Index(fields=["-date_joined", "id"], name="user_date_joined_idx"),
+        ]
+
     def __str__(self):
         """Return email"""
         return self.email
@@ -4,6 +4,9 @@
 
 from rest_framework.permissions import BasePermission
 
+# Roles
+from dpms.users.roles import is_dpms_admin
+
 
 class IsAccountOwner(BasePermission):
     """Allow access only to objects owned by the requesting user."""
@@ -17,7 +20,4 @@ class IsDPMSAdmin(BasePermission):
     """Allow access only to DPMS Admins group members."""
 
     def has_permission(self, request, view):
-        return (
-            request.user.is_authenticated
-            and request.user.groups.filter(name="DPMS Admins").exists()
-        )
+        return is_dpms_admin(request.user)
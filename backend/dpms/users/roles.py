@@ -0,0 +1,59 @@
+"""
+User role resolution.
+
+The names of a user's groups are loaded once per request and kept on the
+user object, so any number of permission checks cost at most one query.
+They are also cached in the shared cache for USER_GROUPS_CACHE_TIMEOUT
+seconds; any group membership change drops every cached entry (see
+dpms.users.signals).
+"""
+
+# Django
+from django.conf import settings
+
+# Utilities
+from dpms.utils.cache import CacheNamespace
+
+ADMINS_GROUP = "DPMS Admins"
+
+# Keyed by user id
+group_names = CacheNamespace("user-groups")
+
+
+def get_group_names(user):
+    """
+    Return the names of the groups of a user.
+
+    Args:
+        user: User (anonymous users have no groups)
+
+    Returns:
+        frozenset: Group names
+    """
+    if user is None or not user.is_authenticated:
+        return frozenset()
+
+    names = user.__dict__.get("_group_names")
+    if names is not None:
+        return names
+
+    timeout = settings.USER_GROUPS_CACHE_TIMEOUT
+    if timeout:
+        names = group_names.get(user.pk)
+    if names is None:
+        names = frozenset(user.groups.values_list("name", flat=True))
+        if timeout:
+            group_names.set(user.pk, names, timeout)
+
+    user.__dict__["_group_names"] = names
+    return names
+
+
+def is_dpms_admin(user):
+    """Whether a user belongs to the DPMS Admins group."""
+    return ADMINS_GROUP in get_group_names(user)
+
+
+def invalidate_group_names():
+    """Drop the cached group names of every user once the transaction commits."""
+    group_names.invalidate()
@@ -22,6 +22,9 @@ import logging
 # Serializers
 from dpms.users.serializers.profiles import ProfileModelSerializer
 
+# Authentication
+from dpms.users.authentication import issue_access_token, revoke_access_tokens
+
 # Django REST Framework
 from rest_framework.authtoken.models import Token
 from rest_framework.validators import UniqueValidator
@@ -195,7 +198,9 @@ class UserLoginSerializer(serializers.Serializer):
 
         if not user.allow_concurrence:
             # Single session: revoke all existing tokens
-            Token.objects.filter(user=user).delete()
+            deleted, _ = Token.objects.filter(user=user).delete()
+            if deleted:
+                revoke_access_tokens(user)
         else:
             # Concurrence allowed: reuse existing token if available
             existing = Token.objects.filter(user=user).first()
@@ -205,21 +210,12 @@ class UserLoginSerializer(serializers.Serializer):
 
         token = Token.objects.create(user=user)
         jwt_access_token = self.generate_jwt_token(user)
-        user_groups = user.groups.values_list("name", flat=True)
 
         return user, token.key, jwt_access_token
 
     def generate_jwt_token(self, user):
-        """Create JWT token that the user can use to verify its account."""
-        exp_date = timezone.now() + timedelta(days=30)
-        payload = {
-            "user_id": user.id,
-            "iat": int(timezone.now().timestamp()),
-            "exp": int(exp_date.timestamp()),
-            "type": "expiration date",
-        }
-        token = jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
-        return token
+        """Create the access JWT accepted by JWTAuthentication."""
+        return issue_access_token(user)
 
 
 class AccountVerificationSerializer(serializers.Serializer):
@@ -322,3 +318,4 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
         user.save()
         # Invalidate existing tokens to force re-login
         Token.objects.filter(user=user).delete()
+        revoke_access_tokens(user)
@@ -1,5 +1,17 @@
-from django.db.models.signals import post_migrate
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
 from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from rest_framework.authtoken.models import Token
+
+from dpms.users.authentication import (
+    invalidate_token,
+    invalidate_tokens,
+    invalidate_user_tokens,
+    revoke_access_tokens,
+)
+from dpms.users.models import Profile
+from dpms.users.roles import invalidate_group_names
 
 
 def create_groups_and_permissions(sender, **kwargs):
@@ -78,3 +90,54 @@ def create_groups_and_permissions(sender, **kwargs):
 post_migrate.connect(
     create_groups_and_permissions, dispatch_uid="create_groups_and_permissions"
 )
+
+
+def drop_cached_group_names(sender, instance=None, action=None, reverse=False, **kwargs):
+    """Group membership or a group changed: cached group names are stale."""
+    if action is not None and action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action is not None and not reverse:
+        # Also forget the names already resolved on this user object
+        instance.__dict__.pop("_group_names", None)
+    invalidate_group_names()
+    # Cached tokens carry their user's group names
+    invalidate_tokens()
+
+
+m2m_changed.connect(
+    drop_cached_group_names,
+    sender=get_user_model().groups.through,
+    dispatch_uid="user_groups_changed",
+)
+post_save.connect(drop_cached_group_names, sender=Group, dispatch_uid="group_saved")
+post_delete.connect(drop_cached_group_names, sender=Group, dispatch_uid="group_deleted")
+
+
+def drop_cached_token(sender, instance, **kwargs):
+    """A token was deleted (login in single session mode, password reset)."""
+    invalidate_token(instance.key)
+
+
+def drop_cached_user_tokens(sender, instance, **kwargs):
+    """A user (e.g. deactivated) or its profile changed."""
+    user_id = instance.pk if sender is get_user_model() else instance.user_id
+    if user_id is not None:
+        invalidate_user_tokens(user_id)
+
+
+def revoke_inactive_user_tokens(sender, instance, **kwargs):
+    """Deactivated users lose their access JWTs, which are not looked up."""
+    if not instance.is_active and not kwargs.get("raw"):
+        revoke_access_tokens(instance)
+
+
+post_delete.connect(drop_cached_token, sender=Token, dispatch_uid="token_deleted")
+post_save.connect(
+    drop_cached_user_tokens, sender=get_user_model(), dispatch_uid="user_tokens_saved"
+)
+post_save.connect(
+    drop_cached_user_tokens, sender=Profile, dispatch_uid="profile_tokens_saved"
+)
+post_save.connect(
+    revoke_inactive_user_tokens, sender=get_user_model(), dispatch_uid="user_jwt_revoked"
+)
@@ -22,12 +22,15 @@ from dpms.users.models import User
 
 # Permissions
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework.throttling import SimpleRateThrottle
+from dpms.utils.throttling import SharedRateThrottle
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from dpms.utils.views import AtomicWritesMixin
 from dpms.users.permissions import IsAccountOwner, IsDPMSAdmin
+from dpms.users.roles import get_group_names
+from dpms.users.authentication import issue_access_token
 
 
-class AuthRateThrottle(SimpleRateThrottle):
+class AuthRateThrottle(SharedRateThrottle):
     rate = '5/minute'
 
     def get_cache_key(self, request, view):
@@ -37,18 +40,13 @@ class AuthRateThrottle(SimpleRateThrottle):
         }
 
 # Utilities
-from django.utils import timezone
-from datetime import timedelta
-import jwt
 import logging
 
-# Django
-from django.conf import settings
-
 logger = logging.getLogger(__name__)
 
 
 class UserViewSet(
+    AtomicWritesMixin,
     mixins.RetrieveModelMixin, mixins.UpdateModelMixin, viewsets.GenericViewSet
 ):
     """
@@ -64,6 +62,9 @@ class UserViewSet(
     lookup_url_kwarg = "email"
     lookup_value_regex = "[\w@.\-_]+"
 
+    # Pages of admin_list
+    cursor_ordering = ("-date_joined", "id")
+
     def get_permissions(self):
         """Assign permissions based on action"""
         if self.action in ["signup", "login", "verify", "password_reset_request", "password_reset_confirm"]:
@@ -93,6 +94,9 @@ class UserViewSet(
         (whether the user has confirmed attendance for that edition) and the
         response includes `confirmed_count` / `total_count` totals for the
         "X/Y confirmados" header. Admin-only.
+
+        Cursor-paginated (`next` / `previous` links, `?page_size=`), the
+        totals always cover every user.
         """
         from dpms.compos.models import Attendance
 
@@ -100,8 +104,9 @@ class UserViewSet(
         users = (
             User.objects.filter(is_active=True)
             .select_related("profile")
-            .order_by("-date_joined")
+            .order_by("-date_joined", "id")
         )
+        page = self.paginate_queryset(users)
 
         attending_ids = set()
         if edition_id:
@@ -122,14 +127,18 @@ class UserViewSet(
                 "date_joined": u.date_joined,
                 "attends": (u.id in attending_ids) if edition_id else None,
             }
-            for u in users
+            for u in (users if page is None else page)
         ]
 
-        return Response({
-            "total_count": len(rows),
+        data = {
+            "total_count": len(rows) if page is None else users.count(),
             "confirmed_count": len(attending_ids) if edition_id else None,
             "results": rows,
-        })
+        }
+        if page is not None:
+            data["next"] = self.paginator.get_next_link()
+            data["previous"] = self.paginator.get_previous_link()
+        return Response(data)
 
     @action(detail=False, methods=["get"], permission_classes=[IsDPMSAdmin])
     def search(self, request):
@@ -174,7 +183,7 @@ class UserViewSet(
             user, token, jwt_access_token = serializer.save()
 
             extended_data = UserModelSerializer(user).data
-            user_groups = user.groups.values_list("name", flat=True)
+            user_groups = sorted(get_group_names(user))
 
             data = {
                 "user": extended_data,
@@ -235,13 +244,7 @@ class UserViewSet(
         response = super(UserViewSet, self).retrieve(request, *args, **kwargs)
         user = self.get_object()
         user_data = UserModelSerializer(user).data
-        exp_date = timezone.now() + timedelta(days=30)
-        payload = {
-            "exp": int(exp_date.timestamp()),
-            "type": "expiration date",
-            "username": request.user.username,
-        }
-        token = jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+        token = issue_access_token(request.user)
 
         data = {"user": user_data, "jwt_access_token": token}
 
@@ -0,0 +1,132 @@
+""" Cache utilities """
+
+# Utilities
+from contextlib import contextmanager
+import fcntl
+import hashlib
+import os
+import random
+import time
+
+# Django
+from django.core.cache import cache
+from django.core.cache.backends import filebased
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+
+
+class FileBasedCache(filebased.FileBasedCache):
+    """
+    FileBasedCache shared by every process of a host.
+
+    Django's add() and incr() read and then write the entry, so concurrent
+    workers lose updates. Here both run under an exclusive file lock, which
+    keeps counters (throttles, namespace versions) exact across processes.
+    Keys are spread over a fixed set of lock files.
+
+    Django culls on every write, listing the whole cache directory each
+    time; with tens of thousands of entries that scan dominated requests.
+    Here about one write in CULL_CHECK_EVERY checks the size, so the cache
+    may overshoot max_entries by that many entries between culls.
+    """
+
+    LOCK_STRIPES = 64
+    CULL_CHECK_EVERY = 100
+
+    @contextmanager
+    def _locked(self, key, version):
+        self._createdir()
+        digest = hashlib.md5(self.make_key(key, version).encode()).digest()
+        path = os.path.join(self._dir, f".lock-{digest[0] % self.LOCK_STRIPES}")
+        with open(path, "ab") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _cull(self):
+        if random.randrange(self.CULL_CHECK_EVERY) == 0:
+            super()._cull()
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        with self._locked(key, version):
+            return super().add(key, value, timeout, version)
+
+    def incr(self, key, delta=1, version=None):
+        with self._locked(key, version):
+            return super().incr(key, delta, version)
+
+
+class CacheNamespace:
+    """
+    Namespaced, versioned keys in the default cache.
+
+    Every key is stored as ``dpms:<name>[:<scope>]:<key>`` under the current
+    version of its scope (the whole namespace when scope is None), so all
+    the entries of a scope are dropped at once by bumping its version
+    instead of deleting them one by one.
+
+    Versions start at the current time in milliseconds: if a version entry
+    is evicted, the recreated one is still newer than any version already
+    used, so stale entries are never served again.
+
+    Namespaces created with ``versioned=False`` skip the version lookup
+    and cannot be invalidated, only deleted key by key.
+    """
+
+    def __init__(self, name, versioned=True):
+        self.name = name
+        self.versioned = versioned
+
+    def key(self, key, scope=None):
+        """Full cache key of ``key`` in a scope."""
+        if scope is None:
+            return f"dpms:{self.name}:{key}"
+        return f"dpms:{self.name}:{scope}:{key}"
+
+    def version(self, scope=None):
+        """Current version of a scope."""
+        if not self.versioned:
+            return None
+        return cache.get_or_set(
+            self.key("__version__", scope), lambda: int(time.time() * 1000), None
+        )
+
+    def get(self, key, default=None, scope=None):
+        return cache.get(self.key(key, scope), default, version=self.version(scope))
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, scope=None):
+        cache.set(self.key(key, scope), value, timeout, version=self.version(scope))
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, scope=None):
+        return cache.add(self.key(key, scope), value, timeout, version=self.version(scope))
+
+    def get_many(self, keys, scope=None):
+        """Return a dict of the given keys found in the cache."""
+        version = self.version(scope)
+        full_keys = {self.key(key, scope): key for key in keys}
+        found = cache.get_many(full_keys, version=version)
+        return {full_keys[full_key]: value for full_key, value in found.items()}
+
+    def incr(self, key, delta=1, scope=None):
+        """Atomically increment a counter (ValueError if missing)."""
+        return cache.incr(self.key(key, scope), delta, version=self.version(scope))
+
+    def decr(self, key, delta=1, scope=None):
+        return self.incr(key, -delta, scope)
+
+    def delete(self, key, scope=None):
+        cache.delete(self.key(key, scope), version=self.version(scope))
+
+    def invalidate(self, scope=None):
+        """Drop every entry of a scope once the current transaction commits."""
+        transaction.on_commit(lambda: self.bump(scope))
+
+    def bump(self, scope=None):
+        """Drop every entry of a scope now."""
+        try:
+            cache.incr(self.key("__version__", scope))
+        except ValueError:
+            # No version yet, so nothing was cached in this scope
+            pass
@@ -0,0 +1,242 @@
+"""
+Image fields with resized copies.
+
+ImageRenditionField is an ImageField that declares the sizes the image is
+displayed at, by name and longest edge in pixels:
+
+    screenshot = ImageRenditionField(
+        upload_to=production_screenshot_path,
+        renditions={"thumb": 320, "card": 800},
+    )
+
+Each rendition is rendered (see dpms.utils.renditions) in every format of
+the field and cached in the storage under a name hashed from the source
+file name and the rendition spec:
+
+    renditions/<first 2 hex digits>/<sha256>.webp
+
+Uploads always get a new file name, so a new image gets new renditions, and
+changing a spec or RENDITION_VERSION renders them again instead of serving
+stale files.
+
+Renditions are rendered in a small thread pool of the process, eagerly
+when an instance is saved with an image (or while saving it, with
+rendition_sync) and lazily when one is requested but missing; the
+original is served until it is ready. ``manage.py
+generate_image_renditions`` renders every missing one ahead of time, in a
+process pool, and removes those no image uses anymore.
+
+Templates use the ``rendition`` filter of the ``renditions`` library and
+serializers the RenditionsField.
+"""
+
+# Utilities
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Django
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.db import models, transaction
+from django.db.models.fields.files import ImageFieldFile
+from django.db.models.signals import post_save
+
+# Django REST Framework
+from rest_framework import serializers
+
+# Application
+from dpms.utils.cache import CacheNamespace
+from dpms.utils.renditions import EXTENSIONS, RENDER_ERRORS, render_image
+
+logger = logging.getLogger("dpms")
+
+RENDITIONS_DIR = "renditions"
+# Bump when rendering changes so every rendition is rendered again
+RENDITION_VERSION = 1
+
+# Renders in progress, so processes do not render the same image at once
+builds = CacheNamespace("renditions", versioned=False)
+BUILD_TIMEOUT = 300
+
+# Renders requested by this process. Its threads are joined at exit, so
+# images saved by management commands get their renditions too.
+executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="renditions")
+
+# Rendition names known to exist, to skip the storage lookup
+_rendered = set()
+_rendered_lock = threading.Lock()
+
+
+def rendition_name(source, edge, fmt):
+    """Storage name of a rendition of a source file."""
+    digest = hashlib.sha256(f"{RENDITION_VERSION}\n{source}\n{edge}\n{fmt}".encode()).hexdigest()
+    return f"{RENDITIONS_DIR}/{digest[:2]}/{digest}.{EXTENSIONS[fmt]}"
+
+
+def is_rendered(storage, name):
+    """Whether a rendition exists."""
+    if name in _rendered:
+        return True
+    if storage.exists(name):
+        with _rendered_lock:
+            _rendered.add(name)
+        return True
+    return False
+
+
+def store_results(storage, source, field, results):
+    """Save rendered files under their rendition names."""
+    edges = field.renditions
+    for size, fmt, _, _, data in results:
+        name = rendition_name(source, edges[size], fmt)
+        if not storage.exists(name):
+            storage.save(name, ContentFile(data))
+        with _rendered_lock:
+            _rendered.add(name)
+
+
+def render_renditions(storage, source, field):
+    """Render the renditions of a source file (in the rendering threads)."""
+    try:
+        results = render_image(storage.path(source), list(field.renditions.items()), field.rendition_formats)
+        store_results(storage, source, field, results)
+    except RENDER_ERRORS as e:
+        # The build mark expires: not tried again on every request
+        logger.error(f"Renditions of {source} failed: {type(e).__name__}: {e}")
+    except Exception:
+        logger.exception(f"Renditions of {source} failed")
+    else:
+        builds.delete(source)
+
+
+def rendition_fields():
+    """Every ImageRenditionField of the installed models, as (model, field)."""
+    return [
+        (model, field)
+        for model in apps.get_models()
+        for field in model._meta.get_fields()
+        if isinstance(field, ImageRenditionField)
+    ]
+
+
+class RenditionFieldFile(ImageFieldFile):
+    """Image file of an ImageRenditionField, with the URLs of its renditions."""
+
+    def rendition_names(self):
+        """Storage names of every rendition: {size: {format: name}}."""
+        return {
+            size: {
+                fmt: rendition_name(self.name, edge, fmt)
+                for fmt in self.field.rendition_formats
+            }
+            for size, edge in self.field.renditions.items()
+        }
+
+    def missing_renditions(self):
+        """Whether any rendition has not been rendered yet."""
+        return any(
+            not is_rendered(self.storage, name)
+            for names in self.rendition_names().values()
+            for name in names.values()
+        )
+
+    def render(self):
+        """Render the missing renditions in the background."""
+        if self and self.missing_renditions() and builds.add(self.name, True, BUILD_TIMEOUT):
+            executor.submit(render_renditions, self.storage, self.name, self.field)
+
+    def rendition_file(self, size, fmt=None):
+        """
+        Storage name of a rendition, or of the original until it is rendered.
+
+        Args:
+            size: Name of a rendition of the field
+            fmt: Format (default: the first format of the field)
+        """
+        name = rendition_name(self.name, self.field.renditions[size], fmt or self.field.rendition_formats[0])
+        if is_rendered(self.storage, name):
+            return name
+        self.render()
+        return self.name
+
+    def rendition_url(self, size, fmt=None):
+        """URL of a rendition, or of the original until it is rendered."""
+        return self.storage.url(self.rendition_file(size, fmt))
+
+    def rendition_urls(self):
+        """URLs of every rendition, {size: {format: url}}, originals while missing."""
+        urls = {}
+        for size, names in self.rendition_names().items():
+            urls[size] = {}
+            for fmt, name in names.items():
+                if is_rendered(self.storage, name):
+                    urls[size][fmt] = self.storage.url(name)
+                else:
+                    self.render()
+                    urls[size][fmt] = self.url
+        return urls
+
+
+class ImageRenditionField(models.ImageField):
+    """
+    ImageField with resized copies of the image.
+
+    Args:
+        renditions: Dict of rendition name to longest edge in pixels
+        rendition_formats: Formats of dpms.utils.renditions.FORMATS; the
+            first one is the default. Use "png" rather than "jpeg" for
+            images with transparency, like logos.
+        rendition_sync: Render while saving instead of in the background,
+            for images in responses that are cached when they change
+    """
+
+    attr_class = RenditionFieldFile
+
+    def __init__(self, *args, renditions=None, rendition_formats=("webp", "jpeg"),
+                 rendition_sync=False, **kwargs):
+        self.renditions = renditions or {}
+        self.rendition_formats = tuple(rendition_formats)
+        self.rendition_sync = rendition_sync
+        super().__init__(*args, **kwargs)
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super().contribute_to_class(cls, name, **kwargs)
+        if not cls._meta.abstract:
+            post_save.connect(self.render_on_save, sender=cls, weak=False)
+
+    def render_on_save(self, sender, instance, **kwargs):
+        """Render the renditions of a saved image (once committed, unless sync)."""
+        image = getattr(instance, self.attname)
+        if not image or not self.renditions:
+            return
+        if self.rendition_sync:
+            if image.missing_renditions():
+                render_renditions(image.storage, image.name, self)
+        else:
+            transaction.on_commit(image.render)
+
+
+class RenditionsField(serializers.Field):
+    """
+    Read-only URLs of the renditions of an ImageRenditionField.
+
+    Represented as {size: {format: absolute url}}, or None without image.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        request = self.context.get("request")
+        return {
+            size: {
+                fmt: request.build_absolute_uri(url) if request else url
+                for fmt, url in urls.items()
+            }
+            for size, urls in value.rendition_urls().items()
+        }
@@ -0,0 +1,277 @@
+"""
+Delivery of media files.
+
+Production entries reach 100 MB and StageRunner videos more, so files are
+never read into memory:
+
+- Behind nginx (MEDIA_ACCEL_REDIRECT set), a permission-checked download
+  only answers with an ``X-Accel-Redirect`` header to an internal location
+  aliasing MEDIA_ROOT: nginx sends the file with sendfile, handling ranges
+  and conditional requests itself.
+- Without it (development, or another proxy), the file is served here with
+  validators (ETag, Last-Modified), conditional requests, and single and
+  multiple byte ranges (RFC 9110, section 14). A single range or the whole
+  file is passed to the WSGI server as an open file positioned at its
+  start with its exact length, which gunicorn sends with os.sendfile;
+  other servers read it in chunks. Multiple ranges are streamed as
+  multipart/byteranges in chunks read with os.pread.
+
+nginx only serves the public uploads (screenshots, renditions, gallery,
+logos, StageRunner images) straight from /media/. Production files and
+blobs are reached through permission-checked views, or through signed
+media URLs (signed_media_url) where a plain link is needed, e.g. the
+StageRunner <video> tags, which cannot send credentials.
+"""
+
+# Utilities
+import mimetypes
+import os
+import uuid
+from urllib.parse import quote
+
+# Django
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+SIGNING_SALT = "dpms.utils.media"
+
+CHUNK_SIZE = 64 * 1024
+# More ranges than this are answered with the whole file
+MAX_RANGES = 16
+
+
+def media_path(name):
+    """Absolute path of a file under MEDIA_ROOT, or Http404."""
+    try:
+        path = safe_join(settings.MEDIA_ROOT, name)
+    except (SuspiciousFileOperation, ValueError):
+        raise Http404
+    if not os.path.isfile(path):
+        raise Http404
+    return path
+
+
+def signed_media_url(name, filename=None):
+    """
+    URL serving a media file to whoever has the link.
+
+    The storage name is signed with SECRET_KEY, so the link only opens the
+    file it was made for. ``filename`` is the name shown and the one its
+    type is guessed from (default: the file's own name).
+    """
+    token = signing.Signer(salt=SIGNING_SALT).sign_object(name)
+    return f"/api/media/{token}/{quote(filename or os.path.basename(name))}"
+
+
+def read_signed_media(token):
+    """Storage name of a signed media URL token, or Http404."""
+    try:
+        return signing.Signer(salt=SIGNING_SALT).unsign_object(token)
+    except signing.BadSignature:
+        raise Http404
+
+
+def serve_media_file(request, name, as_attachment=False, filename=None, content_type=None):
+    """
+    Response sending a file of the media storage.
+
+    Args:
+        name: Storage name, relative to MEDIA_ROOT
+        as_attachment: Download it instead of displaying it
+        filename: Download name (default: the file's own name)
+        content_type: Default: guessed from the name
+
+    Raises:
+        Http404: If the file does not exist
+    """
+    path = media_path(name)
+    content_type = content_type or mimetypes.guess_type(filename or path)[0] or "application/octet-stream"
+    disposition = content_disposition_header(as_attachment, filename or os.path.basename(path))
+
+    if settings.MEDIA_ACCEL_REDIRECT:
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = settings.MEDIA_ACCEL_REDIRECT + quote(
+            os.path.relpath(path, settings.MEDIA_ROOT).replace(os.sep, "/")
+        )
+    else:
+        response = range_response(request, path, content_type)
+    if disposition:
+        response["Content-Disposition"] = disposition
+    return response
+
+
+def file_etag(stat):
+    """Strong validator of a file version: size and modification time."""
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def parse_ranges(header, size):
+    """
+    Byte ranges of a Range header.
+
+    Args:
+        header: Value of the Range header
+        size: File size
+
+    Returns:
+        list: Sorted, merged (start, end) inclusive pairs; empty if none is
+        satisfiable. None if the header is invalid or has too many ranges,
+        in which case it is ignored and the whole file is sent.
+    """
+    unit, _, specs = header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs:
+        return None
+    specs = specs.split(",")
+    if len(specs) > MAX_RANGES:
+        return None
+
+    ranges = []
+    for spec in specs:
+        first, dash, last = spec.strip().partition("-")
+        if not dash or not (first or last):
+            return None
+        if (first and not first.isdigit()) or (last and not last.isdigit()):
+            return None
+        if not first:
+            # Suffix: the last N bytes
+            length = int(last)
+            if length:
+                ranges.append((max(0, size - length), size - 1))
+            continue
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+        if start < size:
+            ranges.append((start, end))
+
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def if_range_matches(request, etag, last_modified):
+    """Whether the ranges of a request apply to the current file version."""
+    condition = request.META.get("HTTP_IF_RANGE")
+    if not condition:
+        return True
+    if condition.startswith('"'):
+        return condition == etag
+    # A date is only a valid validator when it is the exact modification time
+    return parse_http_date_safe(condition) == last_modified
+
+
+class FileRange:
+    """
+    Read-only view of a byte range of an open file.
+
+    Exposes fileno() so WSGI servers can send it with sendfile from the
+    current position, and read() that never goes past the range.
+    """
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size) if size else b""
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def range_response(request, path, content_type):
+    """Response with the whole file, a byte range or a multipart/byteranges."""
+    stat = os.stat(path)
+    size = stat.st_size
+    etag = file_etag(stat)
+    last_modified = int(stat.st_mtime)
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    ranges = None
+    range_header = request.META.get("HTTP_RANGE")
+    if range_header and request.method in ("GET", "HEAD") and if_range_matches(request, etag, last_modified):
+        ranges = parse_ranges(range_header, size)
+
+    if ranges == []:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+    elif not ranges:
+        response = file_response(path, 0, size, content_type, status=200)
+    elif len(ranges) == 1:
+        start, end = ranges[0]
+        response = file_response(path, start, end - start + 1, content_type, status=206)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    else:
+        response = multipart_response(path, ranges, size, content_type)
+
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def file_response(path, start, length, content_type, status):
+    """FileResponse of length bytes of a file from start."""
+    response = FileResponse(FileRange(open(path, "rb"), start, length), content_type=content_type, status=status)
+    response["Content-Length"] = length
+    return response
+
+
+def multipart_response(path, ranges, size, content_type):
+    """multipart/byteranges response of several ranges of a file."""
+    boundary = uuid.uuid4().hex
+    headers = [
+        (
+            f"\r\n--{boundary}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+        ).encode()
+        for start, end in ranges
+    ]
+    closing = f"\r\n--{boundary}--\r\n".encode()
+
+    def parts():
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            for header, (start, end) in zip(headers, ranges):
+                yield header
+                position = start
+                while position <= end:
+                    chunk = os.pread(fd, min(CHUNK_SIZE, end + 1 - position), position)
+                    if not chunk:
+                        return
+                    yield chunk
+                    position += len(chunk)
+            yield closing
+        finally:
+            os.close(fd)
+
+    response = StreamingHttpResponse(
+        parts(), status=206, content_type=f"multipart/byteranges; boundary={boundary}"
+    )
+    response["Content-Length"] = (
+        sum(len(header) for header in headers)
+        + sum(end - start + 1 for start, end in ranges)
+        + len(closing)
+    )
+    return response
@@ -0,0 +1,44 @@
+""" Pagination utilities """
+
+# Django REST Framework
+from rest_framework.pagination import CursorPagination
+
+# Permissions
+from dpms.users.permissions import IsDPMSAdmin
+
+
+class CreatedCursorPagination(CursorPagination):
+    """
+    Keyset pagination, the default for every list endpoint.
+
+    Pages are ordered by (-created, id) unless the view sets
+    ``cursor_ordering``, and the client walks them through the ``next`` and
+    ``previous`` links, so deep pages cost the same as the first one.
+
+    ``?page_size=`` asks for up to ``max_page_size`` items per page. DPMS
+    admins may pass ``?page_size=all`` to get the whole, unpaginated list
+    (for exports and admin screens that need everything).
+
+    Views whose lists are small and ordered by position set
+    ``pagination_class = None``.
+    """
+
+    ordering = ("-created", "id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    unpaginated_value = "all"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if (
+            request.query_params.get(self.page_size_query_param) == self.unpaginated_value
+            and IsDPMSAdmin().has_permission(request, view)
+        ):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "cursor_ordering", None)
+        if ordering is not None:
+            return ordering
+        return super().get_ordering(request, queryset, view)
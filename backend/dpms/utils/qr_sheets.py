@@ -0,0 +1,170 @@
+"""
+Printable sheets of QR codes as a vector PDF.
+
+Each A4 page holds a grid of cells, each with the QR code of a string and
+the string itself printed below it, separated by dashed cut lines. QR
+modules are drawn as filled rectangles and the text uses the standard
+Courier and Helvetica fonts, so pages stay small and sharp at any size.
+
+Pages are independent, so large batches render them in a process pool.
+This module does not use Django, so pool workers can be spawned cheaply.
+"""
+
+# Utilities
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import zlib
+
+import segno
+
+# A4 in points
+PAGE_WIDTH = 595.28
+PAGE_HEIGHT = 841.89
+MARGIN = 36
+HEADER = 18
+COLUMNS = 4
+ROWS = 6
+QR_SIZE = 96
+CODE_FONT_SIZE = 10
+PER_PAGE = COLUMNS * ROWS
+
+# Below this many pages the pool costs more than it saves
+POOL_MIN_PAGES = 20
+
+
+def pdf_string(text):
+    """PDF literal string (WinAnsi encoded) for text."""
+    data = text.encode("cp1252", errors="replace")
+    return b"(" + data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def qr_operators(text, x, y, size):
+    """Fill operators drawing the QR code of text with its top-left corner at (x, y)."""
+    matrix = segno.make_qr(text, error="m").matrix
+    module = size / len(matrix)
+    ops = []
+    for row, modules in enumerate(matrix):
+        top = y - (row + 1) * module
+        col = 0
+        while col < len(modules):
+            if not modules[col]:
+                col += 1
+                continue
+            start = col
+            while col < len(modules) and modules[col]:
+                col += 1
+            # One rectangle per horizontal run of dark modules
+            ops.append(
+                f"{x + start * module:.2f} {top:.2f} {(col - start) * module:.2f} {module:.2f} re"
+            )
+    ops.append("f")
+    return "\n".join(ops).encode()
+
+
+def render_page(args):
+    """Compressed content stream of one page: (codes, header text)."""
+    codes, header = args
+    cell_width = (PAGE_WIDTH - 2 * MARGIN) / COLUMNS
+    cell_height = (PAGE_HEIGHT - 2 * MARGIN - HEADER) / ROWS
+    grid_top = PAGE_HEIGHT - MARGIN - HEADER
+
+    parts = [
+        b"BT /F2 9 Tf " + f"{MARGIN} {PAGE_HEIGHT - MARGIN - 9:.2f} Td ".encode()
+        + pdf_string(header) + b" Tj ET",
+        # Cut lines
+        b"q 0.75 G 0.5 w [3 3] 0 d",
+    ]
+    for column in range(1, COLUMNS):
+        x = MARGIN + column * cell_width
+        parts.append(f"{x:.2f} {MARGIN} m {x:.2f} {grid_top:.2f} l S".encode())
+    for row in range(ROWS + 1):
+        y = grid_top - row * cell_height
+        parts.append(f"{MARGIN} {y:.2f} m {PAGE_WIDTH - MARGIN:.2f} {y:.2f} l S".encode())
+    parts.append(b"Q")
+
+    text_height = CODE_FONT_SIZE * 1.5
+    for index, code in enumerate(codes):
+        row, column = divmod(index, COLUMNS)
+        left = MARGIN + column * cell_width
+        top = grid_top - row * cell_height
+        # QR and text centered in the cell as a block
+        qr_top = top - (cell_height - QR_SIZE - text_height) / 2
+        parts.append(qr_operators(code, left + (cell_width - QR_SIZE) / 2, qr_top, QR_SIZE))
+        # Courier glyphs are 0.6 em wide
+        text_width = len(code) * 0.6 * CODE_FONT_SIZE
+        parts.append(
+            f"BT /F1 {CODE_FONT_SIZE} Tf {left + (cell_width - text_width) / 2:.2f} "
+            f"{qr_top - QR_SIZE - text_height + 2:.2f} Td ".encode()
+            + pdf_string(code) + b" Tj ET"
+        )
+
+    return zlib.compress(b"\n".join(parts))
+
+
+def render_sheets(codes, title="", processes=None):
+    """
+    Render codes as a PDF of printable sheets.
+
+    Args:
+        codes: Strings to print, in order
+        title: Printed in the header of every page
+        processes: Pool size for large batches (default: CPU count)
+
+    Returns:
+        bytes: PDF document
+    """
+    pages = [codes[start:start + PER_PAGE] for start in range(0, len(codes), PER_PAGE)] or [[]]
+    jobs = [
+        (page, f"{title}  ·  {number}/{len(pages)}".strip(" ·"))
+        for number, page in enumerate(pages, 1)
+    ]
+
+    if len(pages) >= POOL_MIN_PAGES and processes != 1:
+        # spawn: the caller may be a threaded server process
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(processes, mp_context=context) as pool:
+            streams = list(pool.map(render_page, jobs, chunksize=8))
+    else:
+        streams = [render_page(job) for job in jobs]
+
+    return assemble_pdf(streams)
+
+
+def assemble_pdf(streams):
+    """PDF document with one page per compressed content stream."""
+    # 1 catalog, 2 page tree, 3-4 fonts, then a page and its contents per stream
+    page_ids = [5 + 2 * index for index in range(len(streams))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % pid for pid in page_ids)
+        + b"] /Count %d >>" % len(streams),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    for page_id, stream in zip(page_ids, streams):
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] "
+            % (PAGE_WIDTH, PAGE_HEIGHT)
+            + b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>"
+            % (page_id + 1)
+        )
+        objects.append(
+            b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream)
+            + stream + b"\nendstream"
+        )
+
+    output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += (
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref)
+    )
+    return bytes(output)
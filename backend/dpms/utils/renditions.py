@@ -0,0 +1,113 @@
+"""
+Resized copies of uploaded images.
+
+Browsers get an image no larger than they display, in WebP for those that
+support it and JPEG for the rest, instead of the multi-megabyte upload.
+
+Every size of an image is rendered from a single decode: JPEG sources are
+decoded at a reduced scale when no full-size copy is needed, the EXIF
+orientation is applied so phone photos are upright, and each size is
+downscaled from the previous, larger one. Metadata (EXIF, including GPS
+positions) is not copied to the renditions.
+
+Pillow work is CPU bound, so batches run in a process pool. Workers get a
+file path and return encoded bytes: only plain data crosses processes.
+"""
+
+# Utilities
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+# Encoder options per output format
+FORMATS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+    "png": {"format": "PNG", "optimize": True},
+}
+
+EXTENSIONS = {"webp": "webp", "jpeg": "jpg", "png": "png"}
+
+# Errors of unreadable, truncated or oversized images
+RENDER_ERRORS = (OSError, ValueError, SyntaxError, Image.DecompressionBombError)
+
+
+def render_image(path, sizes, formats=("webp", "jpeg")):
+    """
+    Render every size of an image in every format.
+
+    Args:
+        path: Image file
+        sizes: List of (name, longest edge in pixels, or None for full size)
+        formats: Keys of FORMATS (JPEG flattens transparency onto white)
+
+    Returns:
+        list: (name, format, width, height, bytes) per size and format
+
+    Raises:
+        RENDER_ERRORS: If the image cannot be decoded
+    """
+    with Image.open(path) as source:
+        edges = [edge for _, edge in sizes]
+        if None not in edges:
+            # JPEG only: decode at the smallest scale covering the largest size
+            largest = max(edges)
+            source.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        results = []
+        # Largest first, each size downscaled from the previous one
+        for name, edge in sorted(sizes, key=lambda size: -(size[1] or float("inf"))):
+            if edge and max(image.size) > edge:
+                image = image.copy()
+                image.thumbnail((edge, edge), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            for fmt in formats:
+                results.append((name, fmt, *image.size, encode(image, fmt)))
+        return results
+
+
+def encode(image, fmt):
+    """Image as bytes in one of FORMATS."""
+    if fmt == "jpeg" and image.mode == "RGBA":
+        # No alpha in JPEG: flatten onto white
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    buffer = io.BytesIO()
+    image.save(buffer, **FORMATS[fmt])
+    return buffer.getvalue()
+
+
+def _render_job(job):
+    """render_image for the pool: returns (results, error) instead of raising."""
+    try:
+        return render_image(*job), None
+    except RENDER_ERRORS as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def render_batch(jobs, processes=None):
+    """
+    Render many images, in a process pool.
+
+    Args:
+        jobs: List of (path, sizes, formats) arguments of render_image
+        processes: Pool size (default: CPU count, 1 renders in this process)
+
+    Yields:
+        tuple: (results, error) per job, in order; results is None when
+        the image could not be rendered
+    """
+    if len(jobs) > 1 and processes != 1:
+        # spawn: the caller may be a threaded server process
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(processes, mp_context=context) as pool:
+            yield from pool.map(_render_job, jobs)
+    else:
+        for job in jobs:
+            yield _render_job(job)
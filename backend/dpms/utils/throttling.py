@@ -0,0 +1,78 @@
+""" Throttling utilities """
+
+# Django REST Framework
+from rest_framework import throttling
+
+# Utilities
+from dpms.utils.cache import CacheNamespace
+
+counters = CacheNamespace("throttle", versioned=False)
+
+
+class SharedRateThrottle(throttling.SimpleRateThrottle):
+    """
+    Rate throttle that counts exactly across workers sharing the cache.
+
+    SimpleRateThrottle keeps a list of request timestamps per client and
+    rewrites it on every request, so concurrent workers overwrite each
+    other's hits. This throttle keeps one atomic counter per client and
+    window instead, and estimates a sliding window by weighting the previous
+    window's count by how much of it still overlaps.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window, elapsed = divmod(self.now, self.duration)
+        current_key = f"{self.key}:{int(window)}"
+        previous_key = f"{self.key}:{int(window) - 1}"
+
+        # Kept two windows: the next one still reads it as previous
+        timeout = self.duration * 2
+        counters.add(current_key, 0, timeout)
+        try:
+            self.count = counters.incr(current_key)
+        except ValueError:
+            # Culled between add() and incr(): start over from this hit,
+            # unless another worker already did
+            if counters.add(current_key, 1, timeout):
+                self.count = 1
+            else:
+                self.count = counters.incr(current_key)
+        self.previous = counters.get(previous_key, 0)
+        self.remaining = 1 - elapsed / self.duration
+
+        if self.previous * self.remaining + self.count > self.num_requests:
+            # Rejected requests do not count
+            try:
+                counters.decr(current_key)
+            except ValueError:
+                pass
+            self.count -= 1
+            return self.throttle_failure()
+        return self.throttle_success()
+
+    def throttle_success(self):
+        return True
+
+    def wait(self):
+        """Seconds until the estimate drops below the limit."""
+        if self.count >= self.num_requests or not self.previous:
+            return self.remaining * self.duration
+        # Solve previous * (remaining - t) + count < num_requests for t
+        overlap = (self.num_requests - self.count) / self.previous
+        return max(self.remaining - overlap, 0) * self.duration
+
+
+class AnonRateThrottle(SharedRateThrottle, throttling.AnonRateThrottle):
+    """Limits anonymous clients by IP (rate: ``anon``)."""
+
+
+class UserRateThrottle(SharedRateThrottle, throttling.UserRateThrottle):
+    """Limits authenticated users by id, anonymous ones by IP (rate: ``user``)."""
@@ -0,0 +1,53 @@
+""" View utilities """
+
+# Utilities
+from contextlib import ExitStack
+
+# Django
+from django.db import connections, transaction
+
+# Django REST Framework
+from rest_framework.permissions import SAFE_METHODS
+
+
+def atomic_request_aliases():
+    """Aliases of the databases configured with ATOMIC_REQUESTS."""
+    return [
+        alias
+        for alias, settings_dict in connections.settings.items()
+        if settings_dict.get("ATOMIC_REQUESTS")
+    ]
+
+
+class AtomicWritesMixin:
+    """
+    Run only the writes of a view in a transaction.
+
+    ATOMIC_REQUESTS wraps every request in BEGIN/COMMIT, including the GET
+    floods on results, StageRunner data and listings, which then hold a
+    connection in a transaction for the whole request. Views using this
+    mixin opt out of ATOMIC_REQUESTS and open the transaction themselves,
+    only for unsafe methods (POST, PUT, PATCH, DELETE), so reads run in
+    autocommit and writes keep the same all-or-nothing behaviour.
+
+    A read that must see a consistent snapshot or writes several rows can
+    still open its own ``transaction.atomic()`` block.
+    """
+
+    @classmethod
+    def as_view(cls, *args, **kwargs):
+        view = super().as_view(*args, **kwargs)
+        for alias in atomic_request_aliases():
+            view = transaction.non_atomic_requests(using=alias)(view)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+
+        # Same blocks ATOMIC_REQUESTS would open: DRF's exception handler
+        # marks them for rollback when the view fails with an API error
+        with ExitStack() as stack:
+            for alias in atomic_request_aliases():
+                stack.enter_context(transaction.atomic(using=alias))
+            return super().dispatch(request, *args, **kwargs)
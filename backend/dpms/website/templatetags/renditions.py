@@ -0,0 +1,20 @@
+"""Template filters for image renditions (see dpms.utils.image_fields)."""
+
+from django import template
+
+register = template.Library()
+
+
+@register.filter
+def rendition(image, spec):
+    """
+    URL of a rendition of an ImageRenditionField image.
+
+    Usage:
+        {{ edition.poster|rendition:"hero" }}        first format of the field
+        {{ edition.poster|rendition:"hero:jpeg" }}   a given format
+    """
+    if not image:
+        return ""
+    size, _, fmt = spec.partition(":")
+    return image.rendition_url(size, fmt or None)
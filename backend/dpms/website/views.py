@@ -1,8 +1,10 @@
+from django.db import transaction
 from django.shortcuts import render
 from django.utils import timezone
 from dpms.compos.models import Attendance, Edition, HasCompo, Sponsor, Production
 
 
+@transaction.non_atomic_requests
 def index(request):
     """
     Landing page principal del sitio.
@@ -97,12 +99,13 @@ def index(request):
             edition=current_edition
         ).count()
 
-    # Get production screenshots for feature card slideshows
-    screenshots = list(
-        Production.objects.exclude(screenshot='').exclude(screenshot__isnull=True)
+    # Get production screenshots for feature card slideshows (resized copies)
+    screenshots = [
+        production.screenshot.rendition_file('card')
+        for production in Production.objects.exclude(screenshot='').exclude(screenshot__isnull=True)
         .order_by('?')
-        .values_list('screenshot', flat=True)[:30]
-    )
+        .only('id', 'screenshot')[:30]
+    ]
 
     # Historical stats for retrospective slide
     all_public_editions = Edition.objects.filter(public=True).order_by('start_date')
@@ -113,11 +116,12 @@ def index(request):
         first = all_public_editions.first()
         if first.start_date:
             first_edition_year = first.start_date.year
-        past_posters = list(
-            all_public_editions.exclude(poster='').exclude(poster__isnull=True)
+        past_posters = [
+            edition.poster
+            for edition in all_public_editions.exclude(poster='').exclude(poster__isnull=True)
             .exclude(pk=current_edition.pk if current_edition else None)
-            .values_list('poster', flat=True)[:6]
-        )
+            .only('id', 'poster')[:6]
+        ]
     productions_count = Production.objects.count()
     years_of_history = None
     if first_edition_year:
@@ -147,6 +151,7 @@ def index(request):
     return render(request, 'website/index.html', context)
 
 
+@transaction.non_atomic_requests
 def editions_list(request):
     """
     List of past editions - requires authentication.
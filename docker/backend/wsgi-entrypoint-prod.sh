@@ -44,7 +44,7 @@ done
 gunicorn config.wsgi:application \
     --bind 0.0.0.0:8000 \
     --workers 4 \
-    --threads 4 \
+    --threads 8 \
     --worker-class gthread \
     --worker-tmp-dir /dev/shm \
     --access-logfile - \
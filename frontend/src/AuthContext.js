@@ -31,8 +31,9 @@ const AuthProvider = ({ children }) => {
       const response = await client.post("/api/users/login/", { email, password });
       console.log(response.data);
 
-      const { access_token, user, groups } = response.data; // Extrae token, user y groups
+      const { access_token, jwt_access_token, user, groups } = response.data; // Extrae token, user y groups
       localStorage.setItem("token", access_token);
+      localStorage.setItem("jwt", jwt_access_token);
       localStorage.setItem("user", JSON.stringify(user));
       localStorage.setItem("groups", JSON.stringify(groups)); // Guarda groups como un array de strings
       setIsAuthenticated(true);
@@ -68,6 +69,7 @@ const AuthProvider = ({ children }) => {
   const logout = () => {
     // Limpia el estado y el localStorage al cerrar sesión
     localStorage.removeItem("token");
+    localStorage.removeItem("jwt");
     localStorage.removeItem("user");
     localStorage.removeItem("groups");
     setIsAuthenticated(false);
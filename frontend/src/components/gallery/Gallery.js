@@ -6,7 +6,6 @@ import {
   Container,
   Grid,
   Card,
-  CardMedia,
   CardContent,
   CardActions,
   Typography,
@@ -47,7 +46,25 @@ import MainBar from "../../@dpms-freemem/MainBar";
 import ThreeBackground from "../common/ThreeBackground";
 import BackgroundToggle from "../common/BackgroundToggle";
 import { AuthContext } from "../../AuthContext";
-import { galleryAPI, editionsAPI } from "../../services/api";
+import { galleryAPI, editionsAPI, fetchAllPages } from "../../services/api";
+
+// Resized copies rendered by the backend: WebP where supported, JPEG otherwise.
+// Until they exist (just uploaded) the original is shown.
+const GalleryPicture = ({ image, src, sizes, style, ...props }) => (
+  <picture>
+    {image.srcset?.webp && (
+      <source type="image/webp" srcSet={image.srcset.webp} sizes={sizes} />
+    )}
+    <img
+      src={src}
+      srcSet={image.srcset?.jpeg || undefined}
+      sizes={image.srcset?.jpeg ? sizes : undefined}
+      alt={image.title || "Gallery image"}
+      style={style}
+      {...props}
+    />
+  </picture>
+);
 
 const Gallery = () => {
   const navigate = useNavigate();
@@ -108,7 +125,9 @@ const Gallery = () => {
         editionsAPI.list().catch(() => ({ data: [] })),
         selectedEdition
           ? galleryAPI.byEdition(selectedEdition).catch(() => ({ data: { images: [] } }))
-          : galleryAPI.list().catch(() => ({ data: [] })),
+          : fetchAllPages(galleryAPI.list)
+              .then((images) => ({ data: images }))
+              .catch(() => ({ data: [] })),
       ]);
 
       setEditions(editionsRes.data || []);
@@ -283,13 +302,13 @@ const Gallery = () => {
         },
       }}
     >
-      <CardMedia
-        component="img"
-        height="200"
-        image={image.image_url || image.thumbnail_url}
-        alt={image.title || "Gallery image"}
+      <GalleryPicture
+        image={image}
+        src={image.thumbnail_url || image.image_url}
+        sizes="(min-width: 1200px) 25vw, (min-width: 900px) 33vw, (min-width: 600px) 50vw, 100vw"
+        loading="lazy"
         onClick={() => handleLightboxOpen(image)}
-        sx={{ objectFit: "cover" }}
+        style={{ display: "block", width: "100%", height: 200, objectFit: "cover" }}
       />
       <CardContent sx={{ pb: 1 }}>
         {image.title && (
@@ -705,9 +724,10 @@ const Gallery = () => {
             >
               <CloseIcon />
             </IconButton>
-            <img
+            <GalleryPicture
+              image={lightboxImage}
               src={lightboxImage.image_url}
-              alt={lightboxImage.title}
+              sizes="90vw"
               style={{
                 maxWidth: "90vw",
                 maxHeight: "85vh",
@@ -171,7 +171,7 @@ const ProductionDetailDialog = ({ open, onClose, productionId, result, showBreak
               <Box sx={{ mb: 2, textAlign: 'center' }}>
                 <Box
                   component="img"
-                  src={production.screenshot_url}
+                  src={production.screenshot_renditions?.card?.webp || production.screenshot_url}
                   alt={production.title}
                   sx={{
                     maxWidth: '100%',
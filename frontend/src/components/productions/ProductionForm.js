@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useCallback, useContext } from 'react';
+import React, { useState, useEffect, useCallback, useContext, useRef } from 'react';
 import {
   Box,
   TextField,
@@ -19,7 +19,7 @@ import {
 import ExpandMoreIcon from '@mui/icons-material/ExpandMore';
 import { useNavigate, useSearchParams, useParams } from 'react-router-dom';
 import { useTranslation } from 'react-i18next';
-import { editionsAPI, productionsAPI } from '../../services/api';
+import { editionsAPI, productionsAPI, uploadResumable } from '../../services/api';
 import { AuthContext } from '../../AuthContext';
 import FileUpload from './FileUpload';
 import MainBar from '../../@dpms-freemem/MainBar';
@@ -143,6 +143,9 @@ const ProductionForm = () => {
   const [compos, setCompos] = useState([]);
   const [existingFiles, setExistingFiles] = useState([]);
   const [loading, setLoading] = useState(false);
+  const [uploadPercent, setUploadPercent] = useState(null);
+  // Files already uploaded, not uploaded again if the submission is retried
+  const uploadedFileIds = useRef(new Map());
   const [loadingData, setLoadingData] = useState(true);
   const [error, setError] = useState(null);
   const [errors, setErrors] = useState({});
@@ -266,9 +269,19 @@ const ProductionForm = () => {
         payload.set('description', description ? `${description}\n\n${contactLine}` : contactLine);
       }
 
+      // New files are uploaded first, in resumable chunks, and attached by id
       for (const file of fileData.newFiles) {
-        payload.append('uploaded_files', file);
+        if (!uploadedFileIds.current.has(file)) {
+          const uploaded = await uploadResumable(
+            file,
+            { target: 'file', title: file.name },
+            (sent, total) => setUploadPercent(Math.round((sent * 100) / total)),
+          );
+          uploadedFileIds.current.set(file, uploaded.id);
+        }
+        payload.append('files', uploadedFileIds.current.get(file));
       }
+      setUploadPercent(null);
       for (const id of fileData.existingFileIds) {
         payload.append('files', id);
       }
@@ -298,6 +311,7 @@ const ProductionForm = () => {
       }
     } finally {
       setLoading(false);
+      setUploadPercent(null);
     }
   };
 
@@ -560,7 +574,9 @@ const ProductionForm = () => {
               color="primary"
               disabled={loading}
             >
-              {loading ? t('Submitting...') : productionId ? t('Update') : t('Submit')}
+              {uploadPercent !== null
+                ? `${t('Uploading...')} ${uploadPercent}%`
+                : loading ? t('Submitting...') : productionId ? t('Update') : t('Submit')}
             </Button>
             <Button
               variant="outlined"
@@ -4,6 +4,7 @@ export {
   useSponsors,
   useEditionInfo,
   useStageControl,
+  watchStageControl,
   useStageRunnerData,
 } from './useStageRunnerData';
 
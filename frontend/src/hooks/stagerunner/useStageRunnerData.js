@@ -1,7 +1,7 @@
 /**
  * Hook for fetching dynamic data for StageRunner elements
  */
-import { useState, useEffect, useCallback, useRef } from 'react';
+import { useState, useEffect, useCallback } from 'react';
 import axiosWrapper from '../../utils/AxiosWrapper';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_ADDRESS || 'http://localhost:8000';
@@ -149,13 +149,64 @@ export const useEditionInfo = (editionId) => {
 };
 
 /**
- * Polls stage control state for synchronization
+ * Long-polls the control state of a config and calls onChange whenever it
+ * changes. The server holds each request until the state differs from the
+ * ETag we send (the quoted command_timestamp of the last state seen) or its
+ * timeout expires with a 304. Returns a function that stops watching.
  */
-export const useStageControl = (configId, pollInterval = 5000) => {
+export const watchStageControl = (configId, onChange, { retryInterval = 5000, onError } = {}) => {
+  const controller = new AbortController();
+  let stopped = false;
+  let etag = null;
+
+  const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+  const loop = async () => {
+    const client = axiosWrapper();
+    while (!stopped) {
+      try {
+        const response = await client.get(`/api/stage-control/watch/?config=${configId}`, {
+          headers: etag ? { 'If-None-Match': etag } : {},
+          signal: controller.signal,
+          timeout: 60000,
+          validateStatus: (status) => status === 200 || status === 304,
+        });
+        if (response.status === 200 && !stopped) {
+          etag = `"${response.data.command_timestamp}"`;
+          onChange(response.data);
+        }
+      } catch (err) {
+        if (stopped) break;
+        if (onError) onError(err);
+        // 503: too many screens waiting on the server, come back when told
+        const retryAfter = Number(err.response?.headers?.['retry-after']);
+        await sleep(retryAfter > 0 ? retryAfter * 1000 : retryInterval);
+      }
+    }
+  };
+
+  loop();
+
+  return () => {
+    stopped = true;
+    controller.abort();
+  };
+};
+
+/**
+ * Hook for real-time stage control state
+ */
+export const useStageControl = (configId, retryInterval = 5000) => {
   const [control, setControl] = useState(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
-  const lastStateRef = useRef(null);
+
+  // Keep the previous object when nothing changed to avoid re-renders
+  const applyControl = useCallback((newControl) => {
+    setControl((current) => (
+      current && current.command_timestamp === newControl.command_timestamp ? current : newControl
+    ));
+  }, []);
 
   const fetchControl = useCallback(async () => {
     if (!configId) return;
@@ -163,31 +214,16 @@ export const useStageControl = (configId, pollInterval = 5000) => {
     try {
       const client = axiosWrapper();
       const response = await client.get(`/api/stage-control/by-config/?config=${configId}`);
-      const newControl = response.data;
-
-      // Check if any relevant state has changed
-      const lastState = lastStateRef.current;
-      const hasChanged = !lastState ||
-        lastState.command_timestamp !== newControl.command_timestamp ||
-        lastState.current_slide_index !== newControl.current_slide_index ||
-        lastState.current_production_index !== newControl.current_production_index ||
-        lastState.revealed_positions !== newControl.revealed_positions ||
-        lastState.is_playing !== newControl.is_playing;
-
-      if (hasChanged) {
-        lastStateRef.current = newControl;
-        setControl(newControl);
-      }
+      applyControl(response.data);
     } catch (err) {
       setError(err.message || 'Error fetching control state');
     }
-  }, [configId]);
+  }, [configId, applyControl]);
 
   // Initial fetch
   useEffect(() => {
     if (!configId) {
       setControl(null);
-      lastStateRef.current = null;
       return;
     }
 
@@ -195,13 +231,15 @@ export const useStageControl = (configId, pollInterval = 5000) => {
     fetchControl().finally(() => setLoading(false));
   }, [configId, fetchControl]);
 
-  // Polling
+  // Live updates
   useEffect(() => {
-    if (!configId || pollInterval <= 0) return;
+    if (!configId || retryInterval <= 0) return;
 
-    const interval = setInterval(fetchControl, pollInterval);
-    return () => clearInterval(interval);
-  }, [configId, pollInterval, fetchControl]);
+    return watchStageControl(configId, applyControl, {
+      retryInterval,
+      onError: (err) => setError(err.message || 'Error fetching control state'),
+    });
+  }, [configId, retryInterval, applyControl]);
 
   return { control, loading, error, refetch: fetchControl };
 };
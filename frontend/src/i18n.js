@@ -106,6 +106,7 @@ const resources = {
       "Time remaining": "Time remaining",
       "voted": "voted",
       "Voting ended": "Voting ended",
+      "Voting closed for this compo": "Voting closed for this compo",
       "Jury voting only": "Jury voting only",
       "Mixed voting (public + jury)": "Mixed voting (public + jury)",
       "Public voting": "Public voting",
@@ -449,6 +450,8 @@ const resources = {
       "Could not load confirmations": "Could not load confirmations",
       "Could not load users": "Could not load users",
       "Failed to load editions": "Failed to load editions",
+      "Export CSV": "Export CSV",
+      "Error exporting CSV": "Error exporting CSV",
       Edition: "Edition",
       "Manage Users": "Manage Users",
       "View Confirmations": "View Confirmations",
@@ -577,6 +580,7 @@ const resources = {
       "Time remaining": "Tiempo restante",
       "voted": "votadas",
       "Voting ended": "Votación finalizada",
+      "Voting closed for this compo": "Votación cerrada para esta compo",
       "Jury voting only": "Solo votación de jurado",
       "Mixed voting (public + jury)": "Votación mixta (público + jurado)",
       "Public voting": "Votación pública",
@@ -920,6 +924,8 @@ const resources = {
       "Could not load confirmations": "No pudimos cargar las confirmaciones",
       "Could not load users": "No pudimos cargar los usuarios",
       "Failed to load editions": "No pudimos cargar las ediciones",
+      "Export CSV": "Exportar CSV",
+      "Error exporting CSV": "Error al exportar el CSV",
       Edition: "Edición",
       "Manage Users": "Gestionar usuarios",
       "View Confirmations": "Ver confirmaciones",
@@ -28,6 +28,7 @@ const VotingPage = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [votingPeriods, setVotingPeriods] = useState([]);
+  const [periodStatus, setPeriodStatus] = useState(null);
   const [selectedEdition, setSelectedEdition] = useState(null);
   const [editions, setEditions] = useState([]);
   const [productions, setProductions] = useState([]);
@@ -69,13 +70,15 @@ const VotingPage = () => {
   const loadEditionData = useCallback(async (editionId) => {
     try {
       setLoading(true);
-      const [prodsRes, votesRes, configRes] = await Promise.all([
+      const [prodsRes, votesRes, configRes, statusRes] = await Promise.all([
         editionsAPI.getProductions(editionId),
         votingAPI.myVotes(editionId),
         votingAPI.getConfig(editionId),
+        votingAPI.periodStatus(editionId),
       ]);
 
       setProductions(prodsRes.data);
+      setPeriodStatus(statusRes.data);
 
       // Index votes by production id
       const votesMap = {};
@@ -172,13 +175,23 @@ const VotingPage = () => {
     return t('Public voting');
   };
 
+  // Compos with voting periods of their own follow them, the rest follow
+  // the edition-wide periods
+  const isCompoOpen = (compoId) => {
+    if (!periodStatus) return true;
+    return (periodStatus.compos[compoId] || periodStatus).is_open;
+  };
+
   // Get remaining time for voting period
   const getTimeRemaining = () => {
-    if (votingPeriods.length === 0) return null;
-    const period = votingPeriods.find((p) => p.edition === selectedEdition);
-    if (!period) return null;
+    let endDate = periodStatus?.closes_at;
+    if (!endDate) {
+      const period = votingPeriods.find((p) => p.edition === selectedEdition);
+      if (!period) return null;
+      endDate = period.end_date;
+    }
 
-    const end = new Date(period.end_date);
+    const end = new Date(endDate);
     const now = new Date();
     const diff = end - now;
 
@@ -271,105 +284,112 @@ const VotingPage = () => {
               <CircularProgress />
             </Box>
           ) : (
-            Object.entries(productionsByCompo).map(([compoName, prods]) => (
-              <Box key={compoName} sx={{ mb: 4 }}>
-                <Typography variant="h6" sx={{ mb: 2, display: 'flex', alignItems: 'center', gap: 1 }}>
-                  {compoName}
-                  <Chip label={`${prods.length}`} size="small" variant="outlined" />
-                </Typography>
-
-                <Grid container spacing={2}>
-                  {prods.map((production) => {
-                    const vote = myVotes[production.id];
-                    const isSaving = saving[production.id];
-
-                    return (
-                      <Grid item xs={12} sm={6} md={4} key={production.id}>
-                        <Card
-                          sx={{
-                            height: '100%',
-                            display: 'flex',
-                            flexDirection: 'column',
-                            borderLeft: vote ? '3px solid' : '3px solid transparent',
-                            borderColor: vote ? 'success.main' : 'transparent',
-                            transition: 'border-color 0.2s',
-                          }}
-                        >
-                          {/* Screenshot */}
-                          {production.screenshot_url && (
-                            <Box
-                              sx={{
-                                height: 160,
-                                backgroundImage: `url(${production.screenshot_url})`,
-                                backgroundSize: 'cover',
-                                backgroundPosition: 'center',
-                                borderBottom: '1px solid',
-                                borderColor: 'divider',
-                              }}
-                            />
-                          )}
-
-                          <CardContent sx={{ flexGrow: 1 }}>
-                            <Typography variant="subtitle1" fontWeight={600} gutterBottom>
-                              {production.title}
-                            </Typography>
-                            <Typography variant="body2" color="text.secondary" gutterBottom>
-                              {production.authors}
-                            </Typography>
-
-                            {production.platform && (
-                              <Chip
-                                label={production.platform}
-                                size="small"
-                                variant="outlined"
-                                sx={{ mb: 1 }}
-                              />
-                            )}
-                          </CardContent>
-
-                          <Divider />
-
-                          {/* Voting area */}
-                          <Box
+            Object.entries(productionsByCompo).map(([compoName, prods]) => {
+              const compoOpen = isCompoOpen(prods[0].compo);
+
+              return (
+                <Box key={compoName} sx={{ mb: 4 }}>
+                  <Typography variant="h6" sx={{ mb: 2, display: 'flex', alignItems: 'center', gap: 1 }}>
+                    {compoName}
+                    <Chip label={`${prods.length}`} size="small" variant="outlined" />
+                    {!compoOpen && (
+                      <Chip label={t('Voting closed for this compo')} size="small" />
+                    )}
+                  </Typography>
+
+                  <Grid container spacing={2}>
+                    {prods.map((production) => {
+                      const vote = myVotes[production.id];
+                      const isSaving = saving[production.id];
+
+                      return (
+                        <Grid item xs={12} sm={6} md={4} key={production.id}>
+                          <Card
                             sx={{
-                              p: 2,
+                              height: '100%',
                               display: 'flex',
                               flexDirection: 'column',
-                              alignItems: 'center',
-                              gap: 1,
-                              bgcolor: vote ? 'rgba(46, 125, 50, 0.08)' : 'transparent',
+                              borderLeft: vote ? '3px solid' : '3px solid transparent',
+                              borderColor: vote ? 'success.main' : 'transparent',
+                              transition: 'border-color 0.2s',
                             }}
                           >
-                            <Typography variant="caption" color="text.secondary">
-                              {vote ? `${t('Your vote')}: ${vote.score}/10` : t('Rate this production')}
-                            </Typography>
-                            <Rating
-                              value={vote ? vote.score / 2 : 0}
-                              max={5}
-                              precision={0.5}
-                              onChange={(e, newValue) => {
-                                if (newValue !== null) {
-                                  handleVote(production.id, Math.round(newValue * 2));
-                                }
-                              }}
-                              disabled={isSaving}
+                            {/* Screenshot */}
+                            {production.screenshot_url && (
+                              <Box
+                                sx={{
+                                  height: 160,
+                                  backgroundImage: `url(${production.screenshot_renditions?.card?.webp || production.screenshot_url})`,
+                                  backgroundSize: 'cover',
+                                  backgroundPosition: 'center',
+                                  borderBottom: '1px solid',
+                                  borderColor: 'divider',
+                                }}
+                              />
+                            )}
+
+                            <CardContent sx={{ flexGrow: 1 }}>
+                              <Typography variant="subtitle1" fontWeight={600} gutterBottom>
+                                {production.title}
+                              </Typography>
+                              <Typography variant="body2" color="text.secondary" gutterBottom>
+                                {production.authors}
+                              </Typography>
+
+                              {production.platform && (
+                                <Chip
+                                  label={production.platform}
+                                  size="small"
+                                  variant="outlined"
+                                  sx={{ mb: 1 }}
+                                />
+                              )}
+                            </CardContent>
+
+                            <Divider />
+
+                            {/* Voting area */}
+                            <Box
                               sx={{
-                                '& .MuiRating-iconFilled': { color: 'primary.main' },
-                                '& .MuiRating-iconHover': { color: 'primary.light' },
-                                fontSize: '2rem',
+                                p: 2,
+                                display: 'flex',
+                                flexDirection: 'column',
+                                alignItems: 'center',
+                                gap: 1,
+                                bgcolor: vote ? 'rgba(46, 125, 50, 0.08)' : 'transparent',
                               }}
-                            />
-                            <Typography variant="caption" color="text.secondary">
-                              {isSaving ? t('Saving...') : '1-10'}
-                            </Typography>
-                          </Box>
-                        </Card>
-                      </Grid>
-                    );
-                  })}
-                </Grid>
-              </Box>
-            ))
+                            >
+                              <Typography variant="caption" color="text.secondary">
+                                {vote ? `${t('Your vote')}: ${vote.score}/10` : t('Rate this production')}
+                              </Typography>
+                              <Rating
+                                value={vote ? vote.score / 2 : 0}
+                                max={5}
+                                precision={0.5}
+                                onChange={(e, newValue) => {
+                                  if (newValue !== null) {
+                                    handleVote(production.id, Math.round(newValue * 2));
+                                  }
+                                }}
+                                disabled={isSaving || !compoOpen}
+                                sx={{
+                                  '& .MuiRating-iconFilled': { color: 'primary.main' },
+                                  '& .MuiRating-iconHover': { color: 'primary.light' },
+                                  fontSize: '2rem',
+                                }}
+                              />
+                              <Typography variant="caption" color="text.secondary">
+                                {isSaving ? t('Saving...') : '1-10'}
+                              </Typography>
+                            </Box>
+                          </Card>
+                        </Grid>
+                      );
+                    })}
+                  </Grid>
+                </Box>
+              );
+            })
           )}
 
           {Object.keys(productionsByCompo).length === 0 && !loading && (
@@ -24,6 +24,7 @@ import { useTranslation } from 'react-i18next';
 import AdminLayout from '../../components/admin/AdminLayout';
 import StatsCard from '../../components/admin/common/StatsCard';
 import axiosWrapper from '../../utils/AxiosWrapper';
+import { ALL_PAGES } from '../../services/api';
 
 const AdminDashboard = () => {
   const { t } = useTranslation();
@@ -49,8 +50,8 @@ const AdminDashboard = () => {
       // Fetch basic stats - only use endpoints that exist
       const [editionsRes, productionsRes, votesRes, usersRes] = await Promise.all([
         client.get('/api/editions/').catch(() => ({ data: [] })),
-        client.get('/api/productions/').catch(() => ({ data: [] })),
-        client.get('/api/votes/').catch(() => ({ data: [] })),
+        client.get('/api/productions/', { params: ALL_PAGES }).catch(() => ({ data: [] })),
+        client.get('/api/votes/', { params: ALL_PAGES }).catch(() => ({ data: [] })),
         client.get('/api/users/admin-list/').catch(() => ({ data: {} })),
       ]);
 
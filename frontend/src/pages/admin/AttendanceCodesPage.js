@@ -28,10 +28,12 @@ import {
 import {
   Add as AddIcon,
   Download as DownloadIcon,
+  Print as PrintIcon,
   CheckCircle as UsedIcon,
 } from '@mui/icons-material';
 import AdminLayout from '../../components/admin/AdminLayout';
 import axiosWrapper from '../../utils/AxiosWrapper';
+import { ALL_PAGES, downloadExport, downloadWhenReady } from '../../services/api';
 
 const AttendanceCodesPage = () => {
   const [codes, setCodes] = useState([]);
@@ -41,6 +43,7 @@ const AttendanceCodesPage = () => {
   const [success, setSuccess] = useState(null);
   const [generateDialog, setGenerateDialog] = useState(false);
   const [generating, setGenerating] = useState(false);
+  const [printing, setPrinting] = useState(false);
   const [filterEdition, setFilterEdition] = useState('');
   const [filterStatus, setFilterStatus] = useState('');
   const [page, setPage] = useState(0);
@@ -60,7 +63,7 @@ const AttendanceCodesPage = () => {
       setLoading(true);
       const client = axiosWrapper();
       const [codesRes, editionsRes] = await Promise.all([
-        client.get('/api/attendance-codes/'),
+        client.get('/api/attendance-codes/', { params: ALL_PAGES }),
         client.get('/api/editions/'),
       ]);
       setCodes(codesRes.data);
@@ -79,7 +82,12 @@ const AttendanceCodesPage = () => {
       setGenerating(true);
       setError(null);
       const client = axiosWrapper();
-      await client.post('/api/attendance-codes/generate/', generateForm);
+      // Large batches take a few seconds to insert
+      await client.post(
+        '/api/attendance-codes/generate/',
+        { edition_id: generateForm.edition, quantity: generateForm.count },
+        { timeout: 120000 }
+      );
       setSuccess(`${generateForm.count} códigos generados exitosamente`);
       await fetchData();
       setGenerateDialog(false);
@@ -94,28 +102,41 @@ const AttendanceCodesPage = () => {
 
   const handleExport = async () => {
     try {
-      const client = axiosWrapper();
-      const params = new URLSearchParams();
-      if (filterEdition) params.append('edition', filterEdition);
-      if (filterStatus) params.append('used', filterStatus === 'used');
-
-      const response = await client.get(`/api/attendance-codes/export/?${params.toString()}`, {
-        responseType: 'blob',
-      });
+      const params = {};
+      if (filterEdition) params.edition = filterEdition;
+      if (filterStatus) params.used = filterStatus === 'used';
 
-      const url = window.URL.createObjectURL(new Blob([response.data]));
-      const link = document.createElement('a');
-      link.href = url;
-      link.setAttribute('download', `attendance_codes_${new Date().toISOString()}.csv`);
-      document.body.appendChild(link);
-      link.click();
-      link.remove();
+      await downloadExport(
+        '/api/attendance-codes/export/',
+        params,
+        `attendance_codes_${new Date().toISOString()}.csv`
+      );
     } catch (err) {
       console.error('Error exporting codes:', err);
       setError('Error al exportar códigos');
     }
   };
 
+  const handlePrintSheets = async () => {
+    if (!filterEdition) {
+      setError('Selecciona una edición para imprimir sus códigos');
+      return;
+    }
+    try {
+      setPrinting(true);
+      await downloadWhenReady(
+        '/api/attendance-codes/sheets/',
+        { edition: filterEdition },
+        `attendance_codes_edition_${filterEdition}.pdf`
+      );
+    } catch (err) {
+      console.error('Error printing codes:', err);
+      setError('Error al generar las hojas de códigos');
+    } finally {
+      setPrinting(false);
+    }
+  };
+
   const handleChangePage = (event, newPage) => {
     setPage(newPage);
   };
@@ -220,6 +241,14 @@ const AttendanceCodesPage = () => {
             >
               Exportar CSV
             </Button>
+            <Button
+              variant="outlined"
+              startIcon={printing ? <CircularProgress size={20} /> : <PrintIcon />}
+              onClick={handlePrintSheets}
+              disabled={printing}
+            >
+              Imprimir QR
+            </Button>
             <Button
               variant="contained"
               startIcon={<AddIcon />}
@@ -393,8 +422,8 @@ const AttendanceCodesPage = () => {
                 onChange={(e) =>
                   setGenerateForm({ ...generateForm, count: parseInt(e.target.value, 10) || 1 })
                 }
-                inputProps={{ min: 1, max: 1000 }}
-                helperText="Máximo 1000 códigos por generación"
+                inputProps={{ min: 1, max: 50000 }}
+                helperText="Máximo 50000 códigos por generación"
               />
             </Grid>
           </Grid>
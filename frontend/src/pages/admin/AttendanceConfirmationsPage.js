@@ -2,6 +2,7 @@ import React, { useEffect, useMemo, useState } from 'react';
 import {
   Alert,
   Box,
+  Button,
   Chip,
   FormControl,
   InputLabel,
@@ -17,10 +18,11 @@ import {
   TextField,
   Tooltip,
 } from '@mui/material';
+import { Download as DownloadIcon } from '@mui/icons-material';
 import { useTranslation } from 'react-i18next';
 import AdminLayout from '../../components/admin/AdminLayout';
 import { LoadingSpinner } from '../../components/admin/common';
-import { attendanceAPI, editionsAPI } from '../../services/api';
+import { attendanceAPI, downloadExport, editionsAPI } from '../../services/api';
 
 const AttendanceConfirmationsPage = () => {
   const { t, i18n } = useTranslation();
@@ -67,6 +69,17 @@ const AttendanceConfirmationsPage = () => {
     return () => { cancelled = true; };
   }, [selectedEdition, t]);
 
+  const handleExport = () => {
+    downloadExport(
+      '/api/attendances/export/',
+      { edition: selectedEdition },
+      `attendance_edition_${selectedEdition}.csv`
+    ).catch((err) => {
+      console.error(err);
+      setError(t('Error exporting CSV'));
+    });
+  };
+
   const locale = i18n.language || 'es';
   const formatDays = (days) => {
     if (!Array.isArray(days) || days.length === 0) return '—';
@@ -125,6 +138,14 @@ const AttendanceConfirmationsPage = () => {
           color="primary"
           variant="outlined"
         />
+        <Button
+          variant="outlined"
+          startIcon={<DownloadIcon />}
+          onClick={handleExport}
+          disabled={!selectedEdition}
+        >
+          {t('Export CSV')}
+        </Button>
       </Box>
 
       {loading ? (
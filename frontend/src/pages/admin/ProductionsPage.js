@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import {
   Box,
+  Button,
   Paper,
   Typography,
   IconButton,
@@ -23,6 +24,7 @@ import {
 } from '@mui/material';
 import {
   Delete as DeleteIcon,
+  Download as DownloadIcon,
   Search as SearchIcon,
   Visibility as ViewIcon,
 } from '@mui/icons-material';
@@ -32,6 +34,7 @@ import AdminLayout from '../../components/admin/AdminLayout';
 import { ConfirmDialog, LoadingSpinner, StatusChip } from '../../components/admin/common';
 import { formatDate } from '../../utils/dateFormatting';
 import axiosWrapper from '../../utils/AxiosWrapper';
+import { ALL_PAGES, downloadExport } from '../../services/api';
 
 const ProductionsPage = () => {
   const { t } = useTranslation();
@@ -59,7 +62,7 @@ const ProductionsPage = () => {
       setLoading(true);
       const client = axiosWrapper();
       const [productionsRes, editionsRes, composRes] = await Promise.all([
-        client.get('/api/productions/'),
+        client.get('/api/productions/', { params: ALL_PAGES }),
         client.get('/api/editions/'),
         client.get('/api/compos/'),
       ]);
@@ -87,6 +90,19 @@ const ProductionsPage = () => {
     }
   };
 
+  const handleExport = async () => {
+    try {
+      const params = {};
+      if (filterEdition) params.edition = filterEdition;
+      if (filterCompo) params.compo = filterCompo;
+      if (filterStatus) params.status = filterStatus;
+      await downloadExport('/api/productions/export/', params, `productions_${new Date().toISOString()}.csv`);
+    } catch (err) {
+      console.error('Error exporting productions:', err);
+      setError(t('Error exporting CSV'));
+    }
+  };
+
   const handleChangePage = (event, newPage) => {
     setPage(newPage);
   };
@@ -198,6 +214,11 @@ const ProductionsPage = () => {
             </FormControl>
           </Grid>
         </Grid>
+        <Box sx={{ display: 'flex', justifyContent: 'flex-end', mt: 2 }}>
+          <Button variant="outlined" startIcon={<DownloadIcon />} onClick={handleExport}>
+            {t("Export CSV")}
+          </Button>
+        </Box>
       </Box>
 
       <Paper>
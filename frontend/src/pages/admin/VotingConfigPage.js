@@ -31,10 +31,12 @@ import {
   Add as AddIcon,
   Edit as EditIcon,
   Delete as DeleteIcon,
+  Download as DownloadIcon,
 } from '@mui/icons-material';
 import AdminLayout from '../../components/admin/AdminLayout';
 import ConfirmDialog from '../../components/admin/common/ConfirmDialog';
 import axiosWrapper from '../../utils/AxiosWrapper';
+import { downloadExport } from '../../services/api';
 
 const VotingConfigPage = () => {
   const [configs, setConfigs] = useState([]);
@@ -128,6 +130,19 @@ const VotingConfigPage = () => {
     }
   };
 
+  const handleExportVotes = async (config) => {
+    try {
+      await downloadExport(
+        '/api/votes/export/',
+        { edition: config.edition },
+        `votes_edition_${config.edition}.csv`
+      );
+    } catch (err) {
+      console.error('Error exporting votes:', err);
+      setError('Error al exportar los votos');
+    }
+  };
+
   const handleDelete = async () => {
     try {
       const client = axiosWrapper();
@@ -245,6 +260,13 @@ const VotingConfigPage = () => {
                       />
                     </TableCell>
                     <TableCell align="right">
+                      <IconButton
+                        size="small"
+                        onClick={() => handleExportVotes(config)}
+                        title="Exportar votos (CSV)"
+                      >
+                        <DownloadIcon fontSize="small" />
+                      </IconButton>
                       <IconButton
                         size="small"
                         onClick={() => handleOpenForm(config)}
@@ -42,6 +42,7 @@ import {
 
 import AdminLayout from '../../../components/admin/AdminLayout';
 import axiosWrapper from '../../../utils/AxiosWrapper';
+import { watchStageControl } from '../../../hooks/stagerunner';
 
 const LiveControlPage = () => {
   const { t } = useTranslation();
@@ -126,22 +127,12 @@ const LiveControlPage = () => {
     fetchCompoData();
   }, [currentSlide?.has_compo, currentSlide?.slide_type]);
 
-  // Poll for control state updates
+  // Follow control state updates (including commands sent from elsewhere)
   useEffect(() => {
     if (!configId) return;
 
-    const pollControl = async () => {
-      try {
-        const client = axiosWrapper();
-        const response = await client.get(`/api/stage-control/by-config/?config=${configId}`);
-        setControl(response.data);
-      } catch (err) {
-        // Silent fail for polling
-      }
-    };
-
-    const interval = setInterval(pollControl, 2000);
-    return () => clearInterval(interval);
+    // Silent fail: watchStageControl retries on its own
+    return watchStageControl(configId, setControl, { retryInterval: 2000 });
   }, [configId]);
 
   // Send command to API
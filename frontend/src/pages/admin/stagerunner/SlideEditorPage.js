@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useNavigate, useParams, useSearchParams } from 'react-router-dom';
 import { useTranslation } from 'react-i18next';
 import {
@@ -50,6 +50,7 @@ import { Rnd } from 'react-rnd';
 import { HexColorPicker } from 'react-colorful';
 
 import axiosWrapper from '../../../utils/AxiosWrapper';
+import { uploadResumable } from '../../../services/api';
 import ThreeBackground from '../../../components/common/ThreeBackground';
 import WebGL2Background from '../../../components/common/WebGL2Background';
 import { ClockRenderer, CountdownRenderer, SponsorBarRenderer, ScrollingTextRenderer } from '../../../components/stagerunner/renderers';
@@ -58,6 +59,10 @@ import { getVideoEmbedUrl, isVideoUrl } from '../../../utils/videoUtils';
 const CANVAS_WIDTH = 1920;
 const CANVAS_HEIGHT = 1080;
 
+// Video conversion polling: every 2s for at most 10 minutes
+const CONVERSION_POLL_INTERVAL = 2000;
+const CONVERSION_MAX_POLLS = 300;
+
 const slideTypeOptions = [
   { value: 'custom', label: 'Custom Layout' },
   { value: 'idle', label: 'Idle/Waiting' },
@@ -142,6 +147,7 @@ const SlideEditorPage = () => {
   const [selectedCompoId, setSelectedCompoId] = useState(null);
   const [selectedProduction, setSelectedProduction] = useState(null);
   const [sponsors, setSponsors] = useState([]);
+  const conversionPoll = useRef(null);
 
   const updateSlide = (updates) => {
     setSlide(prev => ({ ...prev, ...updates }));
@@ -163,6 +169,51 @@ const SlideEditorPage = () => {
     return () => window.removeEventListener('beforeunload', handleBeforeUnload);
   }, [hasUnsavedChanges]);
 
+  // Stop polling video conversions when leaving the editor
+  useEffect(() => () => conversionPoll.current?.abort(), []);
+
+  // Follow the conversion of the videos of a slide until every job is finished
+  const pollConversion = async (sid) => {
+    setUploadProgress({ element: t('Converting video...'), percent: -1 });
+    conversionPoll.current?.abort();
+    const controller = new AbortController();
+    conversionPoll.current = controller;
+    const { signal } = controller;
+    const pollClient = axiosWrapper();
+    // The transcode worker reports each job's progress; converted videos
+    // replace the uploads once every job of the slide is finished
+    let finished = false;
+    for (let i = 0; i < CONVERSION_MAX_POLLS && !signal.aborted; i++) {
+      await new Promise(r => setTimeout(r, CONVERSION_POLL_INTERVAL));
+      if (signal.aborted) break;
+      try {
+        const res = await pollClient.get(`/api/transcode-jobs/?slide=${sid}`, { signal });
+        const pending = res.data.filter(job => job.status === 'queued' || job.status === 'running');
+        if (pending.length === 0) {
+          const reloadResponse = await pollClient.get(`/api/stage-slides/${sid}/`, { signal });
+          setSlide(reloadResponse.data);
+          setElements(reloadResponse.data.elements || []);
+          const failed = res.data.filter(job => job.status === 'failed');
+          if (failed.length > 0) {
+            setError(`${t('Video conversion failed')}: ${failed[0].error}`);
+          }
+          finished = true;
+          break;
+        }
+        const percent = Math.round(res.data.reduce((sum, job) => sum + job.progress, 0) / res.data.length);
+        setUploadProgress({ element: t('Converting video...'), percent });
+      } catch {
+        finished = true;
+        break;
+      }
+    }
+    if (signal.aborted) return;
+    if (!finished) {
+      setError(t('The video is still queued for conversion. It will play once the conversion worker processes it; reload the slide later.'));
+    }
+    setUploadProgress(null);
+  };
+
   // Calculate canvas scale based on container
   useEffect(() => {
     const updateScale = () => {
@@ -187,6 +238,14 @@ const SlideEditorPage = () => {
         setSlide(response.data);
         setElements(response.data.elements || []);
         setLoading(false);
+        // Keep following conversions still running (e.g. right after saving a new slide)
+        client.get(`/api/transcode-jobs/?slide=${id}`)
+          .then(res => {
+            if (res.data.some(job => job.status === 'queued' || job.status === 'running')) {
+              pollConversion(id);
+            }
+          })
+          .catch(() => {});
         // Load productions and sponsors for the edition
         if (response.data.config_edition) {
           fetchProductions(response.data.config_edition);
@@ -228,7 +287,7 @@ const SlideEditorPage = () => {
   const fetchProductions = async (editionId) => {
     try {
       const client = axiosWrapper();
-      const response = await client.get(`/api/productions/?edition=${editionId}`);
+      const response = await client.get(`/api/productions/?edition=${editionId}&page_size=all`);
       const prods = response.data.results || response.data || [];
       setProductions(prods);
       // Extract unique compos
@@ -296,7 +355,6 @@ const SlideEditorPage = () => {
             }
           });
           if (_imageFile) formData.append('image', _imageFile);
-          if (_videoFile) formData.append('video', _videoFile);
 
           const uploadConfig = {
             timeout: 600000,
@@ -305,11 +363,20 @@ const SlideEditorPage = () => {
               setUploadProgress({ element: element.name, percent });
             },
           };
+          let saved;
           if (element.id && !_isNew) {
-            await client.put(`/api/slide-elements/${element.id}/`, formData, uploadConfig);
+            saved = await client.put(`/api/slide-elements/${element.id}/`, formData, uploadConfig);
           } else {
             formData.delete('id');
-            await client.post('/api/slide-elements/', formData, uploadConfig);
+            saved = await client.post('/api/slide-elements/', formData, uploadConfig);
+          }
+          // Videos go in resumable chunks once the element exists
+          if (_videoFile) {
+            await uploadResumable(
+              _videoFile,
+              { target: 'video', slide_element: saved.data.id },
+              (sent, total) => setUploadProgress({ element: element.name, percent: Math.round((sent * 100) / total) }),
+            );
           }
           setUploadProgress(null);
         } else {
@@ -348,41 +415,9 @@ const SlideEditorPage = () => {
 
       setSaving(false);
 
-      if (hasVideoUploads) {
-        // Poll for video conversion completion
-        setUploadProgress({ element: t('Converting video...'), percent: -1 });
-        const pollConversion = async () => {
-          const pollClient = axiosWrapper();
-          const sid = isNew ? slideId : id;
-          for (let i = 0; i < 120; i++) { // Max 10 minutes (120 * 5s)
-            await new Promise(r => setTimeout(r, 5000));
-            try {
-              const res = await pollClient.get(`/api/stage-slides/${sid}/`);
-              const videoElements = res.data.elements?.filter(el => el.element_type === 'video' && el.video) || [];
-              // Try to probe if videos are playable
-              const allReady = await Promise.all(videoElements.map(el => {
-                return new Promise(resolve => {
-                  const video = document.createElement('video');
-                  video.preload = 'metadata';
-                  video.onloadedmetadata = () => { video.remove(); resolve(true); };
-                  video.onerror = () => { video.remove(); resolve(false); };
-                  video.src = el.video.startsWith('http') ? el.video : `${process.env.REACT_APP_BACKEND_ADDRESS || 'http://localhost:8000'}${el.video}`;
-                  setTimeout(() => { video.remove(); resolve(false); }, 10000);
-                });
-              }));
-              if (allReady.every(Boolean) || videoElements.length === 0) {
-                // Reload with converted videos
-                setSlide(res.data);
-                setElements(res.data.elements || []);
-                setUploadProgress(null);
-                return;
-              }
-              setUploadProgress({ element: t('Converting video...'), percent: Math.min(95, Math.round((i / 120) * 100)) });
-            } catch { break; }
-          }
-          setUploadProgress(null);
-        };
-        pollConversion();
+      if (hasVideoUploads && !isNew) {
+        // A new slide resumes polling once its edit page has loaded
+        pollConversion(id);
       }
 
       return;
@@ -218,7 +218,7 @@ const StageRunnerViewer = () => {
     const editionId = config?.edition;
     if (!compoId || !editionId) return;
     const client = axiosWrapper();
-    client.get(`/api/productions/?edition=${editionId}&compo=${compoId}`).then(res => {
+    client.get(`/api/productions/?edition=${editionId}&compo=${compoId}&page_size=500`).then(res => {
       setCompoProductions(res.data.results || res.data || []);
     }).catch(() => {});
   }, [activeProduction, activeProduction?.id, activeProduction?.compo, config?.edition, productionCount]);
@@ -546,7 +546,7 @@ const StageRunnerViewer = () => {
         if (!element.image) return null;
         return (
           <img
-            src={resolveMediaUrl(element.image)}
+            src={resolveMediaUrl(element.image_renditions?.stage?.webp || element.image)}
             alt={element.name}
             style={{
               maxWidth: '100%',
@@ -766,7 +766,7 @@ const StageRunnerViewer = () => {
           sx={{
             position: 'absolute',
             inset: 0,
-            backgroundImage: `url(${currentSlide.background_image})`,
+            backgroundImage: `url(${currentSlide.background_image_renditions?.stage?.webp || currentSlide.background_image})`,
             backgroundSize: 'cover',
             backgroundPosition: 'center',
             zIndex: 1,
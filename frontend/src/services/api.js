@@ -1,15 +1,59 @@
-import axiosWrapper from '../utils/AxiosWrapper';
+import axiosWrapper, { authorizationHeader } from '../utils/AxiosWrapper';
 
 // Get axios instance with token
 const getAxios = () => {
   const client = axiosWrapper();
-  const token = localStorage.getItem('token');
-  if (token) {
-    client.defaults.headers.common['Authorization'] = `Token ${token}`;
+  const authorization = authorizationHeader();
+  if (authorization) {
+    client.defaults.headers.common['Authorization'] = authorization;
   }
   return client;
 };
 
+// List endpoints are cursor-paginated: they return { next, previous, results }.
+// Admin screens that need every row pass ALL_PAGES as params.
+export const ALL_PAGES = { page_size: 'all' };
+
+// Follow the `next` links of a paginated list and return every item
+export const fetchAllPages = async (request) => {
+  const items = [];
+  let response = await request({ page_size: 500 });
+  for (;;) {
+    items.push(...response.data.results);
+    if (!response.data.next) return items;
+    response = await getAxios().get(response.data.next);
+  }
+};
+
+// Download a CSV export. The backend streams it, so there is no timeout.
+const saveBlob = (data, type, filename) => {
+  const url = window.URL.createObjectURL(new Blob([data], { type }));
+  const link = document.createElement('a');
+  link.href = url;
+  link.setAttribute('download', filename);
+  document.body.appendChild(link);
+  link.click();
+  link.remove();
+  window.URL.revokeObjectURL(url);
+};
+
+export const downloadExport = async (path, params, filename) => {
+  const response = await getAxios().get(path, { params, responseType: 'blob', timeout: 0 });
+  saveBlob(response.data, 'text/csv', filename);
+};
+
+// Files rendered in the background: the server answers 202 until they are ready
+export const downloadWhenReady = async (path, params, filename, interval = 3000) => {
+  for (;;) {
+    const response = await getAxios().get(path, { params, responseType: 'blob', timeout: 0 });
+    if (response.status !== 202) {
+      saveBlob(response.data, response.headers['content-type'], filename);
+      return;
+    }
+    await new Promise((resolve) => setTimeout(resolve, interval));
+  }
+};
+
 // Editions API
 export const editionsAPI = {
   list: (params) => getAxios().get('/api/editions/', { params }),
@@ -52,6 +96,91 @@ export const filesAPI = {
   download: (id) => getAxios().get(`/api/files/${id}/download/`, { responseType: 'blob' }),
 };
 
+// Resumable uploads API (chunks are raw bytes with their offset and checksum)
+export const uploadsAPI = {
+  create: (data) => getAxios().post('/api/uploads/', data),
+  get: (id) => getAxios().get(`/api/uploads/${id}/`),
+  sendChunk: (id, offset, chunk, checksum, config) => getAxios().patch(`/api/uploads/${id}/`, chunk, {
+    timeout: 120000,
+    ...config,
+    headers: {
+      'Content-Type': 'application/offset+octet-stream',
+      'Upload-Offset': offset,
+      'Upload-Checksum': checksum,
+    },
+  }),
+  // Moving the file into place (and hashing it) takes a while for large files
+  finalize: (id) => getAxios().post(`/api/uploads/${id}/finalize/`, null, { timeout: 0 }),
+  abort: (id) => getAxios().delete(`/api/uploads/${id}/`),
+};
+
+const CHUNK_RETRIES = 5;
+
+const sha256Base64 = async (buffer) => {
+  const digest = new Uint8Array(await crypto.subtle.digest('SHA-256', buffer));
+  return btoa(String.fromCharCode(...digest));
+};
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// Upload a file in chunks, resuming after failed chunks and page reloads: the
+// session is remembered per file until it is finalized. `fields` has the
+// target ('file' or 'video') and its fields (title, public, slide_element).
+// Resolves with the created File, or the SlideElement of a video.
+export const uploadResumable = async (file, fields, onProgress) => {
+  const key = `upload:${fields.target}:${fields.slide_element || ''}:${file.name}:${file.size}:${file.lastModified}`;
+  let session = null;
+  const savedId = localStorage.getItem(key);
+  if (savedId) {
+    try {
+      session = (await uploadsAPI.get(savedId)).data;
+    } catch (err) {
+      session = null;
+    }
+  }
+  if (!session || session.status !== 'uploading') {
+    session = (await uploadsAPI.create({ ...fields, filename: file.name, size: file.size })).data;
+    localStorage.setItem(key, session.id);
+  }
+
+  let offset = session.offset;
+  let failures = 0;
+  while (offset === null || offset < file.size) {
+    try {
+      if (offset === null) {
+        // Unknown after a failed chunk: ask the server where to resume
+        offset = (await uploadsAPI.get(session.id)).data.offset;
+        continue;
+      }
+      const chunk = await file.slice(offset, offset + session.chunk_size).arrayBuffer();
+      const checksum = `sha256 ${await sha256Base64(chunk)}`;
+      const start = offset;
+      const response = await uploadsAPI.sendChunk(session.id, offset, chunk, checksum, {
+        onUploadProgress: (event) => onProgress?.(start + event.loaded, file.size),
+      });
+      offset = response.data.offset;
+      failures = 0;
+    } catch (err) {
+      const status = err.response?.status;
+      if (status === 409) {
+        // Already received (a retried chunk): continue from the server's offset
+        offset = err.response.data.offset;
+        continue;
+      }
+      if (status && status !== 460 && status < 500) throw err;
+      failures += 1;
+      if (failures > CHUNK_RETRIES) throw err;
+      offset = null;
+      await sleep(2000 * failures);
+    }
+  }
+  onProgress?.(file.size, file.size);
+
+  const result = (await uploadsAPI.finalize(session.id)).data;
+  localStorage.removeItem(key);
+  return result;
+};
+
 // HasCompos API
 export const hasComposAPI = {
   list: (params) => getAxios().get('/api/hascompos/', { params }),
@@ -88,9 +217,11 @@ export const sponsorsAPI = {
 export const votingAPI = {
   myVotes: (editionId) => getAxios().get('/api/votes/my_votes/', { params: { edition: editionId } }),
   vote: (data) => getAxios().post('/api/votes/', data),
+  voteBatch: (votes) => getAxios().post('/api/votes/batch/', votes),
   updateVote: (id, data) => getAxios().patch(`/api/votes/${id}/`, data),
   deleteVote: (id) => getAxios().delete(`/api/votes/${id}/`),
   currentPeriods: () => getAxios().get('/api/voting-periods/current/'),
+  periodStatus: (editionId) => getAxios().get('/api/voting-periods/status/', { params: { edition: editionId } }),
   getConfig: (editionId) => getAxios().get('/api/voting-config/', { params: { edition: editionId } }),
 };
 
@@ -99,18 +230,25 @@ export const votingResultsAPI = {
   editionResults: (editionId) => getAxios().get('/api/voting-results/edition_results/', { params: { edition: editionId } }),
 };
 
+// Check-in API (QR passes scanned at the door)
+export const checkinAPI = {
+  myPass: (editionId) => getAxios().get('/api/attendee-verification/checkin_pass/', { params: { edition: editionId } }),
+  // scans: [{ payload, scanned_at }], one live or many from an offline scanner
+  scan: (editionId, scans) => getAxios().post('/api/attendee-verification/checkin/', { edition: editionId, scans }),
+};
+
 // Attendance API (RSVP)
 export const attendanceAPI = {
   mine: (editionId) => getAxios().get('/api/attendances/me/', { params: { edition: editionId } }),
   save: (data) => getAxios().post('/api/attendances/', data),
   remove: (id) => getAxios().delete(`/api/attendances/${id}/`),
-  adminList: (editionId) => getAxios().get('/api/attendances/', { params: { edition: editionId } }),
+  adminList: (editionId) => getAxios().get('/api/attendances/', { params: { edition: editionId, ...ALL_PAGES } }),
   count: (editionId) => getAxios().get('/api/attendances/count/', { params: { edition: editionId } }),
 };
 
 // Users API (admin-facing list including attendance flag)
 export const usersAPI = {
   adminList: (editionId) => getAxios().get('/api/users/admin-list/', {
-    params: editionId ? { edition: editionId } : {},
+    params: editionId ? { edition: editionId, ...ALL_PAGES } : ALL_PAGES,
   }),
 };
@@ -1,9 +1,17 @@
 import axios from "axios";
 import axiosRetry from "axios-retry";
 
+// Prefer the stateless JWT (no database lookup on the server), fall back to the token
+export const authorizationHeader = () => {
+  const jwt = localStorage.getItem("jwt");
+  if (jwt) return `Bearer ${jwt}`;
+  const token = localStorage.getItem("token");
+  return token ? `Token ${token}` : null;
+};
+
 const axiosWrapper = () => {
   const baseURL = process.env.REACT_APP_BACKEND_ADDRESS || "http://localhost:8000";
-  const token = localStorage.getItem("token");
+  const authorization = authorizationHeader();
 
   // Detect current language from i18next or browser
   const lang = localStorage.getItem("i18nextLng") || navigator.language || "es";
@@ -14,8 +22,8 @@ const axiosWrapper = () => {
   };
 
   // Add authorization token if available
-  if (token) {
-    headers["Authorization"] = `Token ${token}`;
+  if (authorization) {
+    headers["Authorization"] = authorization;
   }
 
   const client = axios.create({
@@ -39,6 +47,7 @@ const axiosWrapper = () => {
       if (error.response && error.response.status === 401) {
         // Token is invalid or expired - clear it
         localStorage.removeItem("token");
+        localStorage.removeItem("jwt");
         localStorage.removeItem("user");
         localStorage.removeItem("groups");
         // Redirect to frontend home